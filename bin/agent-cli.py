@@ -9,11 +9,14 @@ Usage:
     ./bin/agent-cli.py run -a design -t "Design a REST API"
     ./bin/agent-cli.py run -a code -t "Implement module" -c design.md -o main.py
     ./bin/agent-cli.py run -a test -t "Write tests" -c main.py -o test_main.py
+    ./bin/agent-cli.py run-parallel -a design -t "Design API" -a test -t "Plan tests" -o out/
+    ./bin/agent-cli.py pipeline --plan plan.json
     ./bin/agent-cli.py list-agents
     ./bin/agent-cli.py show-memory -a design
     ./bin/agent-cli.py clear-memory -a design --all
     ./bin/agent-cli.py summarize-repo --url https://github.com/user/repo --task-id task-001
     ./bin/agent-cli.py read-files -r ~/.openclaw/artifacts/task-001/repo -f "src/api.py,tests/test_api.py"
+    ./bin/agent-cli.py --version
 
 Agents:
     design  - System Architect: API design, data models, specifications
@@ -23,64 +26,282 @@ Agents:
     github  - GitHub Integration: Repo analysis, issues, PRs
 
 Memory System:
-    Each agent stores lessons learned in memory/YYYY-MM-DD.md files.
+    Each agent stores lessons learned in memory/YYYY-MM-DD.jsonl files (one JSON
+    record per task; older YYYY-MM-DD.md day files are still read).
     Memories are automatically loaded when running tasks and updated after completion.
+    The lesson is requested in the task prompt itself (---LESSON--- markers), so
+    reflection normally costs no extra LLM call.
+
+OpenClaw Daemon (optional):
+    Set CLAWCREW_OPENCLAW_DAEMON=1 to send LLM calls to a long-running openclaw
+    process listening on ~/.openclaw/agent.sock instead of spawning one per call.
+    If the socket is missing, CLAWCREW_OPENCLAW_DAEMON_CMD is used to start it.
 
 More info: https://github.com/lanxindeng8/clawcrew
 """
 
+import os
+import sys
+from pathlib import Path
+
+__version__ = "0.3.0"
+
+# Top-level help, kept in sync with the commands below by hand. Rendering it
+# through typer means importing click and rich (~150ms) just to print it.
+_USAGE = """Usage: agent-cli.py [OPTIONS] COMMAND [ARGS]...
+
+  ClawCrew Agent CLI - Run specialized AI agents
+
+Options:
+  -V, --version   Show version and exit
+  -h, --help      Show this message and exit.
+
+Commands:
+  run             Run a specialized agent with a task.
+  run-parallel    Run several independent agent tasks concurrently.
+  pipeline        Run a DAG of agent steps, with independent steps running
+                  concurrently.
+  list-agents     List available agents and their workspace status.
+  show-memory     Show recent memories for an agent.
+  clear-memory    Clear memories for an agent.
+  read-issue      Read a GitHub issue and format it for agent context.
+  list-issues     List GitHub issues from a repository.
+  create-pr       Create a GitHub Pull Request.
+  list-prs        List GitHub Pull Requests from a repository.
+  read-pr         Read a GitHub Pull Request and format it for agent context.
+  summarize-repo  Summarize a GitHub repository or local directory.
+  read-files      Read specific files from a repository and format for agent
+                  context.
+
+Run 'agent-cli.py COMMAND --help' for a command's options."""
+
+# Project root (parent of bin/)
+BASE_DIR = Path(__file__).parent.parent
+
+# Agent name → workspace directory mapping
+# To add a new agent, just add a line here and create the workspace folder
+AGENT_WORKSPACES = {
+    "orca": "workspace-orca",
+    "design": "workspace-design",
+    "code": "workspace-code",
+    "test": "workspace-test",
+    # "github" agent removed — repo analysis handled by "design" agent
+}
+
+
+def _entry_names(directory: Path) -> set:
+    """Names of the entries in a directory (empty if it doesn't exist)."""
+    try:
+        with os.scandir(directory) as it:
+            return {entry.name for entry in it}
+    except OSError:
+        return set()
+
+
+def _print_agent_table():
+    """Print the list-agents table (needs nothing beyond os and pathlib)."""
+    print("Available agents:\n")
+    print("  Agent       Workspace              Status")
+    print("  " + "-" * 50)
+    # One directory listing per location instead of two stats per agent
+    dev_names = _entry_names(BASE_DIR)
+    installed_names = _entry_names(Path.home() / ".openclaw")
+    for agent, ws_name in AGENT_WORKSPACES.items():
+        if ws_name in dev_names:
+            status = "✓ (dev)"
+        elif ws_name in installed_names:
+            status = "✓ (installed)"
+        else:
+            status = "✗ not found"
+        print(f"  {agent:10}  {ws_name:20}  {status}")
+
+
+# `--version`, top-level `--help` and a bare `list-agents` are answered
+# before typer (and everything else) is imported
+if __name__ == "__main__":
+    if sys.argv[1:] in (["--version"], ["-V"]):
+        print(f"agent-cli {__version__}")
+        sys.exit(0)
+    if sys.argv[1:] in (["--help"], ["-h"]):
+        print(_USAGE)
+        sys.exit(0)
+    if sys.argv[1:] == ["list-agents"]:
+        _print_agent_table()
+        sys.exit(0)
+
+# The remaining imports follow the fast path on purpose (E402 is ignored for
+# this file in pyproject.toml)
 import typer
+import atexit
+import functools
+import hashlib
+import importlib
+import importlib.util
+import itertools
 import json
-import uuid
+import struct
+import time
 import subprocess
 import shutil
 import tempfile
-from pathlib import Path
+import threading
 from datetime import datetime, timedelta
-from typing import Optional
-
-# GitHub utilities (separated for clarity)
-from github_utils import (
-    parse_github_url,
-    clone_repository,
-    find_key_files,
-    build_repo_context,
-    get_github_token,
-)
+from types import MappingProxyType
+from typing import TYPE_CHECKING, List, Optional
+
+from typer.core import TyperGroup
+
+# asyncio, socket and shlex are imported where used: only run-parallel and
+# the opt-in daemon need them, and typer does not load them at start-up.
+# (subprocess, shutil and tempfile stay here - click imports them anyway.)
+if TYPE_CHECKING:
+    import asyncio
+    import socket
+
+
+def _lazy_import(name: str):
+    """
+    Import a module lazily with importlib.util.LazyLoader.
+
+    The module object is registered right away, but its code only runs on
+    the first attribute access.
+    """
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+# GitHub utilities (bin/github_utils.py, separated for clarity). Only loaded
+# once a command touches them, so --help, list-agents and the memory
+# commands never execute the module.
+github_utils = _lazy_import("github_utils")
+
+# Lazily loaded modules in bin/commands/ import shared helpers from here
+sys.modules.setdefault("agent_cli", sys.modules[__name__])
+
+# Commands whose code lives in bin/commands/: "name" -> "module:typer_app".
+# The module is imported only when its command is invoked (or help lists it).
+LAZY_COMMANDS = {
+    "summarize-repo": "commands.summarize_repo:app",
+    "read-files": "commands.read_files:app",
+}
+
+
+class LazyGroup(TyperGroup):
+    """Command group that imports LAZY_COMMANDS modules on first use."""
+
+    def list_commands(self, ctx) -> List[str]:
+        names = super().list_commands(ctx)
+        return names + [name for name in LAZY_COMMANDS if name not in names]
+
+    def get_command(self, ctx, cmd_name: str):
+        if cmd_name in LAZY_COMMANDS and cmd_name not in self.commands:
+            module_name, attr = LAZY_COMMANDS[cmd_name].split(":")
+            module = importlib.import_module(module_name)
+            self.add_command(typer.main.get_command(getattr(module, attr)), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
 
 # Enable -h as help shortcut
 app = typer.Typer(
+    cls=LazyGroup,
     add_completion=False,
     help="ClawCrew Agent CLI - Run specialized AI agents",
     context_settings={"help_option_names": ["-h", "--help"]},
 )
 
+
+def _version_callback(value: bool):
+    if value:
+        typer.echo(f"agent-cli {__version__}")
+        raise typer.Exit()
+
+
+@app.callback()
+def main(
+    version: Optional[bool] = typer.Option(
+        None, "--version", "-V", callback=_version_callback, is_eager=True,
+        help="Show version and exit",
+    ),
+):
+    pass
+
+
 # =============================================================================
 # Configuration
 # =============================================================================
 
-# Project root (parent of bin/)
-BASE_DIR = Path(__file__).parent.parent
+# BASE_DIR and AGENT_WORKSPACES are defined at the top of the file, ahead of
+# the start-up fast paths that use them.
 
-# Agent name → workspace directory mapping
-# To add a new agent, just add a line here and create the workspace folder
-AGENT_WORKSPACES = {
-    "orca": "workspace-orca",
-    "design": "workspace-design",
-    "code": "workspace-code",
-    "test": "workspace-test",
-    # "github" agent removed — repo analysis handled by "design" agent
-}
+# Agent name -> (dev path, installed path), joined once at import. Only the
+# isdir() checks that pick one are deferred (see _resolve_workspace).
+WORKSPACE_CANDIDATES = MappingProxyType({
+    agent: (BASE_DIR / ws_name, Path.home() / ".openclaw" / ws_name)
+    for agent, ws_name in AGENT_WORKSPACES.items()
+})
+
+# OpenClaw agent daemon (opt-in): one long-running openclaw process serves all
+# LLM calls over a Unix socket, so interpreter and config start-up is paid once.
+OPENCLAW_DAEMON_ENABLED = os.environ.get("CLAWCREW_OPENCLAW_DAEMON") == "1"
+OPENCLAW_SOCKET = Path.home() / ".openclaw" / "agent.sock"
+OPENCLAW_DAEMON_START_TIMEOUT = 30  # seconds to wait for a freshly started daemon
+
+# Messages are passed as `--message <text>` unless they would hit Linux's
+# MAX_ARG_STRLEN (128KB per argv string); larger ones are piped on stdin
+# with `--stdin`. CLAWCREW_OPENCLAW_STDIN=1 pipes every message.
+OPENCLAW_MAX_ARGV_MESSAGE = 128 * 1024 - 1
+OPENCLAW_STDIN_ALWAYS = os.environ.get("CLAWCREW_OPENCLAW_STDIN") == "1"
+
+# Seconds openclaw gets to exit after SIGTERM (timeout or early stop) before
+# it is sent SIGKILL
+OPENCLAW_KILL_GRACE = 5
+
+# Content-addressed LLM response cache: <dir>/<agent>/<sha256(agent, message)>.txt.
+# Entries older than CLAWCREW_LLM_CACHE_TTL seconds (default 7 days) are ignored.
+LLM_CACHE_DIR = Path.home() / ".openclaw" / "llm-cache"
+LLM_CACHE_TTL = int(os.environ.get("CLAWCREW_LLM_CACHE_TTL", 7 * 24 * 3600))
+
+# Response cache lookups this process, reported by --verbose
+llm_cache_stats = {"hits": 0, "misses": 0}
+
+DEFAULT_MODEL = "anthropic/claude-sonnet-4-5"
 
 # =============================================================================
 # Helper Functions
 # =============================================================================
 
+@functools.lru_cache(maxsize=8)
+def _resolve_workspace(agent_name: str) -> Path:
+    """
+    Resolve an agent's workspace directory, stat-ing candidates once per process.
+
+    Failures raise and are therefore not cached.
+    """
+    try:
+        dev_path, installed_path = WORKSPACE_CANDIDATES[agent_name]
+    except KeyError:
+        available = ", ".join(AGENT_WORKSPACES.keys())
+        raise typer.BadParameter(f"Unknown agent: {agent_name}. Available: {available}")
+
+    # Check dev mode first, then installed mode: a single isdir() stat each
+    if os.path.isdir(dev_path):
+        return dev_path
+    if os.path.isdir(installed_path):
+        return installed_path
+    raise typer.BadParameter(f"Workspace not found: {installed_path}")
+
+
 def get_workspace(agent_name: str) -> Path:
     """
     Get workspace path for an agent.
 
     Checks BASE_DIR first (dev mode), then ~/.openclaw (installed mode).
+    The result is cached for the life of the process.
 
     Args:
         agent_name: Name of the agent (design, code, test, orca)
@@ -91,19 +312,11 @@ def get_workspace(agent_name: str) -> Path:
     Raises:
         typer.BadParameter: If agent unknown or workspace not found
     """
-    if agent_name not in AGENT_WORKSPACES:
-        available = ", ".join(AGENT_WORKSPACES.keys())
-        raise typer.BadParameter(f"Unknown agent: {agent_name}. Available: {available}")
-
-    # Check dev mode first, then installed mode
-    ws_path = BASE_DIR / AGENT_WORKSPACES[agent_name]
-    if not ws_path.exists():
-        ws_path = Path.home() / ".openclaw" / AGENT_WORKSPACES[agent_name]
+    return _resolve_workspace(agent_name)
 
-    if not ws_path.exists():
-        raise typer.BadParameter(f"Workspace not found: {ws_path}")
 
-    return ws_path
+# SOUL.md path -> (st_mtime_ns, contents)
+_soul_cache: dict = {}
 
 
 def load_soul(ws: Path) -> str:
@@ -111,7 +324,8 @@ def load_soul(ws: Path) -> str:
     Load SOUL.md from workspace.
 
     SOUL.md defines the agent's personality, responsibilities, and output format.
-    Creates a default SOUL if not exists.
+    Creates a default SOUL if not exists. Contents are cached per process,
+    keyed by the file's mtime.
 
     Args:
         ws: Workspace path
@@ -120,57 +334,202 @@ def load_soul(ws: Path) -> str:
         Content of SOUL.md
     """
     soul_path = ws / "SOUL.md"
-    if soul_path.exists():
-        return soul_path.read_text(encoding="utf-8")
+    try:
+        mtime_ns = soul_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        # Create default SOUL if not exists
+        default_soul = f"# {ws.name}\n\nYou are a helpful specialist agent."
+        soul_path.write_text(default_soul, encoding="utf-8")
+        return default_soul
 
-    # Create default SOUL if not exists
-    default_soul = f"# {ws.name}\n\nYou are a helpful specialist agent."
-    soul_path.write_text(default_soul, encoding="utf-8")
-    return default_soul
+    # Only re-read the file when its mtime has changed
+    cached = _soul_cache.get(soul_path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    soul = soul_path.read_bytes().decode("utf-8")  # no newline translation pass
+    _soul_cache[soul_path] = (mtime_ns, soul)
+    return soul
 
 
-def load_memory(ws: Path, days: int = 7) -> str:
+def load_memory(ws: Path, days: int = 7, now: Optional[datetime] = None) -> str:
     """
-    Load recent memories from memory/YYYY-MM-DD.md files.
+    Load recent memories from memory/YYYY-MM-DD.jsonl files.
 
     Memories contain lessons learned from past tasks, helping agents improve over time.
+    Day files written before the JSONL format (YYYY-MM-DD.md) are still read.
+    Results are cached per process, keyed by the memory directory's mtime.
 
     Args:
         ws: Workspace path
         days: Number of days to look back
+        now: Time the window ends at (defaults to datetime.now()); pass the
+            command's start time so loading and saving agree on "today"
 
     Returns:
         Combined memory content as markdown string
     """
     memory_dir = ws / "memory"
-    if not memory_dir.exists():
+    try:
+        dir_mtime_ns = memory_dir.stat().st_mtime_ns
+    except FileNotFoundError:
         return ""
 
-    memories = []
-    today = datetime.now().date()
+    today = (now or datetime.now()).date()
+    return _load_memory_cached(str(memory_dir), days, today, dir_mtime_ns)
 
-    for i in range(days):
-        date = today - timedelta(days=i)
-        date_str = date.strftime("%Y-%m-%d")
-        memory_file = memory_dir / f"{date_str}.md"
 
-        if memory_file.exists():
-            content = memory_file.read_text(encoding="utf-8").strip()
-            if content:
-                memories.append(f"## {date_str}\n{content}")
+def _read_memory_records(path: str) -> list:
+    """Parse a JSONL memory file, skipping blank or malformed lines."""
+    try:
+        from orjson import loads  # optional, faster
+    except ImportError:
+        loads = json.loads
+
+    records = []
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                records.append(loads(line))
+            except ValueError:
+                continue
+    return records
+
+
+def render_memory_as_markdown(records: list) -> str:
+    """
+    Render memory records as the markdown that is sent to agents.
+
+    Uses the same layout as the legacy .md day files, so prompts look the
+    same whichever format a day was stored in.
+    """
+    return "".join(
+        f"""
+### {record.get('ts', '')} - {record.get('task_id', '')}
+
+**Task:** {record.get('task', '')}
+
+**Output:** {record.get('output') or 'stdout'}
 
+**Lesson:** {record.get('lesson', '')}
+
+---
+"""
+        for record in records
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _load_memory_cached(memory_dir: str, days: int, today, dir_mtime_ns: int) -> str:
+    """
+    Read and combine the memory files for load_memory.
+
+    `today` and `dir_mtime_ns` are only part of the cache key: the window moves
+    at midnight and the directory mtime changes when day files are added or
+    removed. Appends to an existing file don't touch the directory mtime, so
+    save_memory clears this cache explicitly.
+    """
+    # One directory read instead of a stat per day in the window
+    try:
+        with os.scandir(memory_dir) as it:
+            existing = {entry.name: entry.path for entry in it if entry.is_file()}
+    except FileNotFoundError:
+        return ""
+
+    day_files = []  # (date, legacy .md path, .jsonl path)
+    for i in range(days):
+        date_str = (today - timedelta(days=i)).isoformat()  # same as %Y-%m-%d, without strftime
+        md_path = existing.get(f"{date_str}.md")
+        jsonl_path = existing.get(f"{date_str}.jsonl")
+        if md_path or jsonl_path:
+            day_files.append((date_str, md_path, jsonl_path))
+
+    def _read_day(day: tuple) -> str:
+        _, md_path, jsonl_path = day
+        text = ""
+        if md_path:
+            with open(md_path, "rb") as f:
+                text = f.read().decode("utf-8")
+        if jsonl_path:
+            text += render_memory_as_markdown(_read_memory_records(jsonl_path))
+        return text.strip()
+
+    if len(day_files) > 1:
+        # Overlap the reads (they serialize on cold caches and network mounts)
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(8, len(day_files))) as pool:
+            contents = list(pool.map(_read_day, day_files))
+    else:
+        contents = [_read_day(day) for day in day_files]
+
+    memories = [
+        f"## {date_str}\n{content}"
+        for (date_str, _, _), content in zip(day_files, contents)
+        if content
+    ]
     return "\n\n".join(memories) if memories else ""
 
 
-def save_memory(ws: Path, task_id: str, task: str, output_file: Optional[str], lesson: str):
+# Append-mode fds for memory files, kept open for the life of the process
+_memory_fd_cache: dict = {}
+_memory_fd_lock = threading.Lock()
+
+
+def _memory_fd(memory_file: Path) -> int:
+    """Return a cached O_APPEND fd for a memory file, opening it on first use."""
+    key = str(memory_file)
+    with _memory_fd_lock:
+        fd = _memory_fd_cache.get(key)
+        if fd is None:
+            memory_file.parent.mkdir(exist_ok=True)
+            fd = os.open(key, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            _memory_fd_cache[key] = fd
+        return fd
+
+
+@atexit.register
+def _close_memory_fds():
+    """Close the memory fds opened by save_memory."""
+    with _memory_fd_lock:
+        for fd in _memory_fd_cache.values():
+            os.close(fd)
+        _memory_fd_cache.clear()
+
+
+def new_task_id(now: Optional[datetime] = None) -> str:
+    """
+    Generate a task ID: `YYYYmmdd-HHMMSS-<8 hex chars>`.
+
+    The suffix is 4 random bytes straight from os.urandom, rather than a
+    uuid4 built and then cut down to the same 8 hex digits.
+
+    Args:
+        now: Timestamp to use (defaults to the current time), so a command
+            can share one clock reading between its task ID and memory entry
+
+    Returns:
+        Task ID
+    """
+    if now is None:
+        now = datetime.now()
+    return f"{now:%Y%m%d-%H%M%S}-{os.urandom(4).hex()}"
+
+
+def save_memory(
+    ws: Path,
+    task_id: str,
+    task: str,
+    output_file: Optional[str],
+    lesson: str,
+    now: Optional[datetime] = None,
+):
     """
     Append a memory entry to today's memory file.
 
-    Memory format:
-        ### HH:MM:SS - task_id
-        **Task:** ...
-        **Output:** ...
-        **Lesson:** ...
+    Memory format (memory/YYYY-MM-DD.jsonl, one JSON object per line):
+        {"ts": "HH:MM:SS", "task_id": ..., "task": ..., "output": ..., "lesson": ...}
 
     Args:
         ws: Workspace path
@@ -178,31 +537,197 @@ def save_memory(ws: Path, task_id: str, task: str, output_file: Optional[str], l
         task: Task description
         output_file: Output file path (or None)
         lesson: Lesson learned from this task
+        now: Timestamp for the entry (defaults to the current time)
     """
-    memory_dir = ws / "memory"
-    memory_dir.mkdir(exist_ok=True)
+    if now is None:
+        now = datetime.now()
+    today = now.date().isoformat()
+    memory_file = ws / "memory" / f"{today}.jsonl"
+
+    record = {
+        "ts": now.time().isoformat(timespec="seconds"),
+        "task_id": task_id,
+        "task": task[:200],
+        "output": output_file,
+        "lesson": lesson,
+    }
+    try:
+        from orjson import dumps  # optional, faster; encodes straight to UTF-8 bytes
+    except ImportError:
+        entry = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+    else:
+        entry = dumps(record) + b"\n"
 
-    today = datetime.now().strftime("%Y-%m-%d")
-    memory_file = memory_dir / f"{today}.md"
-    timestamp = datetime.now().strftime("%H:%M:%S")
+    # Single O_APPEND write: no per-call open/close, and atomic w.r.t. other writers
+    os.write(_memory_fd(memory_file), entry)
 
-    entry = f"""
-### {timestamp} - {task_id}
+    # Appending doesn't change the directory mtime the load cache is keyed on
+    _load_memory_cached.cache_clear()
 
-**Task:** {task[:200]}
 
-**Output:** {output_file or 'stdout'}
+class LLMError(Exception):
+    """Error calling the LLM from an async task."""
+    pass
 
-**Lesson:** {lesson}
 
----
-"""
+@functools.lru_cache(maxsize=None)
+def _resolve_executable(name: str) -> str:
+    """
+    Resolve a command to its absolute path on PATH.
+
+    subprocess only takes the posix_spawn fast path (vfork-based in glibc)
+    when the executable is given as a path, so resolve it once per process.
+    Falls back to the bare name, which lets subprocess raise FileNotFoundError.
+    """
+    return shutil.which(name) or name
+
+
+def _get_client() -> "Optional[socket.socket]":
+    """
+    Connect to the openclaw agent daemon, starting it if needed.
+
+    When the socket does not exist yet, the daemon is launched from
+    CLAWCREW_OPENCLAW_DAEMON_CMD in its own session (so it outlives this CLI)
+    and we wait for the socket to appear.
+
+    Returns:
+        Connected socket, or None if the daemon is disabled or unreachable
+    """
+    if not OPENCLAW_DAEMON_ENABLED:
+        return None
+
+    import shlex
+    import socket
+
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+
+    if not OPENCLAW_SOCKET.exists():
+        launch_cmd = os.environ.get("CLAWCREW_OPENCLAW_DAEMON_CMD")
+        if not launch_cmd:
+            return None
+        try:
+            subprocess.Popen(
+                shlex.split(launch_cmd),
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+        except OSError:
+            return None
+
+        deadline = time.monotonic() + OPENCLAW_DAEMON_START_TIMEOUT
+        while not OPENCLAW_SOCKET.exists():
+            if time.monotonic() > deadline:
+                return None
+            time.sleep(0.1)
+
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(str(OPENCLAW_SOCKET))
+    except OSError:
+        client.close()
+        return None
+    return client
+
+
+def _recv_exact(client: "socket.socket", size: int) -> bytes:
+    """Read exactly `size` bytes from the daemon socket."""
+    buf = bytearray()
+    while len(buf) < size:
+        chunk = client.recv(size - len(buf))
+        if not chunk:
+            raise ConnectionError("openclaw daemon closed the connection")
+        buf.extend(chunk)
+    return bytes(buf)
+
+
+def _call_daemon(client: "socket.socket", message: str, agent_name: str, timeout: int) -> str:
+    """
+    Send one agent request to the openclaw daemon.
+
+    Protocol: a single JSON line `{"agent", "local", "message"}` is sent; the
+    reply is a 4-byte big-endian length followed by a JSON object holding
+    either `output` or `error`.
+    """
+    request = json.dumps({"agent": agent_name, "local": True, "message": message})
+    try:
+        with client:
+            client.settimeout(timeout)
+            client.sendall(request.encode("utf-8") + b"\n")
+            (length,) = struct.unpack("!I", _recv_exact(client, 4))
+            reply = json.loads(_recv_exact(client, length))
+    except TimeoutError:  # socket.timeout
+        typer.echo("Error: LLM call timed out", err=True)
+        raise typer.Exit(1)
+    except (OSError, ValueError) as e:
+        typer.echo(f"Error calling LLM via openclaw daemon: {e}", err=True)
+        raise typer.Exit(1)
+
+    if reply.get("error"):
+        typer.echo(f"Error calling LLM: {reply['error']}", err=True)
+        raise typer.Exit(1)
+
+    return reply.get("output", "").strip()
+
+
+def _openclaw_command(message: str, agent_name: str) -> tuple:
+    """
+    Build the `openclaw agent` argv for a message.
+
+    Returns:
+        Tuple of (argv, stdin_data); stdin_data is None when the message
+        travels in argv
+    """
+    cmd = [_resolve_executable("openclaw"), "agent", "--agent", agent_name, "--local"]
+    # UTF-8 needs at most 4 bytes per character, so short messages skip the
+    # encode (a full copy of the prompt) used to measure their size
+    if not OPENCLAW_STDIN_ALWAYS and len(message) * 4 <= OPENCLAW_MAX_ARGV_MESSAGE:
+        return cmd + ["--message", message], None
+    data = message.encode("utf-8")
+    if OPENCLAW_STDIN_ALWAYS or len(data) > OPENCLAW_MAX_ARGV_MESSAGE:
+        return cmd + ["--stdin"], data
+    return cmd + ["--message", message], None
+
+
+def _llm_cache_path(message: str, agent_name: str) -> Path:
+    """Cache file for a response, addressed by agent and message content."""
+    key = hashlib.sha256(f"{agent_name}\0{message}".encode("utf-8")).hexdigest()
+    return LLM_CACHE_DIR / agent_name / f"{key}.txt"
+
+
+def _llm_cache_get(cache_path: Path) -> Optional[str]:
+    """Return a cached response, or None if it is missing or past the TTL."""
+    try:
+        if time.time() - cache_path.stat().st_mtime > LLM_CACHE_TTL:
+            response = None
+        else:
+            response = cache_path.read_bytes().decode("utf-8")
+    except OSError:
+        response = None
+    llm_cache_stats["misses" if response is None else "hits"] += 1
+    return response
+
+
+def _llm_cache_put(cache_path: Path, response: str):
+    """Store a response in the cache (atomically, so readers never see a partial file)."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    github_utils.atomic_write(cache_path, response)
 
-    with open(memory_file, "a", encoding="utf-8") as f:
-        f.write(entry)
 
+def llm_cache_summary() -> str:
+    """Describe this process's response cache hits and misses, for --verbose."""
+    return f"LLM cache: {llm_cache_stats['hits']} hit(s), {llm_cache_stats['misses']} miss(es)"
 
-def call_llm(message: str, agent_name: str = "main") -> str:
+
+def call_llm(
+    message: str,
+    agent_name: str = "main",
+    stop_marker: Optional[str] = None,
+    use_cache: bool = False,
+    refresh_cache: bool = False,
+) -> str:
     """
     Call LLM via OpenClaw agent command.
 
@@ -211,187 +736,1055 @@ def call_llm(message: str, agent_name: str = "main") -> str:
     - Uses the configured Anthropic OAuth
     - Returns the agent's response
 
+    When CLAWCREW_OPENCLAW_DAEMON=1, the request goes to the openclaw daemon
+    instead; the subprocess path is used if the daemon cannot be reached.
+    Messages too large for argv are piped on stdin (see _openclaw_command).
+
+    stdout is streamed line by line rather than buffered by communicate().
+    When stop_marker is given, openclaw is terminated as soon as a line
+    containing it arrives, since nothing after it would be used.
+
+    With use_cache, identical (agent, message) pairs are answered from
+    ~/.openclaw/llm-cache without spawning openclaw (see LLM_CACHE_TTL).
+    refresh_cache always calls openclaw but still stores the new response.
+
     Args:
         message: The message/task to send
         agent_name: OpenClaw agent ID (orca, design, code, test, or main)
+        stop_marker: Optional marker that ends the response early
+        use_cache: Read and write the content-addressed response cache
+        refresh_cache: Only write the cache, replacing any existing entry
+
+    Returns:
+        LLM response content
+
+    Raises:
+        typer.Exit: On subprocess errors
+    """
+    cache_path = None
+    if use_cache or refresh_cache:
+        cache_path = _llm_cache_path(message, agent_name)
+    if use_cache and not refresh_cache:
+        cached = _llm_cache_get(cache_path)
+        if cached is not None:
+            return cached
+
+    response = _call_openclaw(message, agent_name, stop_marker)
+
+    if cache_path is not None:
+        _llm_cache_put(cache_path, response)
+
+    return response
+
+
+def _terminate(proc: subprocess.Popen):
+    """Stop openclaw: SIGTERM, then SIGKILL if it outlives OPENCLAW_KILL_GRACE."""
+    proc.terminate()
+    try:
+        proc.wait(timeout=OPENCLAW_KILL_GRACE)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+
+
+def _call_openclaw(message: str, agent_name: str, stop_marker: Optional[str]) -> str:
+    """Uncached body of call_llm: one request via the daemon or an openclaw process."""
+    client = _get_client()
+    if client is not None:
+        return _call_daemon(client, message, agent_name, timeout=300)
+
+    cmd, stdin_data = _openclaw_command(message, agent_name)
+    try:
+        # Absolute executable + close_fds=False keeps subprocess on posix_spawn
+        # (our own fds are non-inheritable by default, PEP 446)
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE if stdin_data is not None else None,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            close_fds=False,
+        )
+    except FileNotFoundError:
+        typer.echo("Error: openclaw command not found. Please install OpenClaw first.", err=True)
+        raise typer.Exit(1)
+
+    # stdin and stderr are serviced off-thread so neither pipe can fill up
+    # and stall openclaw while we block on stdout
+    stderr_chunks: List[bytes] = []
+    helpers = [
+        threading.Thread(target=lambda: stderr_chunks.append(proc.stderr.read()), daemon=True)
+    ]
+    if stdin_data is not None:
+        def _feed():
+            try:
+                proc.stdin.write(stdin_data)
+                proc.stdin.close()
+            except OSError:  # openclaw exited without reading it all
+                pass
+        helpers.append(threading.Thread(target=_feed, daemon=True))
+    for helper in helpers:
+        helper.start()
+
+    timed_out = threading.Event()
+
+    def _expire():
+        timed_out.set()
+        _terminate(proc)
+
+    watchdog = threading.Timer(300, _expire)
+    watchdog.start()
+
+    stop = stop_marker.encode("utf-8") if stop_marker else None
+    lines: List[bytes] = []
+    stopped_early = False
+    try:
+        for line in proc.stdout:
+            lines.append(line)
+            if stop is not None and stop in line:
+                stopped_early = True
+                break
+        if stopped_early:
+            _terminate(proc)
+        proc.wait()
+    finally:
+        watchdog.cancel()
+        proc.stdout.close()
+        for helper in helpers:
+            helper.join()
+        proc.stderr.close()
+
+    if timed_out.is_set():
+        received = sum(len(line) for line in lines)
+        typer.echo(f"Error: LLM call timed out ({received} bytes of output received)", err=True)
+        raise typer.Exit(1)
+
+    if proc.returncode != 0 and not stopped_early:
+        stderr = b"".join(stderr_chunks).decode("utf-8", errors="replace")
+        typer.echo(f"Error calling LLM: {stderr}", err=True)
+        raise typer.Exit(1)
+
+    return b"".join(lines).decode("utf-8", errors="replace").strip()
+
+
+async def _aterminate(proc: "asyncio.subprocess.Process"):
+    """asyncio counterpart of _terminate: SIGTERM, then SIGKILL after the grace period."""
+    import asyncio
+
+    try:
+        proc.terminate()
+    except ProcessLookupError:  # already exited
+        pass
+    try:
+        await asyncio.wait_for(proc.wait(), OPENCLAW_KILL_GRACE)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+
+
+async def _acall_llm(
+    message: str,
+    agent_name: str = "main",
+    semaphore: "Optional[asyncio.Semaphore]" = None,
+    timeout: int = 300,
+    use_cache: bool = False,
+    stop_marker: Optional[str] = None,
+) -> str:
+    """
+    Async variant of call_llm for running several agents concurrently.
+
+    Spawns `openclaw agent` with asyncio.create_subprocess_exec (or uses the
+    daemon from a worker thread when enabled). An optional semaphore caps how
+    many calls are in flight at once.
+
+    As in call_llm, stdout is read line by line (stdin and stderr are
+    serviced concurrently), and with stop_marker set openclaw is terminated
+    once a line containing the marker has been read.
+
+    Args:
+        message: The message/task to send
+        agent_name: OpenClaw agent ID (orca, design, code, test, or main)
+        semaphore: Concurrency limiter shared by the caller's tasks
+        timeout: Timeout in seconds
+        use_cache: Read and write the response cache, as in call_llm
+        stop_marker: Optional marker that ends the response early
+
+    Returns:
+        LLM response content
+
+    Raises:
+        LLMError: On subprocess errors or timeout
+    """
+    import asyncio
+
+    cache_path = None
+    if use_cache:
+        cache_path = _llm_cache_path(message, agent_name)
+        cached = _llm_cache_get(cache_path)
+        if cached is not None:
+            return cached
+
+    semaphore = semaphore or asyncio.Semaphore(1)
+
+    async with semaphore:
+        client = _get_client()
+        if client is not None:
+            try:
+                return await asyncio.to_thread(_call_daemon, client, message, agent_name, timeout)
+            except typer.Exit:
+                raise LLMError("openclaw daemon call failed")
+
+        cmd, stdin_data = _openclaw_command(message, agent_name)
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=asyncio.subprocess.PIPE if stdin_data is not None else None,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                close_fds=False,
+            )
+        except FileNotFoundError:
+            raise LLMError("openclaw command not found. Please install OpenClaw first.")
+
+        async def _feed():
+            try:
+                proc.stdin.write(stdin_data)
+                await proc.stdin.drain()
+                proc.stdin.close()
+            except (BrokenPipeError, ConnectionResetError):  # openclaw exited early
+                pass
+
+        stop = stop_marker.encode("utf-8") if stop_marker else None
+        lines: List[bytes] = []
+
+        async def _read_until_exit() -> bool:
+            """Collect stdout into `lines`; True if the stop marker ended it."""
+            while True:
+                try:
+                    line = await proc.stdout.readuntil(b"\n")
+                except asyncio.IncompleteReadError as e:  # EOF
+                    if e.partial:
+                        lines.append(e.partial)
+                    break
+                except asyncio.LimitOverrunError as e:
+                    # A line longer than the stream buffer: take what is buffered
+                    lines.append(await proc.stdout.read(e.consumed))
+                    continue
+                lines.append(line)
+                if stop is not None and stop in line:
+                    await _aterminate(proc)
+                    return True
+            await proc.wait()
+            return False
+
+        helpers = [asyncio.ensure_future(proc.stderr.read())]
+        if stdin_data is not None:
+            helpers.append(asyncio.ensure_future(_feed()))
+        try:
+            stopped_early = await asyncio.wait_for(_read_until_exit(), timeout)
+        except asyncio.TimeoutError:
+            await _aterminate(proc)
+            received = sum(len(line) for line in lines)
+            raise LLMError(f"LLM call timed out ({received} bytes of output received)")
+        finally:
+            stderr = (await asyncio.gather(*helpers, return_exceptions=True))[0]
+
+    if proc.returncode != 0 and not stopped_early:
+        if isinstance(stderr, BaseException):
+            stderr = b""
+        raise LLMError(f"LLM call failed: {stderr.decode('utf-8', errors='replace')}")
+
+    response = b"".join(lines).decode("utf-8", errors="replace").strip()
+    if cache_path is not None:
+        _llm_cache_put(cache_path, response)
+    return response
+
+
+def call_llm_batch(prompts: List[tuple], timeout: int = 300) -> list:
+    """
+    Send several prompts to openclaw in one `openclaw agent --batch` run.
+
+    The prompts are written to a JSONL manifest, one
+    `{"id", "agent", "local", "message"}` object per line. openclaw fans them
+    out itself and writes one `{"id", "output"}` or `{"id", "error"}` line per
+    prompt to the --output file. This pays process start-up and auth once
+    for the whole batch instead of once per prompt.
+
+    Args:
+        prompts: (agent_name, message) pairs
+        timeout: Timeout in seconds for the whole batch
+
+    Returns:
+        Responses in prompt order; a prompt openclaw reported an error for
+        (or left out) gets an LLMError instance in its place
+
+    Raises:
+        LLMError: If the batch run itself fails or times out
+    """
+    with tempfile.TemporaryDirectory(prefix="clawcrew-batch-") as tmp:
+        manifest = Path(tmp) / "manifest.jsonl"
+        results_path = Path(tmp) / "manifest.jsonl.out"
+        manifest.write_text(
+            "".join(
+                json.dumps({"id": i, "agent": agent, "local": True, "message": message}) + "\n"
+                for i, (agent, message) in enumerate(prompts)
+            ),
+            encoding="utf-8",
+        )
+
+        cmd = [
+            _resolve_executable("openclaw"), "agent", "--batch", str(manifest),
+            "--output", str(results_path),
+        ]
+        try:
+            result = subprocess.run(cmd, capture_output=True, timeout=timeout, close_fds=False)
+        except subprocess.TimeoutExpired:
+            raise LLMError("LLM batch call timed out")
+        except FileNotFoundError:
+            raise LLMError("openclaw command not found. Please install OpenClaw first.")
+        if result.returncode != 0:
+            stderr = result.stderr.decode("utf-8", errors="replace")
+            raise LLMError(f"LLM batch call failed: {stderr}")
+
+        replies = {}
+        try:
+            with open(results_path, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        reply = json.loads(line)
+                        replies[reply.get("id")] = reply
+        except (OSError, ValueError) as e:
+            raise LLMError(f"Cannot read openclaw batch output: {e}")
+
+    responses = []
+    for i in range(len(prompts)):
+        reply = replies.get(i)
+        if reply is None:
+            responses.append(LLMError("missing from openclaw batch output"))
+        elif reply.get("error"):
+            responses.append(LLMError(f"LLM call failed: {reply['error']}"))
+        else:
+            responses.append(reply.get("output", "").strip())
+    return responses
+
+
+def extract_output(response: str) -> str:
+    """
+    Extract content between ---OUTPUT--- and ---END OUTPUT--- markers.
+
+    If markers not found, returns the full response.
+
+    Args:
+        response: LLM response text
+
+    Returns:
+        Extracted output or full response
+    """
+    # Slice between the first marker pair: no intermediate split() lists
+    start = response.find("---OUTPUT---")
+    if start == -1:
+        return response
+    start += len("---OUTPUT---")
+    end = response.find("---END OUTPUT---", start)
+    if end == -1:
+        return response
+    return response[start:end].strip()
+
+
+def extract_lesson(response: str) -> Optional[str]:
+    """
+    Extract the lesson between ---LESSON--- and ---END LESSON--- markers.
+
+    Args:
+        response: LLM response text
+
+    Returns:
+        Lesson (max 100 chars), or None if the markers are missing or empty
+    """
+    start = response.find("---LESSON---")
+    if start == -1:
+        return None
+    end = response.find("---END LESSON---", start)
+    if end == -1:
+        return None
+    lesson = response[start + len("---LESSON---"):end].strip()
+    return lesson[:100] or None
+
+
+def strip_lesson(response: str) -> str:
+    """Remove the ---LESSON--- block (if any) from an LLM response."""
+    start = response.find("---LESSON---")
+    if start == -1:
+        return response
+    end = response.find("---END LESSON---", start)
+    if end == -1:
+        return response
+    return (response[:start] + response[end + len("---END LESSON---"):]).strip()
+
+
+def build_message(
+    task_id: str,
+    task: str,
+    context_content: str,
+    memory: str,
+    with_output_markers: bool,
+    with_lesson: bool = False,
+) -> str:
+    """
+    Build the task message sent to an agent.
+
+    Args:
+        task_id: Unique task identifier
+        task: Task description
+        context_content: Pre-formatted context section (may be empty)
+        memory: Recent memories (may be empty)
+        with_output_markers: Ask the agent to wrap its deliverable in OUTPUT markers
+        with_lesson: Also ask for a one-sentence lesson in LESSON markers, so
+            reflection needs no second LLM call (see extract_lesson)
+
+    Returns:
+        Message text
+    """
+    output_instruction = ""
+    if with_output_markers:
+        output_instruction = """
+
+## Output Instruction
+Format your final deliverable between these markers:
+---OUTPUT---
+[Your complete output here]
+---END OUTPUT---
+"""
+
+    lesson_instruction = ""
+    if with_lesson:
+        lesson_instruction = """
+## Lesson Instruction
+After your deliverable, summarize the key lesson from this task in ONE
+sentence (max 100 chars) between these markers:
+---LESSON---
+[One-sentence lesson]
+---END LESSON---
+"""
+
+    # One join over the pieces: context and memory are copied once, straight
+    # into the final message, instead of via intermediate formatted strings
+    parts = ["## Task\nTask ID: ", task_id, "\n", task, "\n", context_content, "\n"]
+    if memory:
+        parts += ["\n## Recent Lessons Learned\n", memory, "\n"]
+    parts += ["\n", output_instruction, "\n", lesson_instruction, "\n"]
+    return "".join(parts)
+
+
+def response_stop_marker(with_output_markers: bool, with_lesson: bool) -> Optional[str]:
+    """
+    Marker that closes the last block build_message asks for.
+
+    The LESSON block is requested after the deliverable, so once its end
+    marker (or, without a lesson, the OUTPUT end marker) arrives the rest of
+    the response is not needed and openclaw can be stopped.
+    """
+    if with_lesson:
+        return "---END LESSON---"
+    if with_output_markers:
+        return "---END OUTPUT---"
+    return None
+
+
+def lesson_prompt(task: str, final_output: str) -> str:
+    """Build the fallback reflection prompt, for responses without a LESSON block."""
+    return f"""Briefly summarize the key lesson from this task in ONE sentence (max 100 chars).
+
+Task: {task[:200]}
+Output: {final_output[:200]}..."""
+
+
+async def _reflect(
+    task: str,
+    final_output: str,
+    semaphore: "Optional[asyncio.Semaphore]" = None,
+    use_cache: bool = False,
+) -> str:
+    """
+    Ask the LLM for a one-sentence lesson about a finished task.
+
+    The prompt only sees the first 200 characters of the task and output, so
+    repeated tasks often produce the same prompt; use_cache answers those from
+    the response cache.
+
+    Args:
+        task: Task description
+        final_output: Extracted agent output the lesson is based on
+        semaphore: Concurrency limiter shared with the caller's other calls
+        use_cache: Read and write the response cache
+
+    Returns:
+        Lesson (max 100 chars), or a stock lesson if the call fails
+    """
+    try:
+        lesson = await _acall_llm(
+            lesson_prompt(task, final_output), "main", semaphore, use_cache=use_cache
+        )
+        return lesson.strip()[:100]
+    except LLMError:
+        return "Task completed successfully."
+
+
+# =============================================================================
+# Commands
+# =============================================================================
+
+@app.command()
+def run(
+    agent: str = typer.Option(..., "--agent", "-a", help="Agent name: design, code, test, orca"),
+    task: str = typer.Option(..., "--task", "-t", help="Task description"),
+    output: Optional[str] = typer.Option(None, "--output", "-o", help="Output file path"),
+    context: Optional[str] = typer.Option(None, "--context", "-c", help="Context file to read"),
+    task_id: Optional[str] = typer.Option(None, "--task-id", help="Task ID for tracking"),
+    model: str = typer.Option(DEFAULT_MODEL, "--model", "-m", help="Model to use"),
+    no_memory: bool = typer.Option(False, "--no-memory", help="Skip memory loading/saving"),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Always call the LLM: skip the --task-id and lesson caches"
+    ),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
+):
+    """
+    Run a specialized agent with a task.
+
+    The agent loads its SOUL.md (personality) and recent memories,
+    executes the task, saves output, and updates its memory with lessons learned.
+
+    With an explicit --task-id, the response is cached in the workspace's
+    .cache/ directory, so re-running the same task id with the same task and
+    context (e.g. an orchestrator retry) reuses it instead of calling the LLM.
+    The fallback lesson call, when the response has no LESSON block, goes
+    through the shared LLM response cache. --no-cache turns both off.
+
+    Examples:
+
+        # Design an API
+        ./bin/agent-cli.py run -a design -t "Design REST API for user auth"
+
+        # Implement with context from design
+        ./bin/agent-cli.py run -a code -t "Implement auth" -c design.md -o auth.py
+
+        # Write tests
+        ./bin/agent-cli.py run -a test -t "Write tests" -c auth.py -o test_auth.py
+    """
+    # Only caller-chosen task IDs can repeat, so only those are cached
+    use_cache = bool(task_id) and not no_cache
+
+    # Generate task ID if not provided
+    now = datetime.now()
+    if not task_id:
+        task_id = new_task_id(now)
+
+    ws = get_workspace(agent)
+
+    if verbose:
+        typer.echo(f"[{agent.upper()}] Workspace: {ws}")
+        typer.echo(f"[{agent.upper()}] Task ID: {task_id}")
+        posix_spawn = getattr(subprocess, "_USE_POSIX_SPAWN", False)
+        typer.echo(f"[{agent.upper()}] posix_spawn: {posix_spawn}")
+
+    # Load memory (SOUL is loaded by OpenClaw automatically)
+    memory = "" if no_memory else load_memory(ws, now=now)
+
+    # Load context file if provided
+    context_content = ""
+    if context:
+        context_path = Path(context)
+        if context_path.exists():
+            content = github_utils.read_file_capped(context_path)
+            context_content = f"\n\n## Context File: {context}\n```\n{content}\n```"
+        else:
+            typer.echo(f"Warning: Context file not found: {context}", err=True)
+
+    # Build message (SOUL is handled by OpenClaw, we just send task + context + memory)
+    message = build_message(
+        task_id, task, context_content, memory,
+        with_output_markers=bool(output), with_lesson=not no_memory,
+    )
+
+    cache_file = None
+    response = None
+    if use_cache:
+        key = hashlib.blake2b(
+            f"{agent}|{task_id}|{task}|{context_content}|{bool(output)}".encode("utf-8"),
+            digest_size=16,
+        ).hexdigest()
+        cache_file = ws / ".cache" / f"{key}.md"
+        try:
+            response = cache_file.read_bytes().decode("utf-8")
+        except FileNotFoundError:
+            pass
+
+    from_cache = response is not None
+
+    import asyncio
+
+    async def _execute():
+        nonlocal response
+
+        if from_cache:
+            if verbose:
+                typer.echo(f"[{agent.upper()}] Using cached response: {cache_file}")
+        else:
+            if verbose:
+                typer.echo(f"[{agent.upper()}] Calling OpenClaw agent...")
+
+            # Call LLM via OpenClaw agent
+            try:
+                response = await _acall_llm(
+                    message, agent,
+                    stop_marker=response_stop_marker(bool(output), not no_memory),
+                )
+            except LLMError as e:
+                typer.echo(f"Error: {e}", err=True)
+                raise typer.Exit(1)
+
+            if cache_file is not None:
+                cache_file.parent.mkdir(exist_ok=True)
+                github_utils.atomic_write(cache_file, response)
+
+        lesson = extract_lesson(response)
+        body = strip_lesson(response)
+        final_output = extract_output(body)
+
+        def _emit_output():
+            if output:
+                out_path = Path(output)
+                out_path.parent.mkdir(parents=True, exist_ok=True)
+                github_utils.atomic_write(out_path, final_output)
+                typer.echo(f"[{agent.upper()}] Output saved to: {output}")
+            else:
+                typer.echo(body)
+
+        # Auto-reflection: the lesson normally comes back in the main response.
+        # A cached response already had its lesson recorded on the first run.
+        if no_memory or from_cache:
+            _emit_output()
+            return
+
+        if lesson is None:
+            # Agent skipped the LESSON block: ask separately, overlapping
+            # the call with saving the output
+            lesson, _ = await asyncio.gather(
+                _reflect(task, final_output, use_cache=not no_cache),
+                asyncio.to_thread(_emit_output),
+            )
+        else:
+            _emit_output()
+        save_memory(ws, task_id, task, output, lesson, now=now)
+
+        if verbose:
+            typer.echo(f"[{agent.upper()}] Memory updated: {lesson}")
+
+    asyncio.run(_execute())
+
+    if verbose:
+        typer.echo(f"[{agent.upper()}] {llm_cache_summary()}")
+
+    typer.echo(f"[{agent.upper()}] Task {task_id} completed.")
+
+
+@app.command("run-parallel")
+def run_parallel(
+    agents: List[str] = typer.Option(
+        ..., "--agent", "-a", help="Agent name (repeat, paired with --task)"
+    ),
+    tasks: List[str] = typer.Option(
+        ..., "--task", "-t", help="Task description (repeat, paired with --agent)"
+    ),
+    output_dir: Optional[str] = typer.Option(
+        None, "--output-dir", "-o", help="Directory for outputs"
+    ),
+    max_concurrency: int = typer.Option(
+        4, "--max-concurrency", "-j", help="Max LLM calls in flight"
+    ),
+    no_memory: bool = typer.Option(False, "--no-memory", help="Skip memory loading/saving"),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Always call the LLM for lesson summaries"
+    ),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
+):
+    """
+    Run several independent agent tasks concurrently.
+
+    Each -a/-t pair is one task. Tasks are dispatched at once (bounded by
+    --max-concurrency) instead of waiting 3-5 minutes per agent in sequence.
+    Outputs are saved in the order given as NN-<agent>.md.
+
+    Examples:
+
+        # Design and test plan at the same time
+        ./bin/agent-cli.py run-parallel -a design -t "Design auth API" \\
+            -a test -t "Draft test plan for auth"
+
+        # Save outputs to a directory
+        ./bin/agent-cli.py run-parallel -a code -t "Implement A" -a code -t "Implement B" -o ./out
+    """
+    if len(agents) != len(tasks):
+        typer.echo("Error: Each --agent needs exactly one matching --task", err=True)
+        raise typer.Exit(1)
+
+    if max_concurrency < 1:
+        typer.echo("Error: --max-concurrency must be at least 1", err=True)
+        raise typer.Exit(1)
+
+    now = datetime.now()
+    base_id = new_task_id(now)
+    jobs = []
+    for i, (agent, task) in enumerate(zip(agents, tasks), 1):
+        ws = get_workspace(agent)
+        task_id = f"{base_id}-{i:02d}"
+        memory = "" if no_memory else load_memory(ws, now=now)
+        message = build_message(
+            task_id, task, "", memory,
+            with_output_markers=bool(output_dir), with_lesson=not no_memory,
+        )
+        jobs.append((agent, task, task_id, ws, message))
+
+    import asyncio
+
+    stop_marker = response_stop_marker(bool(output_dir), not no_memory)
+
+    async def _dispatch():
+        semaphore = asyncio.Semaphore(max_concurrency)
+        responses = await asyncio.gather(
+            *(
+                _acall_llm(message, agent, semaphore, stop_marker=stop_marker)
+                for agent, _, _, _, message in jobs
+            ),
+            return_exceptions=True,
+        )
+
+        lessons = [None] * len(jobs)
+        if not no_memory:
+            # Lessons come back inline; only responses without one need a
+            # separate reflection call
+            prompts = []
+            for i, ((_, task, _, _, _), response) in enumerate(zip(jobs, responses)):
+                if isinstance(response, BaseException):
+                    continue
+                lessons[i] = extract_lesson(response)
+                if lessons[i] is None:
+                    prompts.append((i, lesson_prompt(task, extract_output(strip_lesson(response)))))
+            results = await asyncio.gather(
+                *(
+                    _acall_llm(prompt, "main", semaphore, use_cache=not no_cache)
+                    for _, prompt in prompts
+                ),
+                return_exceptions=True,
+            )
+            for (i, _), lesson in zip(prompts, results):
+                lessons[i] = lesson
+        return responses, lessons
+
+    if verbose:
+        typer.echo(
+            f"[PARALLEL] Dispatching {len(jobs)} tasks (max {max_concurrency} concurrent)..."
+        )
+
+    responses, lessons = asyncio.run(_dispatch())
+
+    out_dir = Path(output_dir) if output_dir else None
+    if out_dir:
+        out_dir.mkdir(parents=True, exist_ok=True)
 
-    Returns:
-        LLM response content
+    failed = 0
+    outcomes = zip(jobs, responses, lessons)
+    for i, ((agent, task, task_id, ws, _), response, lesson) in enumerate(outcomes, 1):
+        tag = agent.upper()
+        if isinstance(response, BaseException):
+            typer.echo(f"[{tag}] Error: {response}", err=True)
+            failed += 1
+            continue
 
-    Raises:
-        typer.Exit: On subprocess errors
-    """
-    try:
-        result = subprocess.run(
-            [
-                "openclaw", "agent",
-                "--agent", agent_name,
-                "--local",
-                "--message", message,
-            ],
-            capture_output=True,
-            text=True,
-            timeout=300,
-        )
+        response = strip_lesson(response)
+        final_output = extract_output(response)
+        if out_dir:
+            out_path = out_dir / f"{i:02d}-{agent}.md"
+            github_utils.atomic_write(out_path, final_output)
+            typer.echo(f"[{tag}] Output saved to: {out_path}")
+        else:
+            typer.echo(f"\n=== [{tag}] {task_id} ===\n{response}")
 
-        if result.returncode != 0:
-            typer.echo(f"Error calling LLM: {result.stderr}", err=True)
-            raise typer.Exit(1)
+        if not no_memory:
+            if isinstance(lesson, str):
+                lesson = lesson.strip()[:100]
+            else:
+                lesson = "Task completed successfully."
+            save_memory(ws, task_id, task, str(out_path) if out_dir else None, lesson)
+            if verbose:
+                typer.echo(f"[{tag}] Memory updated: {lesson}")
 
-        return result.stdout.strip()
-    except subprocess.TimeoutExpired:
-        typer.echo("Error: LLM call timed out", err=True)
-        raise typer.Exit(1)
-    except FileNotFoundError:
-        typer.echo("Error: openclaw command not found. Please install OpenClaw first.", err=True)
+    typer.echo(f"[PARALLEL] {len(jobs) - failed}/{len(jobs)} tasks completed ({base_id}).")
+    if failed:
         raise typer.Exit(1)
 
 
-def extract_output(response: str) -> str:
+def _load_plan(plan_path: Path) -> list:
     """
-    Extract content between ---OUTPUT--- and ---END OUTPUT--- markers.
+    Load and validate a pipeline plan.
 
-    If markers not found, returns the full response.
+    The plan is JSON (or YAML, if PyYAML is installed) holding either a list
+    of steps or `{"steps": [...]}`. Each step has `name`, `agent`, `task`,
+    and optionally `deps` (names of earlier steps) and `output` (file path).
 
     Args:
-        response: LLM response text
+        plan_path: Path to the plan file
 
     Returns:
-        Extracted output or full response
-    """
-    if "---OUTPUT---" in response and "---END OUTPUT---" in response:
-        return response.split("---OUTPUT---")[1].split("---END OUTPUT---")[0].strip()
-    return response
-
-
-# =============================================================================
-# Commands
-# =============================================================================
+        Steps in dependency order (every step after all of its deps)
 
-@app.command()
-def run(
-    agent: str = typer.Option(..., "--agent", "-a", help="Agent name: design, code, test, orca"),
-    task: str = typer.Option(..., "--task", "-t", help="Task description"),
-    output: Optional[str] = typer.Option(None, "--output", "-o", help="Output file path"),
-    context: Optional[str] = typer.Option(None, "--context", "-c", help="Context file to read"),
-    task_id: Optional[str] = typer.Option(None, "--task-id", help="Task ID for tracking"),
-    model: str = typer.Option("anthropic/claude-sonnet-4-5", "--model", "-m", help="Model to use"),
+    Raises:
+        ValueError: If the plan is malformed, has unknown deps or a cycle
+    """
+    text = plan_path.read_text(encoding="utf-8")
+    if plan_path.suffix in (".yml", ".yaml"):
+        try:
+            import yaml
+        except ImportError:
+            raise ValueError(
+                "YAML plans need PyYAML (pip install pyyaml); use a .json plan instead"
+            )
+        plan = yaml.safe_load(text)
+    else:
+        plan = json.loads(text)
+
+    steps = plan.get("steps") if isinstance(plan, dict) else plan
+    if not isinstance(steps, list) or not steps:
+        raise ValueError("plan must contain a non-empty list of steps")
+
+    by_name = {}
+    for step in steps:
+        required = ("name", "agent", "task")
+        if not isinstance(step, dict) or not all(step.get(key) for key in required):
+            raise ValueError(f"each step needs 'name', 'agent' and 'task': {step!r}")
+        if step["name"] in by_name:
+            raise ValueError(f"duplicate step name: {step['name']}")
+        deps = step.setdefault("deps", [])
+        if not isinstance(deps, list) or not all(isinstance(dep, str) for dep in deps):
+            raise ValueError(f"step '{step['name']}': 'deps' must be a list of step names")
+        by_name[step["name"]] = step
+
+    for step in steps:
+        for dep in step["deps"]:
+            if dep not in by_name:
+                raise ValueError(f"step '{step['name']}' depends on unknown step '{dep}'")
+
+    # Topological order (depth-first); a step seen again while still being
+    # visited means a cycle
+    ordered, state = [], {}
+
+    def visit(name: str):
+        if state.get(name) == "done":
+            return
+        if state.get(name) == "visiting":
+            raise ValueError(f"dependency cycle at step '{name}'")
+        state[name] = "visiting"
+        for dep in by_name[name]["deps"]:
+            visit(dep)
+        state[name] = "done"
+        ordered.append(by_name[name])
+
+    for step in steps:
+        visit(step["name"])
+    return ordered
+
+
+@app.command("pipeline")
+def pipeline(
+    plan: str = typer.Option(
+        ..., "--plan", "-p", help="Plan file (JSON, or YAML with PyYAML installed)"
+    ),
+    max_concurrency: int = typer.Option(
+        8, "--max-concurrency", "-j", help="Max LLM calls in flight"
+    ),
+    batch: bool = typer.Option(
+        False, "--batch",
+        help="Send each wave of ready steps as one `openclaw agent --batch` call",
+    ),
     no_memory: bool = typer.Option(False, "--no-memory", help="Skip memory loading/saving"),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Always call the LLM for lesson summaries"
+    ),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
 ):
     """
-    Run a specialized agent with a task.
+    Run a DAG of agent steps, with independent steps running concurrently.
 
-    The agent loads its SOUL.md (personality) and recent memories,
-    executes the task, saves output, and updates its memory with lessons learned.
+    Each step starts as soon as the steps in its `deps` have finished, and
+    receives their outputs as context. A failed step skips its dependents.
 
-    Examples:
+    With --batch, steps run in waves instead: every step whose deps are done
+    goes to openclaw in a single JSONL batch (up to --max-concurrency steps
+    per batch), so openclaw starts once per wave rather than once per step.
+    This needs an openclaw that supports `agent --batch`.
 
-        # Design an API
-        ./bin/agent-cli.py run -a design -t "Design REST API for user auth"
+    Plan example (plan.json):
 
-        # Implement with context from design
-        ./bin/agent-cli.py run -a code -t "Implement auth" -c design.md -o auth.py
+        {"steps": [
+          {"name": "api", "agent": "design", "task": "Design auth API", "output": "out/api.md"},
+          {"name": "impl", "agent": "code", "task": "Implement it", "deps": ["api"],
+           "output": "out/auth.py"},
+          {"name": "tests", "agent": "test", "task": "Write tests", "deps": ["api", "impl"]}
+        ]}
 
-        # Write tests
-        ./bin/agent-cli.py run -a test -t "Write tests" -c auth.py -o test_auth.py
-    """
-    # Generate task ID if not provided
-    if not task_id:
-        task_id = datetime.now().strftime("%Y%m%d-%H%M%S") + "-" + str(uuid.uuid4())[:8]
+    Examples:
 
-    ws = get_workspace(agent)
+        ./bin/agent-cli.py pipeline --plan plan.json
 
-    if verbose:
-        typer.echo(f"[{agent.upper()}] Workspace: {ws}")
-        typer.echo(f"[{agent.upper()}] Task ID: {task_id}")
+        ./bin/agent-cli.py pipeline --plan plan.json --batch
+    """
+    if max_concurrency < 1:
+        typer.echo("Error: --max-concurrency must be at least 1", err=True)
+        raise typer.Exit(1)
 
-    # Load memory (SOUL is loaded by OpenClaw automatically)
-    memory = "" if no_memory else load_memory(ws)
+    try:
+        steps = _load_plan(Path(plan))
+    except OSError as e:
+        typer.echo(f"Error: Cannot read plan: {e}", err=True)
+        raise typer.Exit(1)
+    except ValueError as e:
+        typer.echo(f"Error: Invalid plan: {e}", err=True)
+        raise typer.Exit(1)
 
-    # Load context file if provided
-    context_content = ""
-    if context:
-        context_path = Path(context)
-        if context_path.exists():
-            context_content = f"\n\n## Context File: {context}\n```\n{context_path.read_text(encoding='utf-8')}\n```"
-        else:
-            typer.echo(f"Warning: Context file not found: {context}", err=True)
+    # Resolve every workspace up front so a typo fails before any LLM call
+    workspaces = {step["name"]: get_workspace(step["agent"]) for step in steps}
+    now = datetime.now()
+    base_id = new_task_id(now)
 
-    # Build message (SOUL is handled by OpenClaw, we just send task + context + memory)
-    memory_section = f"\n## Recent Lessons Learned\n{memory}\n" if memory else ""
-    output_instruction = ""
-    if output:
-        output_instruction = f"""
+    import asyncio
 
-## Output Instruction
-Format your final deliverable between these markers:
----OUTPUT---
-[Your complete output here]
----END OUTPUT---
-"""
+    def _prepare(step: dict, dep_outputs: list) -> tuple:
+        """Build a step's task ID and message from its deps' outputs."""
+        context_content = "".join(
+            f"\n\n## Output of step '{dep}'\n```\n{dep_output}\n```"
+            for dep, dep_output in zip(step["deps"], dep_outputs)
+        )
+        task_id = f"{base_id}-{step['name']}"
+        memory = "" if no_memory else load_memory(workspaces[step["name"]], now=now)
+        message = build_message(
+            task_id, step["task"], context_content, memory,
+            with_output_markers=True, with_lesson=not no_memory,
+        )
+        return task_id, message
 
-    message = f"""## Task
-Task ID: {task_id}
-{task}
-{context_content}
-{memory_section}
-{output_instruction}
-"""
+    async def _finish(step: dict, task_id: str, response: str, semaphore) -> str:
+        """Save a step's output and memory; returns the extracted output."""
+        name, agent, task = step["name"], step["agent"], step["task"]
+        tag = f"{agent.upper()}:{name}"
+        lesson = extract_lesson(response)
+        final_output = extract_output(strip_lesson(response))
 
-    if verbose:
-        typer.echo(f"[{agent.upper()}] Calling OpenClaw agent...")
-
-    # Call LLM via OpenClaw agent
-    response = call_llm(message, agent)
-    final_output = extract_output(response)
-
-    # Save output
-    if output:
-        out_path = Path(output)
-        out_path.parent.mkdir(parents=True, exist_ok=True)
-        out_path.write_text(final_output, encoding="utf-8")
-        typer.echo(f"[{agent.upper()}] Output saved to: {output}")
-    else:
-        typer.echo(response)
+        output = step.get("output")
+        if output:
+            out_path = Path(output)
+            out_path.parent.mkdir(parents=True, exist_ok=True)
+            github_utils.atomic_write(out_path, final_output)
+            typer.echo(f"[{tag}] Output saved to: {output}")
+        else:
+            typer.echo(f"\n=== [{tag}] {task_id} ===\n{final_output}")
 
-    # Auto-reflection and memory update
-    if not no_memory:
-        lesson_prompt = f"""Briefly summarize the key lesson from this task in ONE sentence (max 100 chars).
+        if not no_memory:
+            if lesson is None:
+                lesson = await _reflect(task, final_output, semaphore, use_cache=not no_cache)
+            save_memory(workspaces[name], task_id, task, output, lesson)
+            if verbose:
+                typer.echo(f"[{tag}] Memory updated: {lesson}")
 
-Task: {task[:200]}
-Output: {final_output[:200]}..."""
+        return final_output
 
+    async def _run_step(step: dict, dep_tasks: list, semaphore) -> str:
         try:
-            lesson = call_llm(lesson_prompt, "main")
-            lesson = lesson.strip()[:100]
+            dep_outputs = await asyncio.gather(*dep_tasks)
         except Exception:
-            lesson = "Task completed successfully."
-
-        save_memory(ws, task_id, task, output, lesson)
+            raise LLMError("skipped, a dependency failed")
+        task_id, message = _prepare(step, dep_outputs)
 
         if verbose:
-            typer.echo(f"[{agent.upper()}] Memory updated: {lesson}")
+            typer.echo(f"[{step['agent'].upper()}:{step['name']}] Started")
+        response = await _acall_llm(
+            message, step["agent"], semaphore,
+            stop_marker=response_stop_marker(True, not no_memory),
+        )
+        return await _finish(step, task_id, response, semaphore)
+
+    async def _dispatch():
+        semaphore = asyncio.Semaphore(max_concurrency)
+        tasks = {}
+        for step in steps:  # dependency order, so dep tasks already exist
+            dep_tasks = [tasks[dep] for dep in step["deps"]]
+            tasks[step["name"]] = asyncio.create_task(_run_step(step, dep_tasks, semaphore))
+        return await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+    async def _dispatch_batched():
+        semaphore = asyncio.Semaphore(max_concurrency)
+        results = {}  # step name -> output, or the exception it failed with
+        pending = list(steps)
+        while pending:
+            wave, waiting = [], []
+            for step in pending:
+                if not all(dep in results for dep in step["deps"]):
+                    waiting.append(step)
+                elif any(isinstance(results[dep], BaseException) for dep in step["deps"]):
+                    results[step["name"]] = LLMError("skipped, a dependency failed")
+                else:
+                    wave.append(step)
+            pending = waiting
+
+            for start in range(0, len(wave), max_concurrency):
+                chunk = wave[start:start + max_concurrency]
+                prepared = [
+                    _prepare(step, [results[dep] for dep in step["deps"]]) for step in chunk
+                ]
+                if verbose:
+                    names = ", ".join(step["name"] for step in chunk)
+                    typer.echo(f"[PIPELINE] Batch of {len(chunk)}: {names}")
+                try:
+                    responses = await asyncio.to_thread(
+                        call_llm_batch,
+                        [(step["agent"], message) for step, (_, message) in zip(chunk, prepared)],
+                    )
+                except LLMError as e:
+                    responses = [e] * len(chunk)
+
+                finished = await asyncio.gather(
+                    *(
+                        _finish(step, task_id, response, semaphore)
+                        for step, (task_id, _), response in zip(chunk, prepared, responses)
+                        if not isinstance(response, BaseException)
+                    ),
+                    return_exceptions=True,
+                )
+                finished = iter(finished)
+                for step, response in zip(chunk, responses):
+                    if not isinstance(response, BaseException):
+                        response = next(finished)
+                    results[step["name"]] = response
+
+        return [results[step["name"]] for step in steps]
 
-    typer.echo(f"[{agent.upper()}] Task {task_id} completed.")
+    if verbose:
+        typer.echo(f"[PIPELINE] Running {len(steps)} steps (max {max_concurrency} concurrent)...")
+
+    results = asyncio.run(_dispatch_batched() if batch else _dispatch())
+
+    failed = 0
+    for step, result in zip(steps, results):
+        if isinstance(result, BaseException):
+            failed += 1
+            typer.echo(f"[{step['agent'].upper()}:{step['name']}] Failed: {result}", err=True)
+
+    typer.echo(f"[PIPELINE] {len(steps) - failed}/{len(steps)} steps completed ({base_id}).")
+    if failed:
+        raise typer.Exit(1)
 
 
 @app.command("list-agents")
 def list_agents():
     """List available agents and their workspace status."""
-    typer.echo("Available agents:\n")
-    typer.echo("  Agent       Workspace              Status")
-    typer.echo("  " + "-" * 50)
-    for agent, ws_name in AGENT_WORKSPACES.items():
-        ws = BASE_DIR / ws_name
-        installed_ws = Path.home() / ".openclaw" / ws_name
-        if ws.exists():
-            status = "✓ (dev)"
-        elif installed_ws.exists():
-            status = "✓ (installed)"
-        else:
-            status = "✗ not found"
-        typer.echo(f"  {agent:10}  {ws_name:20}  {status}")
+    _print_agent_table()
 
 
 @app.command("show-memory")
@@ -425,370 +1818,133 @@ def clear_memory(
         return
 
     if all_days:
-        shutil.rmtree(memory_dir)
+        # Renamed away at once; the files are unlinked in the background
+        github_utils.remove_tree_in_background(memory_dir)
         typer.echo(f"Cleared all memories for {agent}")
     else:
-        today = datetime.now().strftime("%Y-%m-%d")
-        today_file = memory_dir / f"{today}.md"
-        if today_file.exists():
-            today_file.unlink()
+        today = datetime.now().date().isoformat()
+        cleared = False
+        for suffix in (".jsonl", ".md"):  # .md: day files from before JSONL
+            try:
+                (memory_dir / f"{today}{suffix}").unlink()
+                cleared = True
+            except FileNotFoundError:
+                pass
+        if cleared:
             typer.echo(f"Cleared today's memories for {agent}")
         else:
             typer.echo(f"No memories to clear for {agent} today")
 
 
-@app.command("summarize-repo")
-def summarize_repo(
-    url: Optional[str] = typer.Option(None, "--url", "-u", help="GitHub repository URL"),
-    path: Optional[str] = typer.Option(None, "--path", "-p", help="Local repository path"),
-    branch: Optional[str] = typer.Option(None, "--branch", "-b", help="Specific branch to analyze"),
-    pat: Optional[str] = typer.Option(None, "--pat", help="GitHub PAT for private repos (or set GITHUB_PAT env)"),
-    output: Optional[str] = typer.Option(None, "--output", "-o", help="Output file path"),
-    task_id: Optional[str] = typer.Option(None, "--task-id", help="Task ID for tracking"),
-    keep_clone: bool = typer.Option(False, "--keep-clone", help="Don't delete cloned repo (for debugging)"),
-    verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
-):
-    """
-    Summarize a GitHub repository or local directory.
-
-    Analyzes repository structure, tech stack, key files, and dependencies.
-    Output is saved to artifacts or specified path.
-
-    Examples:
+# read-pr keeps this many characters of a diff, read in DIFF_CHUNK_SIZE pieces
+PR_DIFF_LIMIT = 50000
+DIFF_CHUNK_SIZE = 64 * 1024
 
-        # Summarize a GitHub repo
-        ./bin/agent-cli.py summarize-repo --url https://github.com/user/repo
 
-        # Summarize a specific branch
-        ./bin/agent-cli.py summarize-repo -u https://github.com/user/repo -b develop
+def _pr_diff_section(proc: subprocess.Popen, timeout: int = 60):
+    """
+    Yield read-pr's "## Diff" section from a running `gh pr diff`.
 
-        # Summarize a private repo (PAT via flag)
-        ./bin/agent-cli.py summarize-repo -u https://github.com/user/private-repo --pat ghp_xxx
+    The diff is read from the pipe in chunks and yielded as it arrives, so
+    at most one chunk is held at a time; reading stops after PR_DIFF_LIMIT
+    characters (the caller stops gh). Nothing is yielded if gh fails
+    without printing anything.
 
-        # Summarize a private repo (PAT via env)
-        GITHUB_PAT=ghp_xxx ./bin/agent-cli.py summarize-repo -u https://github.com/user/private-repo
+    Args:
+        proc: `gh pr diff` process with a text stdout pipe
+        timeout: Seconds before gh is killed
 
-        # Summarize local directory
-        ./bin/agent-cli.py summarize-repo --path /path/to/repo
+    Raises:
+        subprocess.TimeoutExpired: If gh ran past the timeout
     """
-    # Validate input
-    if not url and not path:
-        typer.echo("Error: Must specify either --url or --path", err=True)
-        raise typer.Exit(1)
-
-    if url and path:
-        typer.echo("Error: Cannot specify both --url and --path", err=True)
-        raise typer.Exit(1)
-
-    # Generate task ID
-    if not task_id:
-        task_id = datetime.now().strftime("%Y%m%d-%H%M%S") + "-" + str(uuid.uuid4())[:8]
+    timed_out = threading.Event()
 
-    temp_dir = None
-    repo_path = None
-    repo_name = "local-repo"
+    def expire():
+        timed_out.set()
+        _terminate(proc)
 
+    watchdog = threading.Timer(timeout, expire)
+    watchdog.start()
     try:
-        # Handle GitHub URL
-        if url:
-            try:
-                owner, repo_name, clone_url = parse_github_url(url)
-            except ValueError as e:
-                typer.echo(f"Error: {e}", err=True)
-                raise typer.Exit(1)
-
-            # Get PAT (from --pat flag or environment)
-            github_token = get_github_token(pat)
-
-            branch_info = f" (branch: {branch})" if branch else ""
-            auth_info = " [authenticated]" if github_token else ""
-            if verbose:
-                typer.echo(f"[GITHUB] Cloning {owner}/{repo_name}{branch_info}{auth_info}...")
-
-            # Create temp directory
-            temp_dir = Path(tempfile.mkdtemp(prefix="clawcrew-repo-"))
-            repo_path = temp_dir / repo_name
-
-            # Clone repository
-            if not clone_repository(clone_url, repo_path, branch, github_token):
-                error_msg = "Error: Failed to clone repository."
-                if branch:
-                    error_msg += f" Branch '{branch}' may not exist."
-                elif not github_token:
-                    error_msg += " Is it public? Use --pat for private repos."
-                else:
-                    error_msg += " Check your PAT permissions."
-                typer.echo(error_msg, err=True)
-                raise typer.Exit(1)
-
-            if verbose:
-                typer.echo(f"[GITHUB] Cloned to: {repo_path}")
-
-        # Handle local path
-        else:
-            repo_path = Path(path).resolve()
-            if not repo_path.exists():
-                typer.echo(f"Error: Path does not exist: {path}", err=True)
-                raise typer.Exit(1)
-            if not repo_path.is_dir():
-                typer.echo(f"Error: Path is not a directory: {path}", err=True)
-                raise typer.Exit(1)
-            repo_name = repo_path.name
-
-            if verbose:
-                typer.echo(f"[GITHUB] Analyzing local directory: {repo_path}")
-
-        # Find key files
-        if verbose:
-            typer.echo("[GITHUB] Scanning for key files...")
-
-        key_files = find_key_files(repo_path)
-
-        if verbose:
-            for category, files in key_files.items():
-                if files:
-                    typer.echo(f"[GITHUB] Found {len(files)} {category} files")
-
-        # Build context
-        if verbose:
-            typer.echo("[GITHUB] Building analysis context...")
-
-        context = build_repo_context(repo_path, key_files)
-
-        # Build prompt for repo agent
-        source = url if url else str(repo_path)
-        branch_line = f"\n**Branch:** {branch}" if branch else ""
-        prompt = f"""## Repository Analysis Task
-
-Task ID: {task_id}
-
-Analyze this repository and provide a comprehensive summary.
-
-**Source:** {source}
-**Repository Name:** {repo_name}{branch_line}
-
-{context}
-
-## Instructions
-
-Analyze the repository structure, identify the tech stack, key files, and dependencies.
-Follow your output format exactly.
-
-Format your analysis between these markers:
----OUTPUT---
-[Your complete analysis here]
----END OUTPUT---
-"""
-
-        # Call github agent
-        if verbose:
-            typer.echo("[GITHUB] Calling github agent for analysis...")
-
-        response = call_llm(prompt, "design")
-        summary = extract_output(response)
-
-        # Determine output path
-        if output:
-            out_path = Path(output)
-        else:
-            artifacts_dir = Path.home() / ".openclaw" / "artifacts" / task_id
-            artifacts_dir.mkdir(parents=True, exist_ok=True)
-            out_path = artifacts_dir / "repo_summary.md"
-
-        # Save output
-        out_path.parent.mkdir(parents=True, exist_ok=True)
-        out_path.write_text(summary, encoding="utf-8")
-
-        typer.echo(f"[GITHUB] Summary saved to: {out_path}")
-        typer.echo(f"[GITHUB] Task {task_id} completed.")
-
-        # Also print summary if no output file specified by user
-        if not output:
-            typer.echo("\n" + "=" * 60)
-            typer.echo(summary)
+        chunk = proc.stdout.read(min(PR_DIFF_LIMIT, DIFF_CHUNK_SIZE))
+        if not chunk and proc.wait() != 0 and not timed_out.is_set():
+            return
 
+        yield "\n## Diff\n\n```diff\n"
+        remaining = PR_DIFF_LIMIT
+        while chunk:
+            yield chunk
+            remaining -= len(chunk)
+            if not remaining:
+                break
+            chunk = proc.stdout.read(min(remaining, DIFF_CHUNK_SIZE))
+        # Truncate very large diffs
+        if not remaining and proc.stdout.read(1):
+            yield "\n\n[Diff truncated due to size]"
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(proc.args, timeout)
+        yield "\n```\n"
     finally:
-        # Cleanup temp directory (keep clone if task_id is provided, unless explicitly told not to)
-        should_keep = keep_clone or (task_id is not None)
-        if temp_dir and temp_dir.exists() and not should_keep:
-            if verbose:
-                typer.echo(f"[GITHUB] Cleaning up: {temp_dir}")
-            shutil.rmtree(temp_dir, ignore_errors=True)
-        elif temp_dir and should_keep:
-            # Move clone to artifacts directory for persistence
-            artifacts_dir = Path.home() / ".openclaw" / "artifacts" / task_id
-            artifacts_dir.mkdir(parents=True, exist_ok=True)
-            clone_dest = artifacts_dir / "repo"
-            if not clone_dest.exists() and repo_path and repo_path.exists():
-                shutil.move(str(repo_path), str(clone_dest))
-                if verbose:
-                    typer.echo(f"[GITHUB] Clone saved to: {clone_dest}")
+        watchdog.cancel()
 
 
-@app.command("read-files")
-def read_files(
-    repo_path: str = typer.Option(..., "--repo-path", "-r", help="Path to repository root"),
-    files: str = typer.Option(..., "--files", "-f", help="Comma-separated file paths (relative to repo root)"),
-    output: Optional[str] = typer.Option(None, "--output", "-o", help="Output file path"),
-    line_numbers: bool = typer.Option(True, "--line-numbers/--no-line-numbers", help="Include line numbers"),
-    verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
-):
+def _gh_json(cmd: List[str], timeout: int = 30) -> tuple:
     """
-    Read specific files from a repository and format for agent context.
+    Run a `gh ... --json` command, parsing stdout straight from the pipe.
 
-    Outputs files with line numbers in a format suitable for agents to
-    understand exact locations for modifications (Repo Mode).
-
-    Examples:
+    stdout is read as bytes in large chunks and handed to json.load, so the
+    response is never decoded into an intermediate str. stderr is drained on
+    a thread so a chatty gh cannot fill the pipe and stall, and a watchdog
+    kills gh after `timeout` seconds.
 
-        # Read specific files
-        ./bin/agent-cli.py read-files -r ./repo -f "src/api.py,src/models.py"
+    Args:
+        cmd: gh command line
+        timeout: Seconds before gh is killed
 
-        # Read and save to context file
-        ./bin/agent-cli.py read-files -r ~/.openclaw/artifacts/task-001/repo \\
-            -f "src/api.py,tests/test_api.py" -o repo_context.md
+    Returns:
+        (returncode, parsed JSON or None if gh failed, stderr text)
 
-        # Read without line numbers
-        ./bin/agent-cli.py read-files -r ./repo -f "README.md" --no-line-numbers
+    Raises:
+        subprocess.TimeoutExpired: If gh ran past the timeout
+        FileNotFoundError: If gh is not installed
+        json.JSONDecodeError: If gh succeeded but printed invalid JSON
     """
-    repo = Path(repo_path).resolve()
-
-    if not repo.exists():
-        typer.echo(f"Error: Repository path does not exist: {repo_path}", err=True)
-        raise typer.Exit(1)
-
-    if not repo.is_dir():
-        typer.echo(f"Error: Path is not a directory: {repo_path}", err=True)
-        raise typer.Exit(1)
-
-    # Parse file list
-    file_list = [f.strip() for f in files.split(",") if f.strip()]
-
-    if not file_list:
-        typer.echo("Error: No files specified", err=True)
-        raise typer.Exit(1)
-
-    if verbose:
-        typer.echo(f"[READ-FILES] Reading {len(file_list)} files from {repo}")
+    proc = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=1024 * 1024
+    )
 
-    content_parts = ["# Repository File Contents\n"]
-    content_parts.append(f"**Repository:** `{repo}`\n")
-    content_parts.append(f"**Files:** {len(file_list)}\n\n")
-    content_parts.append("---\n")
+    stderr_chunks = []
+    drain = threading.Thread(target=lambda: stderr_chunks.append(proc.stderr.read()), daemon=True)
+    drain.start()
 
-    files_read = 0
-    files_missing = 0
+    timed_out = threading.Event()
 
-    for file_path in file_list:
-        full_path = repo / file_path
-
-        if not full_path.exists():
-            if verbose:
-                typer.echo(f"[READ-FILES] Warning: File not found: {file_path}")
-            content_parts.append(f"\n## File: {file_path}\n\n")
-            content_parts.append("**Status:** File not found\n\n")
-            files_missing += 1
-            continue
-
-        if not full_path.is_file():
-            if verbose:
-                typer.echo(f"[READ-FILES] Warning: Not a file: {file_path}")
-            content_parts.append(f"\n## File: {file_path}\n\n")
-            content_parts.append("**Status:** Not a regular file\n\n")
-            files_missing += 1
-            continue
-
-        # Determine language for code fence
-        ext = full_path.suffix.lower()
-        lang_map = {
-            ".py": "python",
-            ".js": "javascript",
-            ".ts": "typescript",
-            ".tsx": "tsx",
-            ".jsx": "jsx",
-            ".go": "go",
-            ".rs": "rust",
-            ".rb": "ruby",
-            ".java": "java",
-            ".c": "c",
-            ".cpp": "cpp",
-            ".h": "c",
-            ".hpp": "cpp",
-            ".cs": "csharp",
-            ".php": "php",
-            ".swift": "swift",
-            ".kt": "kotlin",
-            ".scala": "scala",
-            ".sh": "bash",
-            ".bash": "bash",
-            ".zsh": "zsh",
-            ".yml": "yaml",
-            ".yaml": "yaml",
-            ".json": "json",
-            ".xml": "xml",
-            ".html": "html",
-            ".css": "css",
-            ".scss": "scss",
-            ".sql": "sql",
-            ".md": "markdown",
-            ".toml": "toml",
-            ".ini": "ini",
-            ".cfg": "ini",
-        }
-        lang = lang_map.get(ext, "")
+    def expire():
+        timed_out.set()
+        _terminate(proc)
 
+    watchdog = threading.Timer(timeout, expire)
+    watchdog.start()
+    try:
         try:
-            file_content = full_path.read_text(encoding="utf-8")
-            lines = file_content.splitlines()
-
-            content_parts.append(f"\n## File: {file_path}\n\n")
-            content_parts.append(f"**Lines:** {len(lines)}\n\n")
-            content_parts.append(f"```{lang}\n")
-
-            if line_numbers:
-                # Add line numbers
-                width = len(str(len(lines)))
-                for i, line in enumerate(lines, 1):
-                    content_parts.append(f"{i:>{width}}: {line}\n")
-            else:
-                content_parts.append(file_content)
-                if not file_content.endswith("\n"):
-                    content_parts.append("\n")
-
-            content_parts.append("```\n")
-            files_read += 1
-
-            if verbose:
-                typer.echo(f"[READ-FILES] Read: {file_path} ({len(lines)} lines)")
-
-        except UnicodeDecodeError:
-            content_parts.append(f"\n## File: {file_path}\n\n")
-            content_parts.append("**Status:** Binary file (cannot display)\n\n")
-            files_missing += 1
-        except Exception as e:
-            content_parts.append(f"\n## File: {file_path}\n\n")
-            content_parts.append(f"**Status:** Error reading file: {e}\n\n")
-            files_missing += 1
-
-    # Summary
-    content_parts.append("\n---\n")
-    content_parts.append(f"\n**Summary:** {files_read} files read, {files_missing} files missing/skipped\n")
-
-    final_content = "".join(content_parts)
-
-    # Output
-    if output:
-        out_path = Path(output)
-        out_path.parent.mkdir(parents=True, exist_ok=True)
-        out_path.write_text(final_content, encoding="utf-8")
-        typer.echo(f"[READ-FILES] Saved to: {output}")
-    else:
-        typer.echo(final_content)
+            data, parse_error = json.load(proc.stdout), None
+        except json.JSONDecodeError as e:
+            data, parse_error = None, e
+        proc.wait()
+    finally:
+        watchdog.cancel()
+        proc.stdout.close()
+    drain.join()
+    proc.stderr.close()
 
-    if files_read > 0:
-        typer.echo(f"[READ-FILES] Done: {files_read} files read")
-    else:
-        typer.echo("[READ-FILES] Warning: No files were read successfully", err=True)
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    stderr = b"".join(stderr_chunks).decode("utf-8", errors="replace")
+    if proc.returncode != 0:
+        return proc.returncode, None, stderr
+    if parse_error is not None:
+        raise parse_error
+    return proc.returncode, data, stderr
 
 
 @app.command("read-issue")
@@ -820,21 +1976,18 @@ def read_issue(
         typer.echo(f"[ISSUE] Fetching {repo}#{issue}...")
 
     try:
-        # Fetch issue details
-        result = subprocess.run(
-            ["gh", "issue", "view", str(issue), "--repo", repo, "--json",
-             "title,body,state,author,labels,assignees,createdAt,url"],
-            capture_output=True,
-            text=True,
-            timeout=30,
+        # Fetch issue details, and comments in the same call if requested
+        fields = "title,body,state,author,labels,assignees,createdAt,url"
+        if with_comments:
+            fields += ",comments"
+        returncode, issue_data, stderr = _gh_json(
+            ["gh", "issue", "view", str(issue), "--repo", repo, "--json", fields],
         )
 
-        if result.returncode != 0:
-            typer.echo(f"Error: Failed to fetch issue. {result.stderr}", err=True)
+        if returncode != 0:
+            typer.echo(f"Error: Failed to fetch issue. {stderr}", err=True)
             raise typer.Exit(1)
 
-        issue_data = json.loads(result.stdout)
-
         # Build formatted output
         labels = ", ".join([l["name"] for l in issue_data.get("labels", [])]) or "None"
         assignees = ", ".join([a["login"] for a in issue_data.get("assignees", [])]) or "None"
@@ -854,33 +2007,21 @@ def read_issue(
 {issue_data.get('body', 'No description provided.')}
 """
 
-        # Fetch comments if requested
         if with_comments:
-            if verbose:
-                typer.echo("[ISSUE] Fetching comments...")
-
-            comments_result = subprocess.run(
-                ["gh", "issue", "view", str(issue), "--repo", repo, "--json", "comments"],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
+            comments = issue_data.get("comments", [])
 
-            if comments_result.returncode == 0:
-                comments_data = json.loads(comments_result.stdout)
-                comments = comments_data.get("comments", [])
-
-                if comments:
-                    content += "\n## Comments\n\n"
-                    for i, comment in enumerate(comments, 1):
-                        content += f"### Comment {i} by {comment['author']['login']} ({comment['createdAt']})\n\n"
-                        content += f"{comment['body']}\n\n"
+            if comments:
+                content += "\n## Comments\n\n"
+                for i, comment in enumerate(comments, 1):
+                    author, created = comment["author"]["login"], comment["createdAt"]
+                    content += f"### Comment {i} by {author} ({created})\n\n"
+                    content += f"{comment['body']}\n\n"
 
         # Output
         if output:
             out_path = Path(output)
             out_path.parent.mkdir(parents=True, exist_ok=True)
-            out_path.write_text(content, encoding="utf-8")
+            github_utils.atomic_write(out_path, content)
             typer.echo(f"[ISSUE] Saved to: {output}")
         else:
             typer.echo(content)
@@ -931,14 +2072,12 @@ def list_issues(
         if label:
             cmd.extend(["--label", label])
 
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        returncode, issues, stderr = _gh_json(cmd)
 
-        if result.returncode != 0:
-            typer.echo(f"Error: Failed to list issues. {result.stderr}", err=True)
+        if returncode != 0:
+            typer.echo(f"Error: Failed to list issues. {stderr}", err=True)
             raise typer.Exit(1)
 
-        issues = json.loads(result.stdout)
-
         if not issues:
             typer.echo(f"No {state} issues found in {repo}")
             return
@@ -1069,14 +2208,12 @@ def list_prs(
         cmd = ["gh", "pr", "list", "--repo", repo, "--state", state,
                "--limit", str(limit), "--json", "number,title,state,author,headRefName,baseRefName,createdAt"]
 
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        returncode, prs, stderr = _gh_json(cmd)
 
-        if result.returncode != 0:
-            typer.echo(f"Error: Failed to list PRs. {result.stderr}", err=True)
+        if returncode != 0:
+            typer.echo(f"Error: Failed to list PRs. {stderr}", err=True)
             raise typer.Exit(1)
 
-        prs = json.loads(result.stdout)
-
         if not prs:
             typer.echo(f"No {state} PRs found in {repo}")
             return
@@ -1131,22 +2268,33 @@ def read_pr(
     if verbose:
         typer.echo(f"[PR] Fetching {repo}#{pr_number}...")
 
+    diff_proc = None
     try:
-        # Fetch PR details
-        result = subprocess.run(
-            ["gh", "pr", "view", str(pr_number), "--repo", repo, "--json",
-             "title,body,state,author,labels,assignees,headRefName,baseRefName,createdAt,url,mergeable,additions,deletions,changedFiles"],
-            capture_output=True,
-            text=True,
-            timeout=30,
+        # The diff does not depend on the PR details, so start it first and
+        # let both gh calls run at once
+        if with_diff:
+            if verbose:
+                typer.echo("[PR] Fetching diff...")
+            diff_proc = subprocess.Popen(
+                ["gh", "pr", "diff", str(pr_number), "--repo", repo],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            )
+
+        # Fetch PR details, and comments in the same call if requested
+        fields = ("title,body,state,author,labels,assignees,headRefName,baseRefName,"
+                  "createdAt,url,mergeable,additions,deletions,changedFiles")
+        if with_comments:
+            fields += ",comments"
+        returncode, pr_data, stderr = _gh_json(
+            ["gh", "pr", "view", str(pr_number), "--repo", repo, "--json", fields],
         )
 
-        if result.returncode != 0:
-            typer.echo(f"Error: Failed to fetch PR. {result.stderr}", err=True)
+        if returncode != 0:
+            typer.echo(f"Error: Failed to fetch PR. {stderr}", err=True)
             raise typer.Exit(1)
 
-        pr_data = json.loads(result.stdout)
-
         # Build formatted output
         labels = ", ".join([l["name"] for l in pr_data.get("labels", [])]) or "None"
         assignees = ", ".join([a["login"] for a in pr_data.get("assignees", [])]) or "None"
@@ -1169,55 +2317,27 @@ def read_pr(
 {pr_data.get('body', 'No description provided.')}
 """
 
-        # Fetch comments if requested
         if with_comments:
-            if verbose:
-                typer.echo("[PR] Fetching comments...")
-
-            comments_result = subprocess.run(
-                ["gh", "pr", "view", str(pr_number), "--repo", repo, "--json", "comments"],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-
-            if comments_result.returncode == 0:
-                comments_data = json.loads(comments_result.stdout)
-                comments = comments_data.get("comments", [])
-
-                if comments:
-                    content += "\n## Comments\n\n"
-                    for i, comment in enumerate(comments, 1):
-                        content += f"### Comment {i} by {comment['author']['login']} ({comment['createdAt']})\n\n"
-                        content += f"{comment['body']}\n\n"
-
-        # Fetch diff if requested
-        if with_diff:
-            if verbose:
-                typer.echo("[PR] Fetching diff...")
+            comments = pr_data.get("comments", [])
 
-            diff_result = subprocess.run(
-                ["gh", "pr", "diff", str(pr_number), "--repo", repo],
-                capture_output=True,
-                text=True,
-                timeout=60,
-            )
+            if comments:
+                content += "\n## Comments\n\n"
+                for i, comment in enumerate(comments, 1):
+                    author, created = comment["author"]["login"], comment["createdAt"]
+                    content += f"### Comment {i} by {author} ({created})\n\n"
+                    content += f"{comment['body']}\n\n"
 
-            if diff_result.returncode == 0:
-                diff = diff_result.stdout
-                # Truncate very large diffs
-                if len(diff) > 50000:
-                    diff = diff[:50000] + "\n\n[Diff truncated due to size]"
-                content += f"\n## Diff\n\n```diff\n{diff}\n```\n"
+        # Read the diff started above; a file gets it streamed straight in
+        diff_section = _pr_diff_section(diff_proc) if diff_proc is not None else ()
 
         # Output
         if output:
             out_path = Path(output)
             out_path.parent.mkdir(parents=True, exist_ok=True)
-            out_path.write_text(content, encoding="utf-8")
+            github_utils.atomic_write_chunks(out_path, itertools.chain((content,), diff_section))
             typer.echo(f"[PR] Saved to: {output}")
         else:
-            typer.echo(content)
+            typer.echo(content + "".join(diff_section))
 
     except subprocess.TimeoutExpired:
         typer.echo("Error: Request timed out", err=True)
@@ -1228,7 +2348,61 @@ def read_pr(
     except json.JSONDecodeError as e:
         typer.echo(f"Error: Failed to parse response: {e}", err=True)
         raise typer.Exit(1)
+    finally:
+        # Don't leave the diff running if the PR fetch failed or timed out
+        if diff_proc is not None and diff_proc.poll() is None:
+            _terminate(diff_proc)
+
+
+# =============================================================================
+# Entry Point
+# =============================================================================
+
+# Flags accepted by the `run` argv shortcut, mapped to run()'s parameters.
+_RUN_FAST_FLAGS = {
+    "-a": "agent", "--agent": "agent",
+    "-t": "task", "--task": "task",
+    "-c": "context", "--context": "context",
+    "-o": "output", "--output": "output",
+}
+
+
+def _parse_run_fast(args: List[str]) -> Optional[dict]:
+    """
+    Parse the common `run -a <agent> -t <task> [-c <file>] [-o <file>]` shape.
+
+    Returns the full keyword arguments for run(), or None if the arguments
+    use anything else (other flags, --flag=value, missing -a/-t), in which
+    case Typer parses them as usual.
+    """
+    if len(args) % 2:
+        return None
+    kwargs = {
+        "agent": None, "task": None, "output": None, "context": None,
+        "task_id": None, "model": DEFAULT_MODEL,
+        "no_memory": False, "no_cache": False, "verbose": False,
+    }
+    for flag, value in zip(args[::2], args[1::2]):
+        name = _RUN_FAST_FLAGS.get(flag)
+        if name is None:
+            return None
+        kwargs[name] = value
+    if kwargs["agent"] is None or kwargs["task"] is None:
+        return None
+    return kwargs
 
 
 if __name__ == "__main__":
+    # `run -a X -t Y` is what the orchestrator issues for every step; call
+    # run() directly instead of building the Click command tree for it.
+    run_kwargs = _parse_run_fast(sys.argv[2:]) if sys.argv[1:2] == ["run"] else None
+    if run_kwargs is not None:
+        try:
+            run(**run_kwargs)
+        except typer.BadParameter as e:
+            typer.echo(f"Error: {e.format_message()}", err=True)
+            sys.exit(2)
+        except typer.Exit as e:
+            sys.exit(e.exit_code)
+        sys.exit(0)
     app()
@@ -0,0 +1 @@
+"""Subcommands of agent-cli.py that are imported only when invoked."""
@@ -0,0 +1,243 @@
+"""
+read-files command: read specific files from a repository for agent context.
+
+Loaded on demand by agent-cli.py (see LAZY_COMMANDS there).
+"""
+
+import os
+import stat
+import sys
+from pathlib import Path
+from types import MappingProxyType
+from typing import Optional
+
+import typer
+
+app = typer.Typer(add_completion=False)
+
+# Bytes per os.write() when saving to --output
+WRITE_CHUNK_SIZE = 64 * 1024
+
+# File extension -> code fence language
+LANG_MAP = MappingProxyType({
+    ".py": "python",
+    ".js": "javascript",
+    ".ts": "typescript",
+    ".tsx": "tsx",
+    ".jsx": "jsx",
+    ".go": "go",
+    ".rs": "rust",
+    ".rb": "ruby",
+    ".java": "java",
+    ".c": "c",
+    ".cpp": "cpp",
+    ".h": "c",
+    ".hpp": "cpp",
+    ".cs": "csharp",
+    ".php": "php",
+    ".swift": "swift",
+    ".kt": "kotlin",
+    ".scala": "scala",
+    ".sh": "bash",
+    ".bash": "bash",
+    ".zsh": "zsh",
+    ".yml": "yaml",
+    ".yaml": "yaml",
+    ".json": "json",
+    ".xml": "xml",
+    ".html": "html",
+    ".css": "css",
+    ".scss": "scss",
+    ".sql": "sql",
+    ".md": "markdown",
+    ".toml": "toml",
+    ".ini": "ini",
+    ".cfg": "ini",
+})
+
+
+@app.command("read-files")
+def read_files(
+    repo_path: str = typer.Option(..., "--repo-path", "-r", help="Path to repository root"),
+    files: str = typer.Option(
+        ..., "--files", "-f", help="Comma-separated file paths (relative to repo root)"
+    ),
+    output: Optional[str] = typer.Option(None, "--output", "-o", help="Output file path"),
+    line_numbers: bool = typer.Option(
+        True, "--line-numbers/--no-line-numbers", help="Include line numbers"
+    ),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
+):
+    """
+    Read specific files from a repository and format for agent context.
+
+    Outputs files with line numbers in a format suitable for agents to
+    understand exact locations for modifications (Repo Mode).
+
+    Examples:
+
+        # Read specific files
+        ./bin/agent-cli.py read-files -r ./repo -f "src/api.py,src/models.py"
+
+        # Read and save to context file
+        ./bin/agent-cli.py read-files -r ~/.openclaw/artifacts/task-001/repo \\
+            -f "src/api.py,tests/test_api.py" -o repo_context.md
+
+        # Read without line numbers
+        ./bin/agent-cli.py read-files -r ./repo -f "README.md" --no-line-numbers
+    """
+    repo = Path(repo_path).resolve()
+
+    if not repo.exists():
+        typer.echo(f"Error: Repository path does not exist: {repo_path}", err=True)
+        raise typer.Exit(1)
+
+    if not repo.is_dir():
+        typer.echo(f"Error: Path is not a directory: {repo_path}", err=True)
+        raise typer.Exit(1)
+
+    # Parse file list
+    file_list = [f.strip() for f in files.split(",") if f.strip()]
+
+    if not file_list:
+        typer.echo("Error: No files specified", err=True)
+        raise typer.Exit(1)
+
+    if verbose:
+        typer.echo(f"[READ-FILES] Reading {len(file_list)} files from {repo}")
+
+    content_parts = ["# Repository File Contents\n"]
+    content_parts.append(f"**Repository:** `{repo}`\n")
+    content_parts.append(f"**Files:** {len(file_list)}\n\n")
+    content_parts.append("---\n")
+
+    files_read = 0
+    files_missing = 0
+
+    # Each file's section is encoded and written out before the next is
+    # read, so only one file's text is held at a time. With --output the
+    # bytes go to a temp file beside it that is renamed into place at the
+    # end; otherwise they are collected and written to stdout in one go.
+    if output:
+        out_path = Path(output)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = out_path.with_name(f".{out_path.name}.{os.getpid()}.tmp")
+        out_fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    else:
+        out_fd = None
+        stdout_parts = []
+
+    # Per-file verbose lines, echoed in one write after the loop
+    verbose_log = []
+
+    def flush():
+        data = "".join(content_parts).encode("utf-8")
+        content_parts.clear()
+        if out_fd is None:
+            stdout_parts.append(data)
+            return
+        view = memoryview(data)
+        while view:
+            view = view[os.write(out_fd, view[:WRITE_CHUNK_SIZE]):]
+
+    try:
+        for file_path in file_list:
+            flush()
+            full_path = repo / file_path
+
+            # One stat() answers both "exists?" and "regular file?"
+            try:
+                st = os.stat(full_path)
+            except OSError:
+                st = None
+
+            if st is None:
+                if verbose:
+                    verbose_log.append(f"[READ-FILES] Warning: File not found: {file_path}")
+                content_parts.append(f"\n## File: {file_path}\n\n")
+                content_parts.append("**Status:** File not found\n\n")
+                files_missing += 1
+                continue
+
+            if not stat.S_ISREG(st.st_mode):
+                if verbose:
+                    verbose_log.append(f"[READ-FILES] Warning: Not a file: {file_path}")
+                content_parts.append(f"\n## File: {file_path}\n\n")
+                content_parts.append("**Status:** Not a regular file\n\n")
+                files_missing += 1
+                continue
+
+            # Determine language for code fence
+            lang = LANG_MAP.get(full_path.suffix.lower(), "")
+
+            try:
+                # Unbuffered read to EOF: sized from fstat, and still complete
+                # if the file grew since the stat above
+                with open(full_path, "rb", buffering=0) as f:
+                    data = f.readall()
+                file_content = data.decode("utf-8")
+                if "\r" in file_content:
+                    # Same newline translation read_text() applied
+                    file_content = file_content.replace("\r\n", "\n").replace("\r", "\n")
+                lines = file_content.splitlines()
+
+                content_parts.append(f"\n## File: {file_path}\n\n")
+                content_parts.append(f"**Lines:** {len(lines)}\n\n")
+                content_parts.append(f"```{lang}\n")
+
+                if line_numbers:
+                    # Add line numbers, joined in one pass
+                    width = len(str(len(lines)))
+                    content_parts.append("".join(
+                        f"{i:>{width}}: {line}\n" for i, line in enumerate(lines, 1)
+                    ))
+                else:
+                    content_parts.append(file_content)
+                    if not file_content.endswith("\n"):
+                        content_parts.append("\n")
+
+                content_parts.append("```\n")
+                files_read += 1
+
+                if verbose:
+                    verbose_log.append(f"[READ-FILES] Read: {file_path} ({len(lines)} lines)")
+
+            except UnicodeDecodeError:
+                content_parts.append(f"\n## File: {file_path}\n\n")
+                content_parts.append("**Status:** Binary file (cannot display)\n\n")
+                files_missing += 1
+            except Exception as e:
+                content_parts.append(f"\n## File: {file_path}\n\n")
+                content_parts.append(f"**Status:** Error reading file: {e}\n\n")
+                files_missing += 1
+
+        # Summary
+        content_parts.append("\n---\n")
+        content_parts.append(
+            f"\n**Summary:** {files_read} files read, {files_missing} files missing/skipped\n"
+        )
+        flush()
+    except BaseException:
+        if out_fd is not None:
+            os.close(out_fd)
+            tmp_path.unlink(missing_ok=True)
+        raise
+
+    if verbose_log:
+        typer.echo("\n".join(verbose_log))
+
+    # Output
+    if out_fd is not None:
+        os.close(out_fd)
+        os.replace(tmp_path, out_path)
+        typer.echo(f"[READ-FILES] Saved to: {output}")
+    else:
+        sys.stdout.flush()
+        sys.stdout.buffer.writelines(stdout_parts)
+        sys.stdout.buffer.write(b"\n")
+        sys.stdout.buffer.flush()
+
+    if files_read > 0:
+        typer.echo(f"[READ-FILES] Done: {files_read} files read")
+    else:
+        typer.echo("[READ-FILES] Warning: No files were read successfully", err=True)
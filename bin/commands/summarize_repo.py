@@ -0,0 +1,292 @@
+"""
+summarize-repo command: summarize a GitHub repository or local directory.
+
+Loaded on demand by agent-cli.py (see LAZY_COMMANDS there), so the clone and
+context helpers are only imported when this command runs.
+"""
+
+import contextlib
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Optional
+
+import typer
+from agent_cli import call_llm, extract_output, llm_cache_summary, new_task_id
+from github_utils import (
+    atomic_write,
+    build_repo_context,
+    clone_repository,
+    find_key_files,
+    get_cached_clone,
+    get_github_token,
+    get_head_sha,
+    load_cached_repo_context,
+    make_clone_temp_dir,
+    parse_github_url,
+    remove_tree_in_background,
+    save_cached_repo_context,
+)
+
+app = typer.Typer(add_completion=False)
+
+
+@app.command("summarize-repo")
+def summarize_repo(
+    url: Optional[str] = typer.Option(None, "--url", "-u", help="GitHub repository URL"),
+    path: Optional[str] = typer.Option(None, "--path", "-p", help="Local repository path"),
+    branch: Optional[str] = typer.Option(None, "--branch", "-b", help="Specific branch to analyze"),
+    pat: Optional[str] = typer.Option(
+        None, "--pat", help="GitHub PAT for private repos (or set GITHUB_PAT env)"
+    ),
+    output: Optional[str] = typer.Option(None, "--output", "-o", help="Output file path"),
+    task_id: Optional[str] = typer.Option(None, "--task-id", help="Task ID for tracking"),
+    keep_clone: bool = typer.Option(
+        False, "--keep-clone", help="Don't delete cloned repo (for debugging)"
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Use a temp clone and skip the LLM response cache"
+    ),
+    full_clone: bool = typer.Option(
+        False, "--full-clone", help="Clone with full history into a temp dir (default: shallow)"
+    ),
+    force: bool = typer.Option(
+        False, "--force", help="Rebuild the context and re-ask the LLM, refreshing both caches"
+    ),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
+):
+    """
+    Summarize a GitHub repository or local directory.
+
+    Analyzes repository structure, tech stack, key files, and dependencies.
+    Output is saved to artifacts or specified path.
+
+    GitHub clones are kept in ~/.openclaw/repo-cache/<owner>/<repo> and only
+    refreshed (shallow fetch) on later runs, and the LLM's answer for an
+    unchanged prompt is reused from ~/.openclaw/llm-cache. --no-cache uses a
+    throwaway clone and always calls the LLM. --force keeps the persistent
+    clone but rebuilds the analysis context and re-asks the LLM, replacing
+    the cached entries for this commit.
+
+    Clones are shallow and partial (tip commit only, blobs fetched on
+    demand). Use --full-clone, e.g. with --keep-clone, when the history is
+    needed afterwards; it always clones into a throwaway directory.
+
+    Examples:
+
+        # Summarize a GitHub repo
+        ./bin/agent-cli.py summarize-repo --url https://github.com/user/repo
+
+        # Summarize a specific branch
+        ./bin/agent-cli.py summarize-repo -u https://github.com/user/repo -b develop
+
+        # Summarize a private repo (PAT via flag)
+        ./bin/agent-cli.py summarize-repo -u https://github.com/user/private-repo --pat ghp_xxx
+
+        # Summarize a private repo (PAT via env)
+        GITHUB_PAT=ghp_xxx ./bin/agent-cli.py summarize-repo -u https://github.com/user/private-repo
+
+        # Summarize local directory
+        ./bin/agent-cli.py summarize-repo --path /path/to/repo
+    """
+    # Validate input
+    if not url and not path:
+        typer.echo("Error: Must specify either --url or --path", err=True)
+        raise typer.Exit(1)
+
+    if url and path:
+        typer.echo("Error: Cannot specify both --url and --path", err=True)
+        raise typer.Exit(1)
+
+    # Generate task ID (an explicit one also asks for the clone to be kept)
+    task_id_given = task_id is not None
+    if not task_id:
+        task_id = new_task_id()
+
+    temp_dir = None
+    repo_path = None
+    # Holds the repo cache entry's lock until the clone is no longer read
+    clone_lock = contextlib.ExitStack()
+    repo_name = "local-repo"
+    head_sha = None
+
+    try:
+        # Handle GitHub URL
+        if url:
+            try:
+                owner, repo_name, clone_url = parse_github_url(url)
+            except ValueError as e:
+                typer.echo(f"Error: {e}", err=True)
+                raise typer.Exit(1)
+
+            # Get PAT (from --pat flag or environment)
+            github_token = get_github_token(pat)
+
+            branch_info = f" (branch: {branch})" if branch else ""
+            auth_info = " [authenticated]" if github_token else ""
+            if verbose:
+                posix_spawn = getattr(subprocess, "_USE_POSIX_SPAWN", False)
+                typer.echo(f"[GITHUB] posix_spawn: {posix_spawn}")
+                typer.echo(f"[GITHUB] Cloning {owner}/{repo_name}{branch_info}{auth_info}...")
+
+            if no_cache or full_clone:
+                # Create temp directory and clone into it
+                temp_dir = make_clone_temp_dir()
+                repo_path = temp_dir / repo_name
+                cloned = clone_repository(
+                    clone_url, repo_path, branch, github_token, full_history=full_clone
+                )
+            else:
+                # Reuse (and refresh) the persistent clone
+                repo_path = clone_lock.enter_context(
+                    get_cached_clone(owner, repo_name, clone_url, branch, github_token)
+                )
+                cloned = repo_path is not None
+
+            if not cloned:
+                error_msg = "Error: Failed to clone repository."
+                if branch:
+                    error_msg += f" Branch '{branch}' may not exist."
+                elif not github_token:
+                    error_msg += " Is it public? Use --pat for private repos."
+                else:
+                    error_msg += " Check your PAT permissions."
+                typer.echo(error_msg, err=True)
+                raise typer.Exit(1)
+
+            # A clone is fully determined by its commit, so its context can be cached
+            head_sha = get_head_sha(repo_path)
+
+            if verbose:
+                typer.echo(f"[GITHUB] Cloned to: {repo_path}")
+
+        # Handle local path
+        else:
+            repo_path = Path(path).resolve()
+            if not repo_path.exists():
+                typer.echo(f"Error: Path does not exist: {path}", err=True)
+                raise typer.Exit(1)
+            if not repo_path.is_dir():
+                typer.echo(f"Error: Path is not a directory: {path}", err=True)
+                raise typer.Exit(1)
+            repo_name = repo_path.name
+
+            if verbose:
+                typer.echo(f"[GITHUB] Analyzing local directory: {repo_path}")
+
+        context = load_cached_repo_context(head_sha) if head_sha and not force else None
+        if context is not None:
+            if verbose:
+                typer.echo(f"[GITHUB] Using cached analysis context for {head_sha[:12]}")
+        else:
+            # Find key files
+            if verbose:
+                typer.echo("[GITHUB] Scanning for key files...")
+
+            key_files = find_key_files(repo_path)
+
+            if verbose:
+                found = [
+                    f"[GITHUB] Found {len(files)} {category} files"
+                    for category, files in key_files.items() if files
+                ]
+                if found:
+                    typer.echo("\n".join(found))
+
+            # Build context
+            if verbose:
+                typer.echo("[GITHUB] Building analysis context...")
+
+            context = build_repo_context(repo_path, key_files)
+            if head_sha:
+                save_cached_repo_context(head_sha, context)
+
+        # Build prompt for repo agent
+        source = url if url else str(repo_path)
+        branch_line = f"\n**Branch:** {branch}" if branch else ""
+        # No task ID in the prompt: it would make every prompt unique and
+        # defeat the LLM response cache
+        prompt = f"""## Repository Analysis Task
+
+Analyze this repository and provide a comprehensive summary.
+
+**Source:** {source}
+**Repository Name:** {repo_name}{branch_line}
+
+{context}
+
+## Instructions
+
+Analyze the repository structure, identify the tech stack, key files, and dependencies.
+Follow your output format exactly.
+
+Format your analysis between these markers:
+---OUTPUT---
+[Your complete analysis here]
+---END OUTPUT---
+"""
+
+        # Call github agent
+        if verbose:
+            typer.echo("[GITHUB] Calling github agent for analysis...")
+
+        response = call_llm(
+            prompt, "design", stop_marker="---END OUTPUT---",
+            use_cache=not no_cache, refresh_cache=force and not no_cache,
+        )
+        summary = extract_output(response)
+        if verbose:
+            typer.echo(f"[GITHUB] {llm_cache_summary()}")
+
+        # Determine output path
+        if output:
+            out_path = Path(output)
+        else:
+            artifacts_dir = Path.home() / ".openclaw" / "artifacts" / task_id
+            artifacts_dir.mkdir(parents=True, exist_ok=True)
+            out_path = artifacts_dir / "repo_summary.md"
+
+        # Save output
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(out_path, summary)
+
+        typer.echo(f"[GITHUB] Summary saved to: {out_path}")
+        typer.echo(f"[GITHUB] Task {task_id} completed.")
+
+        # Also print summary if no output file specified by user
+        if not output:
+            typer.echo("\n" + "=" * 60)
+            typer.echo(summary)
+
+    finally:
+        # Cleanup temp directory (keep clone if task_id is provided, unless explicitly told not to)
+        should_keep = keep_clone or task_id_given
+
+        # A cached clone is only copied (locally, no network) when it was asked
+        # for; otherwise the artifact just records which cache entry and commit
+        # were analyzed, without duplicating the repository on every run
+        with clone_lock:
+            if url and not temp_dir and head_sha and repo_path and repo_path.exists():
+                artifacts_dir = Path.home() / ".openclaw" / "artifacts" / task_id
+                clone_dest = artifacts_dir / "repo"
+                if should_keep and not clone_dest.exists():
+                    shutil.copytree(repo_path, clone_dest, symlinks=True)
+                    if verbose:
+                        typer.echo(f"[GITHUB] Clone saved to: {clone_dest}")
+                elif not should_keep:
+                    artifacts_dir.mkdir(parents=True, exist_ok=True)
+                    record = f"cache: {repo_path}\nhead: {head_sha}\n"
+                    atomic_write(artifacts_dir / "repo.txt", record)
+        if temp_dir and temp_dir.exists() and not should_keep:
+            if verbose:
+                typer.echo(f"[GITHUB] Cleaning up: {temp_dir}")
+            remove_tree_in_background(temp_dir)
+        elif temp_dir and should_keep:
+            # Move clone to artifacts directory for persistence
+            artifacts_dir = Path.home() / ".openclaw" / "artifacts" / task_id
+            artifacts_dir.mkdir(parents=True, exist_ok=True)
+            clone_dest = artifacts_dir / "repo"
+            if not clone_dest.exists() and repo_path and repo_path.exists():
+                shutil.move(str(repo_path), str(clone_dest))
+                if verbose:
+                    typer.echo(f"[GITHUB] Clone saved to: {clone_dest}")
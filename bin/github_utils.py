@@ -5,12 +5,22 @@ Functions for cloning, analyzing, and summarizing GitHub repositories.
 Used by the summarize-repo command in agent-cli.py.
 """
 
+import contextlib
+import functools
 import os
 import re
+import shutil
 import subprocess
 import tempfile
+import threading
+import uuid
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # Windows: cache entries are used without locking
+    fcntl = None
+
 # =============================================================================
 # Configuration
 # =============================================================================
@@ -18,8 +28,41 @@ from pathlib import Path
 # File reading limits
 MAX_FILE_SIZE = 100 * 1024  # 100KB per file
 MAX_TOTAL_CONTENT = 500 * 1024  # 500KB total
+MAX_CONTEXT_FILE_SIZE = 256 * 1024  # 256KB per --context file (head + tail)
 MAX_TREE_DEPTH = 4
 MAX_FILES_PER_CATEGORY = 5
+CLONE_TIMEOUT = 300  # seconds, per git clone/checkout step
+CONTEXT_SPOOL_SIZE = 64 * 1024  # build_repo_context spills to disk past this
+READ_WORKERS = 8  # concurrent key-file reads in build_repo_context
+
+# Persistent clones reused across runs: <REPO_CACHE_DIR>/<owner>/<repo>,
+# least recently used repos are evicted past REPO_CACHE_MAX_BYTES. Each entry
+# is guarded by a flock on <owner>/<repo>.lock while it is refreshed or read
+REPO_CACHE_DIR = Path.home() / ".openclaw" / "repo-cache"
+REPO_CACHE_MAX_BYTES = 2 * 1024 ** 3
+
+# build_repo_context output for cloned repos, keyed by HEAD commit sha
+REPO_CONTEXT_CACHE_DIR = Path.home() / ".openclaw" / "cache" / "repo-context"
+REPO_CONTEXT_CACHE_MAX_ENTRIES = 100
+
+# Throwaway clones live under ~/.openclaw too (not the system temp dir, often
+# a separate tmpfs), so moving one into artifacts/ is a rename, not a copy
+CLONE_TMP_DIR = Path.home() / ".openclaw" / "tmp"
+
+# Temp clones are renamed to <parent>/<TRASH_PREFIX><uuid> and deleted in the
+# background (see remove_tree_in_background)
+TRASH_PREFIX = ".clawcrew-trash-"
+
+# Directories never shown in the file tree (hidden dirs are skipped too)
+SKIP_DIRS = frozenset({
+    '.git', 'node_modules', '__pycache__', '.venv', 'venv',
+    'dist', 'build', '.tox', '.pytest_cache', '.mypy_cache',
+    'target', 'vendor',
+})
+
+# Sparse-checkout patterns for clones: everything except the skipped dirs
+# (at any depth), whose blobs are then never fetched
+SPARSE_CHECKOUT_PATTERNS = ["/*"] + [f"!{name}/" for name in sorted(SKIP_DIRS - {".git"})]
 
 # Priority files to always try to read
 PRIORITY_FILES = [
@@ -56,6 +99,27 @@ CONFIG_FILES = [
     "Makefile", "Dockerfile", "docker-compose.yml", ".env.example",
 ]
 
+# HTTPS (https://github.com/user/repo) or SSH (git@github.com:user/repo.git) URL
+GITHUB_URL_RE = re.compile(r'(?:https://github\.com/|git@github\.com:)([^/]+)/([^/.]+)(?:\.git)?/?')
+
+# Source directories and languages sampled for "core" files
+CORE_DIRS = ["src", "lib", "pkg", "internal", "app"]
+CORE_SUFFIXES = (".py", ".js", ".ts", ".go", ".rs")
+
+# Entry point patterns split into (directory, file name) once, and every
+# subdirectory find_key_files may look into
+ENTRY_POINT_PARTS = tuple(
+    (name.rpartition("/")[0], name.rpartition("/")[2]) for name in ENTRY_POINT_PATTERNS
+)
+KEY_FILE_SUBDIRS = tuple(sorted(
+    {"docs", *CORE_DIRS, *(rel_dir for rel_dir, _ in ENTRY_POINT_PARTS if rel_dir)}
+))
+
+# Generated/bundled sources (*.min.js, *.bundle.js, *.generated.ts, ...)
+# that are not worth sampling as "core" files
+GENERATED_RE = re.compile(r"\.(?:min|bundle|generated)\.")
+SNIFF_SIZE = 512  # bytes checked for NUL to detect binary files
+
 # =============================================================================
 # Functions
 # =============================================================================
@@ -80,6 +144,7 @@ def get_github_token(provided_pat: str = None) -> str:
     return os.environ.get("GITHUB_PAT") or os.environ.get("GH_TOKEN")
 
 
+@functools.lru_cache(maxsize=32)
 def parse_github_url(url: str) -> tuple:
     """
     Parse GitHub URL into components.
@@ -89,6 +154,9 @@ def parse_github_url(url: str) -> tuple:
         https://github.com/user/repo.git
         git@github.com:user/repo.git
 
+    Results are memoized (the function is pure), so scripts that resolve
+    the same URL repeatedly in one process only match it once.
+
     Args:
         url: GitHub repository URL
 
@@ -98,88 +166,422 @@ def parse_github_url(url: str) -> tuple:
     Raises:
         ValueError: If URL format is not recognized
     """
-    # HTTPS format
-    https_match = re.match(r'https://github\.com/([^/]+)/([^/.]+)(?:\.git)?/?', url)
-    if https_match:
-        owner, repo = https_match.groups()
-        return owner, repo, f"https://github.com/{owner}/{repo}.git"
-
-    # SSH format
-    ssh_match = re.match(r'git@github\.com:([^/]+)/([^/.]+)(?:\.git)?', url)
-    if ssh_match:
-        owner, repo = ssh_match.groups()
+    match = GITHUB_URL_RE.match(url)
+    if match:
+        owner, repo = match.groups()
         return owner, repo, f"https://github.com/{owner}/{repo}.git"
 
     raise ValueError(f"Unrecognized GitHub URL format: {url}")
 
 
-def clone_repository(clone_url: str, target_dir: Path, branch: str = None, pat: str = None) -> bool:
+@functools.lru_cache(maxsize=None)
+def _git_executable() -> str:
+    """
+    Absolute path of git, resolved once.
+
+    Passing a path (rather than a bare name) lets subprocess launch git via
+    posix_spawn instead of fork+exec.
+    """
+    return shutil.which("git") or "git"
+
+
+def _run_git(args: list, timeout: int) -> bool:
+    """
+    Run a git command quietly, returning True if it exited with status 0.
+
+    GIT_TERMINAL_PROMPT=0 makes git fail at once on missing credentials
+    instead of waiting for a username until the timeout.
+    """
+    result = subprocess.run(
+        [_git_executable(), *args],
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+        env={**os.environ, "GIT_TERMINAL_PROMPT": "0"},
+        close_fds=False,  # required for the posix_spawn fast path
+    )
+    return result.returncode == 0
+
+
+def _auth_url(clone_url: str, pat: str = None) -> str:
+    """Insert a PAT into an HTTPS GitHub URL (https://<pat>@github.com/...)."""
+    if pat and clone_url.startswith("https://github.com/"):
+        return clone_url.replace("https://github.com/", f"https://{pat}@github.com/")
+    return clone_url
+
+
+def clone_repository(
+    clone_url: str,
+    target_dir: Path,
+    branch: str = None,
+    pat: str = None,
+    full_history: bool = False,
+) -> bool:
     """
     Clone a repository with shallow depth.
 
+    Only the requested branch's tip is fetched (no history, no tags). The
+    clone is partial (--filter=blob:none, git >= 2.19) and checked out
+    sparsely with SPARSE_CHECKOUT_PATTERNS (git >= 2.35), so blobs under
+    SKIP_DIRS are never downloaded. Servers without filter support fall
+    back to a normal shallow clone, and older git falls back to a full
+    checkout.
+
+    With full_history, a regular clone is made instead (all history and
+    blobs, full checkout) for callers that need to inspect the log.
+
     Args:
         clone_url: Git clone URL
         target_dir: Directory to clone into
         branch: Specific branch to clone (default: repo's default branch)
         pat: GitHub Personal Access Token for private repos
+        full_history: Make a complete clone rather than a shallow one
 
     Returns:
         True if successful, False otherwise
     """
     try:
-        # Insert PAT into URL for authentication
-        # https://github.com/... -> https://<pat>@github.com/...
-        auth_url = clone_url
-        if pat and clone_url.startswith("https://github.com/"):
-            auth_url = clone_url.replace("https://github.com/", f"https://{pat}@github.com/")
+        auth_url = _auth_url(clone_url, pat)
 
-        cmd = ["git", "clone", "--depth", "1"]
+        if full_history:
+            cmd = ["clone"]
+        else:
+            cmd = [
+                "clone", "--depth", "1", "--single-branch", "--no-tags",
+                "--filter=blob:none", "--no-checkout",
+            ]
         if branch:
             cmd.extend(["--branch", branch])
         cmd.extend([auth_url, str(target_dir)])
 
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=120,
+        if full_history:
+            return _run_git(cmd, timeout=CLONE_TIMEOUT)
+        if not _run_git(cmd, timeout=CLONE_TIMEOUT):
+            return False
+
+        repo = str(target_dir)
+        _run_git(
+            ["-C", repo, "sparse-checkout", "set", "--no-cone", *SPARSE_CHECKOUT_PATTERNS],
+            timeout=30,
         )
-        return result.returncode == 0
+        return _run_git(["-C", repo, "checkout"], timeout=CLONE_TIMEOUT)
     except subprocess.TimeoutExpired:
         return False
     except FileNotFoundError:
         return False
 
 
-def generate_file_tree(repo_path: Path, max_depth: int = MAX_TREE_DEPTH) -> str:
+@contextlib.contextmanager
+def _cache_entry_lock(cache_path: Path, blocking: bool = True):
     """
-    Generate a file tree representation of the repository.
+    Hold an exclusive flock on a repo cache entry's <repo>.lock file.
+
+    Args:
+        cache_path: Cached clone directory
+        blocking: Wait for the lock instead of giving up when it is held
+
+    Yields:
+        True while the lock is held, False if blocking is off and another
+        process holds it
+    """
+    if fcntl is None:
+        yield True
+        return
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(cache_path.with_name(cache_path.name + ".lock"), os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+            locked = True
+        except BlockingIOError:
+            locked = False
+        yield locked
+    finally:
+        os.close(fd)  # releases the lock
+
+
+@contextlib.contextmanager
+def get_cached_clone(
+    owner: str, repo: str, clone_url: str, branch: str = None, pat: str = None
+):
+    """
+    Get an up-to-date clone from the persistent repo cache.
+
+    An existing clone is refreshed with a shallow fetch of the branch (or
+    the remote HEAD) and `reset --hard FETCH_HEAD`; otherwise it is cloned
+    with clone_repository. The PAT is only in the remote URL while git
+    talks to GitHub (blobs are fetched lazily), never left in the cache.
+
+    Used as a context manager: the entry stays locked until the block exits,
+    so concurrent runs can neither refresh nor evict a clone being read.
+
+    Args:
+        owner: Repository owner
+        repo: Repository name
+        clone_url: Git clone URL
+        branch: Specific branch (default: repo's default branch)
+        pat: GitHub Personal Access Token for private repos
+
+    Yields:
+        Path to the cached clone, or None if it could not be cloned
+    """
+    cache_path = REPO_CACHE_DIR / owner / repo
+    with _cache_entry_lock(cache_path):
+        cloned = _refresh_cached_clone(cache_path, clone_url, branch, pat)
+        if cloned:
+            _record_clone_size(cache_path)
+            _evict_repo_cache(keep=cache_path)
+        yield cache_path if cloned else None
+
+
+def _refresh_cached_clone(cache_path: Path, clone_url: str, branch: str, pat: str) -> bool:
+    """Fetch into (or create) a cached clone; the caller holds its lock."""
+    repo_dir = str(cache_path)
+
+    try:
+        if (cache_path / ".git").is_dir():
+            _run_git(
+                ["-C", repo_dir, "remote", "set-url", "origin", _auth_url(clone_url, pat)],
+                timeout=30,
+            )
+            try:
+                refreshed = _run_git(
+                    ["-C", repo_dir, "fetch", "--depth", "1", "--no-tags", "--filter=blob:none",
+                     "origin", branch or "HEAD"],
+                    timeout=CLONE_TIMEOUT,
+                ) and _run_git(
+                    ["-C", repo_dir, "reset", "--hard", "--quiet", "FETCH_HEAD"],
+                    timeout=CLONE_TIMEOUT,
+                )
+            finally:
+                _run_git(["-C", repo_dir, "remote", "set-url", "origin", clone_url], timeout=30)
+            if refreshed:
+                os.utime(cache_path)  # mark as recently used for LRU eviction
+                return True
+            # Broken or diverged cache entry: start over
+            shutil.rmtree(cache_path, ignore_errors=True)
+
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        if not clone_repository(clone_url, cache_path, branch, pat):
+            shutil.rmtree(cache_path, ignore_errors=True)
+            return False
+        _run_git(["-C", repo_dir, "remote", "set-url", "origin", clone_url], timeout=30)
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return False
+    return True
+
+
+def _clone_size_path(cache_path: Path) -> Path:
+    """Sidecar file holding a cached clone's size in bytes (<repo>.size)."""
+    return cache_path.with_name(cache_path.name + ".size")
+
+
+def _record_clone_size(cache_path: Path) -> int:
+    """Measure a cached clone once and store its size for _evict_repo_cache."""
+    total = 0
+    for root, _, files in os.walk(cache_path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    atomic_write(_clone_size_path(cache_path), str(total))
+    return total
+
+
+def _evict_repo_cache(keep: Path) -> None:
+    """
+    Delete least recently used cached clones until under REPO_CACHE_MAX_BYTES.
+
+    Sizes come from the <repo>.size sidecars written when each clone was
+    cloned or refreshed, so only clones without one are walked. Entries
+    locked by another run (being refreshed or read) are skipped.
+    """
+    clones = []
+    for owner_dir in _scan_dir(REPO_CACHE_DIR).values():
+        for repo_dir in _scan_dir(owner_dir.path).values():
+            if repo_dir.is_dir():
+                clones.append(Path(repo_dir.path))
+
+    sizes = {}
+    for clone in clones:
+        try:
+            sizes[clone] = int(_clone_size_path(clone).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            sizes[clone] = _record_clone_size(clone)
+
+    total_size = sum(sizes.values())
+    for clone in sorted(clones, key=lambda c: c.stat().st_mtime):
+        if total_size <= REPO_CACHE_MAX_BYTES:
+            break
+        if clone == keep:
+            continue
+        with _cache_entry_lock(clone, blocking=False) as locked:
+            if not locked:
+                continue
+            shutil.rmtree(clone, ignore_errors=True)
+            _clone_size_path(clone).unlink(missing_ok=True)
+        total_size -= sizes[clone]
+
+
+def make_clone_temp_dir() -> Path:
+    """
+    Create a fresh directory for a throwaway clone under CLONE_TMP_DIR.
+
+    Returns:
+        Path to the new, empty directory
+    """
+    CLONE_TMP_DIR.mkdir(parents=True, exist_ok=True)
+    return Path(tempfile.mkdtemp(prefix="clawcrew-repo-", dir=CLONE_TMP_DIR))
+
+
+def remove_tree_in_background(path: Path) -> None:
+    """
+    Delete a directory tree without waiting for the unlinks to finish.
+
+    The tree is renamed to a TRASH_PREFIX sibling (one rename, so `path` is
+    gone at once) and handed to a detached `rm -rf` that outlives this
+    process. Trash left behind by an interrupted `rm` in the same parent
+    directory is swept up by the same call. Without `rm` (Windows), a
+    daemon thread runs shutil.rmtree; whatever it hasn't removed when the
+    process exits is picked up by the next call's sweep.
+
+    Args:
+        path: Directory to delete
+    """
+    path = Path(path)
+    trash = path.with_name(f"{TRASH_PREFIX}{uuid.uuid4().hex}")
+    try:
+        os.rename(path, trash)
+    except OSError:
+        trash = path
+
+    # Include any trash left behind by earlier runs
+    targets = [str(trash)] + [
+        entry.path for name, entry in _scan_dir(path.parent).items()
+        if name.startswith(TRASH_PREFIX) and entry.path != str(trash)
+    ]
+
+    rm = shutil.which("rm") if os.name == "posix" else None
+    if rm:
+        subprocess.Popen(
+            [rm, "-rf", "--", *targets],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,  # not killed with our process group
+        )
+        return
+
+    def remove_all():
+        for target in targets:
+            shutil.rmtree(target, ignore_errors=True)
+
+    threading.Thread(target=remove_all, daemon=True).start()
+
+
+def get_head_sha(repo_path: Path) -> str:
+    """
+    Get the commit sha checked out in a git repository.
 
     Args:
         repo_path: Path to repository root
-        max_depth: Maximum directory depth to traverse
 
     Returns:
-        String representation of file tree
+        HEAD commit sha, or None if it is not a git repository
     """
-    lines = []
+    try:
+        result = subprocess.run(
+            [_git_executable(), "-C", str(repo_path), "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+            close_fds=False,  # required for the posix_spawn fast path
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return None
+    sha = result.stdout.strip()
+    return sha if result.returncode == 0 and sha else None
+
+
+def load_cached_repo_context(sha: str) -> str:
+    """
+    Get a previously built repo context for a commit.
+
+    Args:
+        sha: HEAD commit sha the context was built from
+
+    Returns:
+        Cached context string, or None on a cache miss
+    """
+    cache_file = REPO_CONTEXT_CACHE_DIR / f"{sha}.md"
+    try:
+        content = cache_file.read_text(encoding="utf-8")
+        os.utime(cache_file)  # mark as recently used for LRU eviction
+    except OSError:
+        return None
+    return content
 
-    def walk(path: Path, prefix: str = "", depth: int = 0):
+
+def save_cached_repo_context(sha: str, context: str) -> None:
+    """
+    Store a repo context for a commit, evicting least recently used entries.
+
+    The file is written to a temp file and renamed into place, so readers
+    never see a partial entry. Cache failures are ignored.
+
+    Args:
+        sha: HEAD commit sha the context was built from
+        context: Output of build_repo_context
+    """
+    try:
+        REPO_CONTEXT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=REPO_CONTEXT_CACHE_DIR, suffix=".tmp", delete=False
+        ) as tmp:
+            tmp.write(context)
+        os.replace(tmp.name, REPO_CONTEXT_CACHE_DIR / f"{sha}.md")
+
+        with os.scandir(REPO_CONTEXT_CACHE_DIR) as it:
+            entries = [e for e in it if e.name.endswith(".md")]
+        if len(entries) > REPO_CONTEXT_CACHE_MAX_ENTRIES:
+            entries.sort(key=lambda e: e.stat().st_mtime)
+            for entry in entries[:len(entries) - REPO_CONTEXT_CACHE_MAX_ENTRIES]:
+                os.unlink(entry.path)
+    except OSError:
+        pass
+
+
+def iter_file_tree(repo_path: Path, max_depth: int = MAX_TREE_DEPTH):
+    """
+    Yield the lines of the repository file tree, one at a time.
+
+    Uses os.scandir so entry types come from the cached DirEntry data
+    instead of a stat() per is_dir()/is_file() call. Only the entries of
+    the directories on the current path are held in memory.
+
+    Args:
+        repo_path: Path to repository root
+        max_depth: Maximum directory depth to traverse
+
+    Yields:
+        Tree lines without trailing newlines
+    """
+    def walk(path, prefix: str = "", depth: int = 0):
         if depth > max_depth:
             return
 
-        # Skip hidden directories and common noise
-        skip_dirs = {'.git', 'node_modules', '__pycache__', '.venv', 'venv',
-                     'dist', 'build', '.tox', '.pytest_cache', '.mypy_cache',
-                     'target', 'vendor'}
-
         try:
-            entries = sorted(path.iterdir(), key=lambda x: (not x.is_dir(), x.name.lower()))
+            with os.scandir(path) as it:
+                entries = sorted(it, key=lambda e: (not e.is_dir(), e.name.lower()))
         except PermissionError:
             return
 
         # Filter and limit entries
-        dirs = [e for e in entries if e.is_dir() and e.name not in skip_dirs and not e.name.startswith('.')]
+        dirs = [
+            e for e in entries
+            if e.is_dir() and e.name not in SKIP_DIRS and not e.name.startswith('.')
+        ]
         files = [e for e in entries if e.is_file() and not e.name.startswith('.')]
 
         # Limit files shown per directory
@@ -190,30 +592,77 @@ def generate_file_tree(repo_path: Path, max_depth: int = MAX_TREE_DEPTH) -> str:
             truncated_files = False
 
         all_entries = dirs + files
+        last_dir = len(dirs) - 1
 
         for i, entry in enumerate(all_entries):
             is_last = (i == len(all_entries) - 1) and not truncated_files
             connector = "└── " if is_last else "├── "
 
-            if entry.is_dir():
-                lines.append(f"{prefix}{connector}{entry.name}/")
+            if i <= last_dir:
+                yield f"{prefix}{connector}{entry.name}/"
                 extension = "    " if is_last else "│   "
-                walk(entry, prefix + extension, depth + 1)
+                yield from walk(entry.path, prefix + extension, depth + 1)
             else:
-                lines.append(f"{prefix}{connector}{entry.name}")
+                yield f"{prefix}{connector}{entry.name}"
 
         if truncated_files:
-            lines.append(f"{prefix}└── ... ({len(entries) - len(dirs) - 10} more files)")
+            yield f"{prefix}└── ... ({len(entries) - len(dirs) - 10} more files)"
+
+    yield f"{repo_path.name}/"
+    yield from walk(repo_path)
+
+
+def generate_file_tree(repo_path: Path, max_depth: int = MAX_TREE_DEPTH) -> str:
+    """
+    Generate a file tree representation of the repository.
+
+    Args:
+        repo_path: Path to repository root
+        max_depth: Maximum directory depth to traverse
+
+    Returns:
+        String representation of file tree
+    """
+    return "\n".join(iter_file_tree(repo_path, max_depth))
+
+
+def _scan_dir(path: Path) -> dict:
+    """Map entry names to DirEntry objects for one directory (empty if unreadable)."""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name: entry for entry in it}
+    except OSError:
+        return {}
 
-    lines.append(f"{repo_path.name}/")
-    walk(repo_path)
-    return "\n".join(lines)
+
+def _is_core_candidate(entry: os.DirEntry) -> bool:
+    """
+    Check that a core-dir file is small, text, and not generated.
+
+    Minified/bundled/generated names and files of MAX_FILE_SIZE or more are
+    rejected without reading; the rest are rejected if their first
+    SNIFF_SIZE bytes contain a NUL byte.
+    """
+    if GENERATED_RE.search(entry.name):
+        return False
+    try:
+        if not entry.is_file() or entry.stat().st_size >= MAX_FILE_SIZE:
+            return False
+        with open(entry.path, "rb") as f:
+            return b"\x00" not in f.read(SNIFF_SIZE)
+    except OSError:
+        return False
 
 
 def find_key_files(repo_path: Path) -> dict:
     """
     Find key files in the repository organized by category.
 
+    Each directory of interest is listed once with os.scandir (the
+    subdirectories concurrently) and all name checks are dict lookups,
+    instead of one stat/glob per candidate.
+    Core-dir samples skip binary, oversized and generated files.
+
     Args:
         repo_path: Path to repository root
 
@@ -227,40 +676,63 @@ def find_key_files(repo_path: Path) -> dict:
         "core": [],
     }
 
+    listings = {"": _scan_dir(repo_path)}
+
+    # The handful of subdirectories we look into are fixed; list the ones
+    # that exist concurrently (scandir releases the GIL) rather than one by one
+    subdirs = [
+        name for name in KEY_FILE_SUBDIRS
+        if name in listings[""] and listings[""][name].is_dir()
+    ]
+    if len(subdirs) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(len(subdirs), READ_WORKERS)) as executor:
+            listings.update(zip(subdirs, executor.map(lambda d: _scan_dir(repo_path / d), subdirs)))
+
+    def listing(rel_dir: str) -> dict:
+        if rel_dir not in listings:
+            parent = listings[""].get(rel_dir)
+            listings[rel_dir] = _scan_dir(repo_path / rel_dir) if parent and parent.is_dir() else {}
+        return listings[rel_dir]
+
+    top_level = listings[""]
+
     # Find documentation
     for name in PRIORITY_FILES:
-        path = repo_path / name
-        if path.exists():
-            result["documentation"].append(path)
+        if name in top_level:
+            result["documentation"].append(repo_path / name)
 
     # Check docs directory
-    docs_dir = repo_path / "docs"
-    if docs_dir.exists():
-        for md_file in list(docs_dir.glob("*.md"))[:3]:
-            result["documentation"].append(md_file)
+    docs = [name for name in listing("docs") if name.endswith(".md") and not name.startswith(".")]
+    for name in docs[:3]:
+        result["documentation"].append(repo_path / "docs" / name)
 
     # Find config files
     for name in CONFIG_FILES:
-        path = repo_path / name
-        if path.exists():
-            result["config"].append(path)
-
-    # Find entry points (simplified - not using glob patterns)
-    for name in ENTRY_POINT_PATTERNS:
-        if '*' not in name:  # Skip glob patterns for simplicity
-            path = repo_path / name
-            if path.exists():
-                result["entry_points"].append(path)
-
-    # Find core files in src/, lib/, pkg/, internal/
-    core_dirs = ["src", "lib", "pkg", "internal", "app"]
-    for dir_name in core_dirs:
-        dir_path = repo_path / dir_name
-        if dir_path.exists() and dir_path.is_dir():
-            # Get first few Python/JS/Go/Rust files
-            for pattern in ["*.py", "*.js", "*.ts", "*.go", "*.rs"]:
-                files = list(dir_path.glob(pattern))[:2]
-                result["core"].extend(files)
+        if name in top_level:
+            result["config"].append(repo_path / name)
+
+    # Find entry points (top-level names, or one directory deep like src/main.py)
+    for (rel_dir, file_name), name in zip(ENTRY_POINT_PARTS, ENTRY_POINT_PATTERNS):
+        if file_name in listing(rel_dir):
+            result["entry_points"].append(repo_path / name)
+
+    # Find core files in src/, lib/, pkg/, internal/: first 2 files per language
+    for dir_name in CORE_DIRS:
+        entries = listing(dir_name)
+        if not entries:
+            continue
+        by_suffix = {suffix: [] for suffix in CORE_SUFFIXES}
+        for name in entries:
+            if name.startswith("."):
+                continue
+            suffix = name[name.rfind("."):] if "." in name else ""
+            matches = by_suffix.get(suffix)
+            if matches is not None and len(matches) < 2 and _is_core_candidate(entries[name]):
+                matches.append(repo_path / dir_name / name)
+        for suffix in CORE_SUFFIXES:
+            result["core"].extend(by_suffix[suffix])
 
     # Limit each category
     for category in result:
@@ -273,6 +745,8 @@ def read_file_safe(path: Path, max_size: int = MAX_FILE_SIZE) -> str:
     """
     Read a file safely with size limits.
 
+    Only the first `max_size` bytes are read from disk.
+
     Args:
         path: Path to file
         max_size: Maximum bytes to read
@@ -281,59 +755,182 @@ def read_file_safe(path: Path, max_size: int = MAX_FILE_SIZE) -> str:
         File content or error message
     """
     try:
-        size = path.stat().st_size
-        if size > max_size:
-            return f"[File truncated - {size} bytes, showing first {max_size}]\n" + \
-                   path.read_text(encoding="utf-8", errors="replace")[:max_size]
-        return path.read_text(encoding="utf-8", errors="replace")
+        # Read at most one byte past the limit: enough to detect truncation
+        # without loading (and decoding) the rest of a large file
+        with open(path, "rb") as f:
+            raw = f.read(max_size + 1)
+            if len(raw) > max_size:
+                size = os.fstat(f.fileno()).st_size
+                return f"[File truncated - {size} bytes, showing first {max_size}]\n" + \
+                       raw[:max_size].decode("utf-8", errors="replace")
+        return raw.decode("utf-8", errors="replace")
     except Exception as e:
         return f"[Error reading file: {e}]"
 
 
-def build_repo_context(repo_path: Path, key_files: dict) -> str:
+def read_file_capped(path: Path, max_bytes: int = MAX_CONTEXT_FILE_SIZE) -> str:
     """
-    Build the context string for LLM analysis.
+    Read a file, keeping only its head and tail if it is too large.
+
+    Files up to `max_bytes` are returned whole. Larger files keep the first
+    and last `max_bytes // 2` bytes around a truncation marker, so neither
+    the file nor the prompt built from it grows with the input size.
 
     Args:
-        repo_path: Path to repository
-        key_files: Dict of categorized file paths
+        path: Path to file
+        max_bytes: Maximum bytes to read
 
     Returns:
-        Formatted context string
+        File content (possibly truncated)
+
+    Raises:
+        OSError: If the file cannot be read
     """
-    sections = []
-    total_size = 0
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size <= max_bytes:
+            return f.read().decode("utf-8", errors="replace")
 
-    # File tree
-    tree = generate_file_tree(repo_path)
-    sections.append(f"## File Tree\n\n```\n{tree}\n```")
-    total_size += len(tree)
+        half = max_bytes // 2
+        head = f.read(half)
+        f.seek(-half, os.SEEK_END)
+        tail = f.read(half)
+
+    omitted = size - len(head) - len(tail)
+    return (
+        head.decode("utf-8", errors="replace")
+        + f"\n...[TRUNCATED {omitted} bytes]...\n"
+        + tail.decode("utf-8", errors="replace")
+    )
 
-    # Read files by category
-    for category, files in key_files.items():
-        if not files:
-            continue
 
-        category_title = category.replace("_", " ").title()
-        file_contents = []
+def _temp_path_for(path: Path) -> Path:
+    """
+    Temp file name next to `path` for an atomic replace.
 
-        for file_path in files:
-            if total_size >= MAX_TOTAL_CONTENT:
-                break
+    Unique per process and thread, so concurrent writers of the same path
+    (e.g. worker threads filling a cache) never share or truncate each
+    other's temp file.
+    """
+    return path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
 
-            relative_path = file_path.relative_to(repo_path)
-            content = read_file_safe(file_path)
-            content_size = len(content)
 
-            if total_size + content_size > MAX_TOTAL_CONTENT:
-                remaining = MAX_TOTAL_CONTENT - total_size
-                content = content[:remaining] + "\n[Content truncated due to size limits]"
-                content_size = remaining
+def atomic_write(path: Path, data: str) -> None:
+    """
+    Write a text file atomically.
 
-            file_contents.append(f"### {relative_path}\n\n```\n{content}\n```")
-            total_size += content_size
+    The data goes to a temp file next to `path` which is then renamed over
+    it, so readers (and a crash mid-write) never see a truncated file. It is
+    encoded once and written as bytes, skipping the text layer's buffering
+    and newline pass (newlines are written as-is, `\n` on every platform).
 
-        if file_contents:
-            sections.append(f"## {category_title}\n\n" + "\n\n".join(file_contents))
+    Args:
+        path: Destination file
+        data: Text to write (UTF-8)
+    """
+    path = Path(path)
+    tmp_path = _temp_path_for(path)
+    try:
+        tmp_path.write_bytes(data.encode("utf-8"))
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def atomic_write_chunks(path: Path, chunks) -> None:
+    """
+    Write a text file atomically from an iterable of strings.
+
+    Like atomic_write, but the chunks are written as they are produced, so
+    a streamed body (e.g. a subprocess's output) is never held in memory
+    as one string.
+
+    Args:
+        path: Destination file
+        chunks: Iterable of text chunks (written as UTF-8, newlines as-is)
+    """
+    path = Path(path)
+    tmp_path = _temp_path_for(path)
+    try:
+        with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def build_repo_context(repo_path: Path, key_files: dict) -> str:
+    """
+    Build the context string for LLM analysis.
+
+    Args:
+        repo_path: Path to repository
+        key_files: Dict of categorized file paths
+
+    Returns:
+        Formatted context string
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    total_size = 0
+
+    # Read all key files concurrently; results are consumed below in
+    # category order, so the output is the same as reading sequentially
+    executor = ThreadPoolExecutor(max_workers=READ_WORKERS)
+    futures = {
+        file_path: executor.submit(read_file_safe, file_path)
+        for files in key_files.values()
+        for file_path in files
+    }
 
-    return "\n\n".join(sections)
+    # Sections are streamed into a spooled buffer (in memory up to
+    # CONTEXT_SPOOL_SIZE, then on disk) instead of a list of strings + join
+    with tempfile.SpooledTemporaryFile(
+        max_size=CONTEXT_SPOOL_SIZE, mode="w+", encoding="utf-8", newline=""
+    ) as buf, executor:
+        # File tree, written line by line as it is walked
+        buf.write("## File Tree\n\n```")
+        for line in iter_file_tree(repo_path):
+            buf.write("\n")
+            buf.write(line)
+            total_size += len(line) + 1
+        buf.write("\n```")
+        total_size -= 1  # newlines only go between tree lines
+
+        # Read files by category
+        for category, files in key_files.items():
+            if not files:
+                continue
+
+            category_title = category.replace("_", " ").title()
+            wrote_header = False
+
+            for file_path in files:
+                if total_size >= MAX_TOTAL_CONTENT:
+                    break
+
+                relative_path = file_path.relative_to(repo_path)
+                content = futures[file_path].result()
+                content_size = len(content)
+
+                if total_size + content_size > MAX_TOTAL_CONTENT:
+                    remaining = MAX_TOTAL_CONTENT - total_size
+                    content = content[:remaining] + "\n[Content truncated due to size limits]"
+                    content_size = remaining
+
+                buf.write("\n\n" if wrote_header else f"\n\n## {category_title}\n\n")
+                wrote_header = True
+                buf.write(f"### {relative_path}\n\n```\n")
+                buf.write(content)
+                buf.write("\n```")
+                total_size += content_size
+
+        # Drop reads left unused by the size budget that have not started yet
+        for future in futures.values():
+            future.cancel()
+
+        buf.seek(0)
+        return buf.read()
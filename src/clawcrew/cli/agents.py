@@ -7,7 +7,7 @@ import typer
 from rich.console import Console
 from rich.table import Table
 
-from clawcrew.core.config import AGENT_WORKSPACES, get_base_dir, get_workspace
+from clawcrew.core.config import AGENT_WORKSPACES, get_base_dir, get_workspace, list_entry_names
 from clawcrew.core.memory import load_memory, clear_memory as do_clear_memory
 
 console = Console()
@@ -20,15 +20,14 @@ def agents():
     table.add_column("Workspace", style="dim")
     table.add_column("Status")
 
-    base_dir = get_base_dir()
+    # One directory listing per location instead of two stats per agent
+    dev_names = list_entry_names(get_base_dir())
+    installed_names = list_entry_names(Path.home() / ".openclaw")
 
     for agent, ws_name in AGENT_WORKSPACES.items():
-        ws = base_dir / ws_name
-        installed_ws = Path.home() / ".openclaw" / ws_name
-
-        if ws.exists():
+        if ws_name in dev_names:
             status = "[green]✓ (dev)[/green]"
-        elif installed_ws.exists():
+        elif ws_name in installed_names:
             status = "[green]✓ (installed)[/green]"
         else:
             status = "[red]✗ not found[/red]"
@@ -1,6 +1,5 @@
 """Chain command - run multiple agents in sequence with automatic context passing."""
 
-import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
@@ -10,8 +9,11 @@ from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from clawcrew.core.config import get_workspace, get_artifacts_dir
-from clawcrew.core.memory import load_memory, save_memory
-from clawcrew.core.llm import call_llm, extract_output, LLMError
+from clawcrew.core.memory import load_memory, new_task_id, save_memory
+from clawcrew.core.llm import (
+    call_llm, extract_lesson, extract_output, strip_lesson, LESSON_INSTRUCTION, LLMError,
+)
+from clawcrew.utils.github import atomic_write
 
 console = Console()
 
@@ -31,8 +33,9 @@ def chain(
         clawcrew chain "create REST API for users" design code test
         clawcrew chain "fix bug in auth module" design code -o ./fix-auth/
     """
-    # Generate task ID
-    task_id = datetime.now().strftime("%Y%m%d-%H%M%S") + "-" + str(uuid.uuid4())[:8]
+    # Generate task ID; its timestamp also ends every step's memory window
+    now = datetime.now()
+    task_id = new_task_id(now)
 
     # Setup output directory
     if output_dir:
@@ -74,51 +77,61 @@ def chain(
             if context_files:
                 context_content = "\n\n## Previous Agent Outputs\n"
                 for ctx_file in context_files:
-                    content = ctx_file.read_text(encoding="utf-8")
+                    # Only the first 2000 characters are used, so read at
+                    # most the 8000 bytes (UTF-8 worst case) they can span
+                    with open(ctx_file, "rb") as f:
+                        head = f.read(2000 * 4)
+                    # Same newline translation as read_text(): \r\n and lone \r
+                    content = head.decode("utf-8", errors="replace")
+                    content = content.replace("\r\n", "\n").replace("\r", "\n")
                     context_content += f"\n### {ctx_file.stem}\n```\n{content[:2000]}\n```\n"
 
             # Load memory
-            memory = load_memory(ws)
-            memory_section = f"\n## Recent Lessons Learned\n{memory}\n" if memory else ""
-
-            # Build message
-            message = f"""## Task
-Task ID: {task_id}
-Chain Step: {i}/{len(agents)}
-
-{task}
-{context_content}
-{memory_section}
-
-## Output Instruction
-Format your final deliverable between these markers:
----OUTPUT---
-[Your complete output here]
----END OUTPUT---
-"""
+            memory = load_memory(ws, now=now)
+
+            # Build message (joined in one pass, copying context and memory once)
+            parts = [
+                "## Task\nTask ID: ", task_id,
+                f"\nChain Step: {i}/{len(agents)}\n\n", task, "\n", context_content, "\n",
+            ]
+            if memory:
+                parts += ["\n## Recent Lessons Learned\n", memory, "\n"]
+            parts.append(
+                "\n\n## Output Instruction\n"
+                "Format your final deliverable between these markers:\n"
+                "---OUTPUT---\n"
+                "[Your complete output here]\n"
+                "---END OUTPUT---\n"
+            )
+            parts.append(LESSON_INSTRUCTION)
+            message = "".join(parts)
 
             # Call LLM
             try:
                 response = call_llm(message, agent)
-                output = extract_output(response)
             except LLMError as e:
                 progress.update(progress_task, description=f"[red]✗[/red] {agent} failed")
                 console.print(f"\n[red]Error in {agent}:[/red] {e}")
                 raise typer.Exit(1)
+            lesson = extract_lesson(response)
+            output = extract_output(strip_lesson(response))
 
             # Save output
             output_file = out_dir / f"{i:02d}-{agent}.md"
-            output_file.write_text(output, encoding="utf-8")
+            atomic_write(output_file, output)
             context_files.append(output_file)
 
-            # Update memory
-            try:
-                lesson = call_llm(
-                    f"Summarize key lesson in ONE sentence (max 100 chars):\nTask: {task[:100]}\nOutput: {output[:200]}",
-                    "main"
-                ).strip()[:100]
-            except LLMError:
-                lesson = "Task completed in chain."
+            # Update memory; ask for the lesson separately only if the
+            # agent left out the LESSON block
+            if lesson is None:
+                try:
+                    lesson = call_llm(
+                        "Summarize key lesson in ONE sentence (max 100 chars):\n"
+                        f"Task: {task[:100]}\nOutput: {output[:200]}",
+                        "main"
+                    ).strip()[:100]
+                except LLMError:
+                    lesson = "Task completed in chain."
 
             save_memory(ws, task_id, task, str(output_file), lesson)
 
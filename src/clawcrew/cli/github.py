@@ -1,11 +1,7 @@
 """GitHub integration commands."""
 
-import json
 import shutil
 import subprocess
-import tempfile
-import uuid
-from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
@@ -14,12 +10,20 @@ from rich.console import Console
 
 from clawcrew.core.config import get_artifacts_dir
 from clawcrew.core.llm import call_llm, extract_output, LLMError
+from clawcrew.core.memory import new_task_id
+from clawcrew.utils import github_api
+from clawcrew.utils.errors import GitHubError
 from clawcrew.utils.github import (
+    atomic_write,
     parse_github_url,
     clone_repository,
     find_key_files,
     build_repo_context,
     get_github_token,
+    get_head_sha,
+    load_cached_repo_context,
+    save_cached_repo_context,
+    make_clone_temp_dir,
 )
 
 console = Console()
@@ -39,6 +43,10 @@ def analyze_repo(
     pat: Optional[str] = typer.Option(None, "--pat", help="GitHub PAT for private repos"),
     output: Optional[str] = typer.Option(None, "--output", "-o", help="Output file path"),
     task_id: Optional[str] = typer.Option(None, "--task-id", help="Task ID for tracking"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Skip the LLM response cache"),
+    full_clone: bool = typer.Option(
+        False, "--full-clone", help="Clone with full history (default: shallow)"
+    ),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
 ):
     """
@@ -57,11 +65,12 @@ def analyze_repo(
         raise typer.Exit(1)
 
     if not task_id:
-        task_id = datetime.now().strftime("%Y%m%d-%H%M%S") + "-" + str(uuid.uuid4())[:8]
+        task_id = new_task_id()
 
     temp_dir = None
     repo_path = None
     repo_name = "local-repo"
+    head_sha = None
 
     try:
         if url:
@@ -75,13 +84,18 @@ def analyze_repo(
             if verbose:
                 console.print(f"[dim]Cloning {owner}/{repo_name}...[/dim]")
 
-            temp_dir = Path(tempfile.mkdtemp(prefix="clawcrew-repo-"))
+            temp_dir = make_clone_temp_dir()
             repo_path = temp_dir / repo_name
 
-            if not clone_repository(clone_url, repo_path, branch, github_token):
+            cloned = clone_repository(
+                clone_url, repo_path, branch, github_token, full_history=full_clone
+            )
+            if not cloned:
                 console.print("[red]Error:[/red] Failed to clone repository")
                 raise typer.Exit(1)
 
+            head_sha = get_head_sha(repo_path)
+
         else:
             repo_path = Path(path).resolve()
             if not repo_path.exists() or not repo_path.is_dir():
@@ -89,17 +103,22 @@ def analyze_repo(
                 raise typer.Exit(1)
             repo_name = repo_path.name
 
-        if verbose:
-            console.print("[dim]Scanning for key files...[/dim]")
+        context = load_cached_repo_context(head_sha) if head_sha else None
+        if context is None:
+            if verbose:
+                console.print("[dim]Scanning for key files...[/dim]")
 
-        key_files = find_key_files(repo_path)
-        context = build_repo_context(repo_path, key_files)
+            key_files = find_key_files(repo_path)
+            context = build_repo_context(repo_path, key_files)
+            if head_sha:
+                save_cached_repo_context(head_sha, context)
+        elif verbose:
+            console.print(f"[dim]Using cached context for {head_sha[:12]}[/dim]")
 
         source = url if url else str(repo_path)
+        # No task ID in the prompt, so unchanged repos hit the LLM cache
         prompt = f"""## Repository Analysis Task
 
-Task ID: {task_id}
-
 Analyze this repository and provide a comprehensive summary.
 
 **Source:** {source}
@@ -122,7 +141,9 @@ Format your analysis between these markers:
             console.print("[dim]Calling github agent...[/dim]")
 
         try:
-            response = call_llm(prompt, "github")
+            response = call_llm(
+                prompt, "github", stop_marker="---END OUTPUT---", use_cache=not no_cache
+            )
             summary = extract_output(response)
         except LLMError as e:
             console.print(f"[red]Error:[/red] {e}")
@@ -135,7 +156,7 @@ Format your analysis between these markers:
             out_path = artifacts_dir / "repo_summary.md"
 
         out_path.parent.mkdir(parents=True, exist_ok=True)
-        out_path.write_text(summary, encoding="utf-8")
+        atomic_write(out_path, summary)
 
         console.print(f"[green]Summary saved to:[/green] {out_path}")
 
@@ -160,34 +181,21 @@ def list_issues(
 ):
     """List GitHub issues from a repository."""
     try:
-        cmd = ["gh", "issue", "list", "--repo", repo, "--state", state,
-               "--limit", str(limit), "--json", "number,title,state,labels"]
-
-        if label:
-            cmd.extend(["--label", label])
-
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-
-        if result.returncode != 0:
-            console.print(f"[red]Error:[/red] {result.stderr}")
-            raise typer.Exit(1)
-
-        issues = json.loads(result.stdout)
-
-        if not issues:
-            console.print(f"No {state} issues found")
-            return
+        issues = github_api.list_issues(repo, state, label, limit)
+    except GitHubError as e:
+        e.display()
+        raise typer.Exit(1)
 
-        console.print(f"\n[bold]{repo} Issues ({state}):[/bold]\n")
-        for issue in issues:
-            labels = ", ".join([l["name"] for l in issue.get("labels", [])])
-            console.print(f"  #{issue['number']:4} {issue['title'][:60]}")
-            if labels:
-                console.print(f"       [dim]{labels}[/dim]")
+    if not issues:
+        console.print(f"No {state} issues found")
+        return
 
-    except FileNotFoundError:
-        console.print("[red]Error:[/red] gh CLI not found. Install from https://cli.github.com/")
-        raise typer.Exit(1)
+    console.print(f"\n[bold]{repo} Issues ({state}):[/bold]\n")
+    for issue in issues:
+        labels = ", ".join([l["name"] for l in issue.get("labels", [])])
+        console.print(f"  #{issue['number']:4} {issue['title'][:60]}")
+        if labels:
+            console.print(f"       [dim]{labels}[/dim]")
 
 
 @github_app.command("read-issue")
@@ -198,48 +206,123 @@ def read_issue(
 ):
     """Read a GitHub issue."""
     try:
-        result = subprocess.run(
-            ["gh", "issue", "view", str(number), "--repo", repo, "--json",
-             "title,body,state,author,labels,assignees,createdAt,url"],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-
-        if result.returncode != 0:
-            console.print(f"[red]Error:[/red] {result.stderr}")
-            raise typer.Exit(1)
-
-        issue = json.loads(result.stdout)
+        issue = github_api.get_issue(repo, number)
+    except GitHubError as e:
+        e.display()
+        raise typer.Exit(1)
 
-        labels = ", ".join([l["name"] for l in issue.get("labels", [])]) or "None"
-        assignees = ", ".join([a["login"] for a in issue.get("assignees", [])]) or "None"
+    labels = ", ".join([l["name"] for l in issue.get("labels", [])]) or "None"
+    assignees = ", ".join([a["login"] for a in issue.get("assignees", [])]) or "None"
 
-        content = f"""# Issue #{number}: {issue['title']}
+    # REST field names; the state is upper-cased to match gh's output
+    content = f"""# Issue #{number}: {issue['title']}
 
 **Repository:** {repo}
-**URL:** {issue['url']}
-**State:** {issue['state']}
-**Author:** {issue['author']['login']}
+**URL:** {issue['html_url']}
+**State:** {issue['state'].upper()}
+**Author:** {issue['user']['login']}
 **Labels:** {labels}
 **Assignees:** {assignees}
-**Created:** {issue['createdAt']}
+**Created:** {issue['created_at']}
 
 ## Description
 
-{issue.get('body', 'No description provided.')}
+{issue.get('body') or 'No description provided.'}
 """
 
-        if output:
-            Path(output).write_text(content, encoding="utf-8")
-            console.print(f"[green]Saved to:[/green] {output}")
-        else:
-            console.print(content)
+    if output:
+        atomic_write(Path(output), content)
+        console.print(f"[green]Saved to:[/green] {output}")
+    else:
+        console.print(content)
 
-    except FileNotFoundError:
-        console.print("[red]Error:[/red] gh CLI not found")
+
+# REST `mergeable` (true/false/null while GitHub computes it) in gh's wording
+MERGEABLE_LABELS = {True: "MERGEABLE", False: "CONFLICTING", None: "UNKNOWN"}
+
+
+@github_app.command("read-pr")
+def read_pr(
+    repo: str = typer.Option(..., "--repo", "-r", help="Repository (owner/repo)"),
+    number: int = typer.Option(..., "--number", "-n", help="PR number"),
+    output: Optional[str] = typer.Option(None, "--output", "-o", help="Output file"),
+    with_comments: bool = typer.Option(False, "--comments", "-c", help="Include PR comments"),
+    with_diff: bool = typer.Option(False, "--diff", "-d", help="Include PR diff"),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Revalidate cached PR data with GitHub"
+    ),
+):
+    """
+    Read a GitHub pull request, optionally with comments and diff.
+
+    PR details and diffs are cached for 30 minutes and then revalidated by
+    ETag; --no-cache revalidates right away.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    max_age = 0 if no_cache else github_api.PR_CACHE_TTL
+    try:
+        # The three reads are independent; run them at once on the shared client
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            pr_future = pool.submit(github_api.get_pull, repo, number, max_age)
+            comments_future = diff_future = None
+            if with_comments:
+                comments_future = pool.submit(github_api.list_issue_comments, repo, number)
+            if with_diff:
+                diff_future = pool.submit(github_api.get_pull_diff, repo, number, max_age)
+            pr = pr_future.result()
+            comments = comments_future.result() if comments_future else []
+            diff = diff_future.result() if diff_future else None
+    except GitHubError as e:
+        e.display()
         raise typer.Exit(1)
 
+    labels = ", ".join([label["name"] for label in pr.get("labels", [])]) or "None"
+    assignees = ", ".join([a["login"] for a in pr.get("assignees", [])]) or "None"
+    state = "MERGED" if pr.get("merged") else pr["state"].upper()
+    changes = (
+        f"+{pr.get('additions', 0)} -{pr.get('deletions', 0)} "
+        f"({pr.get('changed_files', 0)} files)"
+    )
+
+    content = f"""# PR #{number}: {pr['title']}
+
+**Repository:** {repo}
+**URL:** {pr['html_url']}
+**State:** {state}
+**Author:** {pr['user']['login']}
+**Branch:** {pr['head']['ref']} → {pr['base']['ref']}
+**Labels:** {labels}
+**Assignees:** {assignees}
+**Created:** {pr['created_at']}
+**Mergeable:** {MERGEABLE_LABELS.get(pr.get('mergeable'), 'UNKNOWN')}
+**Changes:** {changes}
+
+## Description
+
+{pr.get('body') or 'No description provided.'}
+"""
+
+    if comments:
+        content += "\n## Comments\n\n"
+        for i, comment in enumerate(comments, 1):
+            author, created = comment["user"]["login"], comment["created_at"]
+            content += f"### Comment {i} by {author} ({created})\n\n"
+            content += f"{comment['body']}\n\n"
+
+    if diff is not None:
+        # Truncate very large diffs
+        if len(diff) > 50000:
+            diff = diff[:50000] + "\n\n[Diff truncated due to size]"
+        content += f"\n## Diff\n\n```diff\n{diff}\n```\n"
+
+    if output:
+        atomic_write(Path(output), content)
+        console.print(f"[green]Saved to:[/green] {output}")
+    else:
+        # Diffs are full of [...] that rich would otherwise read as markup
+        console.print(content, markup=False, highlight=False)
+
 
 @github_app.command("create-pr")
 def create_pr(
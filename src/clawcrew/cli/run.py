@@ -1,6 +1,5 @@
 """Run agent command."""
 
-import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List
@@ -9,8 +8,11 @@ import typer
 from rich.console import Console
 
 from clawcrew.core.config import get_workspace
-from clawcrew.core.memory import load_memory, save_memory
-from clawcrew.core.llm import call_llm, extract_output, LLMError
+from clawcrew.core.memory import load_memory, new_task_id, save_memory
+from clawcrew.core.llm import (
+    call_llm, extract_lesson, extract_output, strip_lesson, LESSON_INSTRUCTION, LLMError,
+)
+from clawcrew.utils.github import atomic_write, read_file_capped
 
 console = Console()
 
@@ -22,13 +24,18 @@ def run(
     context: Optional[List[str]] = typer.Option(None, "--context", "-c", help="Context file(s) to read"),
     task_id: Optional[str] = typer.Option(None, "--task-id", help="Task ID for tracking"),
     no_memory: bool = typer.Option(False, "--no-memory", help="Skip memory loading/saving"),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Always call the LLM for the lesson summary"
+    ),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
 ):
     """
     Run a specialized agent with a task.
 
     The agent loads its SOUL.md (personality) and recent memories,
-    executes the task, saves output, and updates its memory.
+    executes the task, saves output, and updates its memory. The lesson
+    for memory is asked for in the task message itself; a separate LLM
+    call is made only if the agent leaves it out.
 
     Examples:
         clawcrew run design -t "Design REST API for user auth"
@@ -36,8 +43,9 @@ def run(
         clawcrew run test -t "Write tests" -c auth.py -o test_auth.py
     """
     # Generate task ID if not provided
+    now = datetime.now()
     if not task_id:
-        task_id = datetime.now().strftime("%Y%m%d-%H%M%S") + "-" + str(uuid.uuid4())[:8]
+        task_id = new_task_id(now)
 
     try:
         ws = get_workspace(agent)
@@ -50,7 +58,7 @@ def run(
         console.print(f"[dim][{agent.upper()}] Task ID: {task_id}[/dim]")
 
     # Load memory
-    memory = "" if no_memory else load_memory(ws)
+    memory = "" if no_memory else load_memory(ws, now=now)
 
     # Load context files if provided
     context_content = ""
@@ -58,13 +66,12 @@ def run(
         for ctx_file in context:
             ctx_path = Path(ctx_file)
             if ctx_path.exists():
-                content = ctx_path.read_text(encoding="utf-8")
+                content = read_file_capped(ctx_path)
                 context_content += f"\n\n## Context File: {ctx_file}\n```\n{content}\n```"
             else:
                 console.print(f"[yellow]Warning:[/yellow] Context file not found: {ctx_file}")
 
     # Build message
-    memory_section = f"\n## Recent Lessons Learned\n{memory}\n" if memory else ""
     output_instruction = ""
     if output:
         output_instruction = """
@@ -76,13 +83,14 @@ Format your final deliverable between these markers:
 ---END OUTPUT---
 """
 
-    message = f"""## Task
-Task ID: {task_id}
-{task}
-{context_content}
-{memory_section}
-{output_instruction}
-"""
+    # Joined in one pass so large context and memory are copied only once
+    parts = ["## Task\nTask ID: ", task_id, "\n", task, "\n", context_content, "\n"]
+    if memory:
+        parts += ["\n## Recent Lessons Learned\n", memory, "\n"]
+    parts += ["\n", output_instruction, "\n"]
+    if not no_memory:
+        parts += [LESSON_INSTRUCTION, "\n"]
+    message = "".join(parts)
 
     if verbose:
         console.print(f"[dim][{agent.upper()}] Calling OpenClaw agent...[/dim]")
@@ -90,34 +98,48 @@ Task ID: {task_id}
     # Call LLM
     try:
         response = call_llm(message, agent)
-        final_output = extract_output(response)
     except LLMError as e:
         console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(1)
 
-    # Save output
-    if output:
-        out_path = Path(output)
-        out_path.parent.mkdir(parents=True, exist_ok=True)
-        out_path.write_text(final_output, encoding="utf-8")
-        console.print(f"[green][{agent.upper()}][/green] Output saved to: {output}")
+    lesson = extract_lesson(response)
+    response = strip_lesson(response)
+    final_output = extract_output(response)
+
+    def emit_output():
+        if output:
+            out_path = Path(output)
+            out_path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write(out_path, final_output)
+            console.print(f"[green][{agent.upper()}][/green] Output saved to: {output}")
+        else:
+            console.print(response)
+
+    if no_memory:
+        emit_output()
     else:
-        console.print(response)
-
-    # Auto-reflection and memory update
-    if not no_memory:
-        lesson_prompt = f"""Briefly summarize the key lesson from this task in ONE sentence (max 100 chars).
-
-Task: {task[:200]}
-Output: {final_output[:200]}..."""
-
-        try:
-            lesson = call_llm(lesson_prompt, "main")
-            lesson = lesson.strip()[:100]
-        except LLMError:
-            lesson = "Task completed successfully."
-
-        save_memory(ws, task_id, task, output, lesson)
+        if lesson is None:
+            # Agent skipped the LESSON block: the fallback lesson call is in
+            # flight while the output is saved, so the two overlap
+            lesson_prompt = (
+                "Briefly summarize the key lesson from this task in ONE sentence (max 100 chars).\n"
+                f"\nTask: {task[:200]}\nOutput: {final_output[:200]}..."
+            )
+
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                # Repeated tasks often produce the same lesson prompt
+                lesson_future = pool.submit(call_llm, lesson_prompt, "main", use_cache=not no_cache)
+                emit_output()
+                try:
+                    lesson = lesson_future.result().strip()[:100]
+                except LLMError:
+                    lesson = "Task completed successfully."
+        else:
+            emit_output()
+
+        save_memory(ws, task_id, task, output, lesson, now=now)
 
         if verbose:
             console.print(f"[dim][{agent.upper()}] Memory updated: {lesson}[/dim]")
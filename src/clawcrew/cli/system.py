@@ -102,9 +102,12 @@ def status():
     # Show agent workspaces
     console.print("\n[bold]Agent Workspaces:[/bold]")
 
-    from clawcrew.core.config import AGENT_WORKSPACES, get_base_dir
+    from clawcrew.core.config import AGENT_WORKSPACES, get_base_dir, list_entry_names
 
     base_dir = get_base_dir()
+    installed_dir = Path.home() / ".openclaw"
+    dev_names = list_entry_names(base_dir)
+    installed_names = list_entry_names(installed_dir)
     table = Table()
     table.add_column("Agent")
     table.add_column("Status")
@@ -112,11 +115,11 @@ def status():
 
     for agent, ws_name in AGENT_WORKSPACES.items():
         ws = base_dir / ws_name
-        installed_ws = Path.home() / ".openclaw" / ws_name
+        installed_ws = installed_dir / ws_name
 
-        if ws.exists():
+        if ws_name in dev_names:
             table.add_row(agent, "[green]✓[/green]", str(ws))
-        elif installed_ws.exists():
+        elif ws_name in installed_names:
             table.add_row(agent, "[green]✓[/green]", str(installed_ws))
         else:
             table.add_row(agent, "[red]✗[/red]", "Not found")
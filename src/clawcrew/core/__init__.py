@@ -9,6 +9,8 @@ from clawcrew.core.memory import (
     load_memory,
     save_memory,
     load_soul,
+    new_task_id,
+    render_memory_as_markdown,
 )
 from clawcrew.core.llm import (
     call_llm,
@@ -22,6 +24,8 @@ __all__ = [
     "load_memory",
     "save_memory",
     "load_soul",
+    "new_task_id",
+    "render_memory_as_markdown",
     "call_llm",
     "extract_output",
 ]
@@ -1,5 +1,7 @@
 """ClawCrew configuration management."""
 
+import functools
+import os
 from pathlib import Path
 from typing import Optional
 
@@ -13,27 +15,49 @@ AGENT_WORKSPACES = {
 }
 
 
+@functools.lru_cache(maxsize=None)
 def get_base_dir() -> Path:
     """
     Get the base directory for ClawCrew.
 
     Returns the package source directory for development,
-    or ~/.openclaw for installed mode.
+    or ~/.openclaw for installed mode. Computed once per process.
     """
     # Try to find package directory (for development)
     pkg_dir = Path(__file__).parent.parent.parent.parent
-    if (pkg_dir / "workspace-orca").exists():
+    if os.path.isdir(os.path.join(pkg_dir, "workspace-orca")):
         return pkg_dir
 
     # Fall back to ~/.openclaw (installed mode)
     return Path.home() / ".openclaw"
 
 
+def list_entry_names(directory: Path) -> set:
+    """
+    Get the names of the entries in a directory with one scandir call.
+
+    Lets callers check many candidate paths without a stat per candidate.
+
+    Args:
+        directory: Directory to list
+
+    Returns:
+        Set of entry names (empty if the directory doesn't exist)
+    """
+    try:
+        with os.scandir(directory) as it:
+            return {entry.name for entry in it}
+    except OSError:
+        return set()
+
+
+@functools.lru_cache(maxsize=None)
 def get_workspace(agent_name: str) -> Path:
     """
     Get workspace path for an agent.
 
     Checks package dir first (dev mode), then ~/.openclaw (installed mode).
+    Results are cached for the life of the process (errors are not).
 
     Args:
         agent_name: Name of the agent (design, code, test, orca, github)
@@ -50,16 +74,14 @@ def get_workspace(agent_name: str) -> Path:
 
     ws_name = AGENT_WORKSPACES[agent_name]
 
-    # Check package dir first (dev mode)
-    base = get_base_dir()
-    ws_path = base / ws_name
-
-    if ws_path.exists():
+    # Check package dir first (dev mode); one isdir() stat per candidate
+    ws_path = get_base_dir() / ws_name
+    if os.path.isdir(ws_path):
         return ws_path
 
     # Check ~/.openclaw (installed mode)
     installed_path = Path.home() / ".openclaw" / ws_name
-    if installed_path.exists():
+    if os.path.isdir(installed_path):
         return installed_path
 
     raise ValueError(f"Workspace not found: {ws_name}")
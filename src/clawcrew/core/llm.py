@@ -1,15 +1,158 @@
 """LLM interaction via OpenClaw."""
 
+import functools
+import hashlib
+import json
+import os
+import shutil
+import struct
 import subprocess
+import threading
+import time
+from pathlib import Path
 from typing import Optional
 
+# OpenClaw agent daemon (opt-in, same protocol as bin/agent-cli.py): one
+# long-running openclaw process serves all calls over a Unix socket, so the
+# interpreter and config start-up is paid once instead of per call.
+DAEMON_ENABLED = os.environ.get("CLAWCREW_OPENCLAW_DAEMON") == "1"
+DAEMON_SOCKET = Path.home() / ".openclaw" / "agent.sock"
+DAEMON_START_TIMEOUT = 30  # seconds to wait for a freshly started daemon
+
+# Messages are passed as `--message <text>` unless they would hit Linux's
+# MAX_ARG_STRLEN (128KB per argv string); larger ones are piped on stdin
+# with `--stdin`. CLAWCREW_OPENCLAW_STDIN=1 pipes every message.
+MAX_ARGV_MESSAGE = 128 * 1024 - 1
+STDIN_ALWAYS = os.environ.get("CLAWCREW_OPENCLAW_STDIN") == "1"
+
+# Seconds openclaw gets to exit after SIGTERM before it is sent SIGKILL
+KILL_GRACE = 5
+
+# Appended to task messages so the lesson comes back with the response
+# (see extract_lesson) instead of costing a second LLM call
+LESSON_INSTRUCTION = """
+## Lesson Instruction
+After your deliverable, summarize the key lesson from this task in ONE
+sentence (max 100 chars) between these markers:
+---LESSON---
+[One-sentence lesson]
+---END LESSON---
+"""
+
+# Content-addressed response cache: <dir>/<agent>/<sha256(agent, message)>.txt.
+# Entries older than CLAWCREW_LLM_CACHE_TTL seconds (default 7 days) are ignored.
+LLM_CACHE_DIR = Path.home() / ".openclaw" / "llm-cache"
+LLM_CACHE_TTL = int(os.environ.get("CLAWCREW_LLM_CACHE_TTL", 7 * 24 * 3600))
+
 
 class LLMError(Exception):
-    """Error calling LLM."""
-    pass
+    """
+    Error calling LLM.
+
+    Attributes:
+        partial_output: stdout received before a timeout (empty otherwise),
+            for callers that want to salvage or retry
+    """
+
+    def __init__(self, message: str, partial_output: str = ""):
+        super().__init__(message)
+        self.partial_output = partial_output
+
+
+def _connect_daemon():
+    """
+    Connect to the openclaw agent daemon, starting it if needed.
+
+    When the socket does not exist yet, the daemon is launched from
+    CLAWCREW_OPENCLAW_DAEMON_CMD in its own session and we wait for it.
+
+    Returns:
+        Connected socket, or None if the daemon is disabled or unreachable
+    """
+    if not DAEMON_ENABLED:
+        return None
+
+    import shlex
+    import socket
+
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+
+    if not DAEMON_SOCKET.exists():
+        launch_cmd = os.environ.get("CLAWCREW_OPENCLAW_DAEMON_CMD")
+        if not launch_cmd:
+            return None
+        try:
+            subprocess.Popen(
+                shlex.split(launch_cmd),
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+        except OSError:
+            return None
+
+        deadline = time.monotonic() + DAEMON_START_TIMEOUT
+        while not DAEMON_SOCKET.exists():
+            if time.monotonic() > deadline:
+                return None
+            time.sleep(0.1)
 
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(str(DAEMON_SOCKET))
+    except OSError:
+        client.close()
+        return None
+    return client
+
+
+def _call_daemon(client, message: str, agent_name: str, timeout: int) -> str:
+    """
+    Send one agent request to the openclaw daemon.
+
+    Protocol: a single JSON line `{"agent", "local", "message"}` is sent; the
+    reply is a 4-byte big-endian length followed by a JSON object holding
+    either `output` or `error`.
+
+    Raises:
+        LLMError: On connection errors, timeout or a daemon-reported error
+    """
+    def recv_exact(size: int) -> bytes:
+        buf = bytearray()
+        while len(buf) < size:
+            chunk = client.recv(size - len(buf))
+            if not chunk:
+                raise ConnectionError("openclaw daemon closed the connection")
+            buf.extend(chunk)
+        return bytes(buf)
+
+    request = json.dumps({"agent": agent_name, "local": True, "message": message})
+    try:
+        with client:
+            client.settimeout(timeout)
+            client.sendall(request.encode("utf-8") + b"\n")
+            (length,) = struct.unpack("!I", recv_exact(4))
+            reply = json.loads(recv_exact(length))
+    except TimeoutError:  # socket.timeout
+        raise LLMError("LLM call timed out")
+    except (OSError, ValueError) as e:
+        raise LLMError(f"LLM call via openclaw daemon failed: {e}")
+
+    if reply.get("error"):
+        raise LLMError(f"LLM call failed: {reply['error']}")
+
+    return reply.get("output", "").strip()
 
-def call_llm(message: str, agent_name: str = "main", timeout: int = 300) -> str:
+
+def call_llm(
+    message: str,
+    agent_name: str = "main",
+    timeout: int = 300,
+    stop_marker: Optional[str] = None,
+    use_cache: bool = False,
+) -> str:
     """
     Call LLM via OpenClaw agent command.
 
@@ -18,10 +161,22 @@ def call_llm(message: str, agent_name: str = "main", timeout: int = 300) -> str:
     - Uses the configured Anthropic OAuth
     - Returns the agent's response
 
+    Messages too large for argv are piped on stdin with `--stdin`.
+    When CLAWCREW_OPENCLAW_DAEMON=1, the request goes to the openclaw daemon
+    instead; the subprocess path is used if the daemon cannot be reached.
+
+    stdout is streamed line by line; with stop_marker set, openclaw is
+    terminated once a line containing the marker has been read.
+
+    With use_cache, identical (agent, message) pairs are answered from
+    ~/.openclaw/llm-cache without calling openclaw (see LLM_CACHE_TTL).
+
     Args:
         message: The message/task to send
         agent_name: OpenClaw agent ID (orca, design, code, test, or main)
         timeout: Timeout in seconds
+        stop_marker: Optional marker that ends the response early
+        use_cache: Read and write the content-addressed response cache
 
     Returns:
         LLM response content
@@ -29,29 +184,133 @@ def call_llm(message: str, agent_name: str = "main", timeout: int = 300) -> str:
     Raises:
         LLMError: On subprocess errors
     """
-    try:
-        result = subprocess.run(
-            [
-                "openclaw", "agent",
-                "--agent", agent_name,
-                "--local",
-                "--message", message,
-            ],
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-        )
+    cache_path = None
+    if use_cache:
+        key = hashlib.sha256(f"{agent_name}\0{message}".encode("utf-8")).hexdigest()
+        cache_path = LLM_CACHE_DIR / agent_name / f"{key}.txt"
+        try:
+            if time.time() - cache_path.stat().st_mtime <= LLM_CACHE_TTL:
+                return cache_path.read_bytes().decode("utf-8")
+        except OSError:
+            pass
 
-        if result.returncode != 0:
-            raise LLMError(f"LLM call failed: {result.stderr}")
+    response = _call_openclaw(message, agent_name, timeout, stop_marker)
 
-        return result.stdout.strip()
+    if cache_path is not None:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # atomic_write's temp name is per thread: run's lesson call writes
+        # from a worker thread
+        from clawcrew.utils.github import atomic_write
 
+        atomic_write(cache_path, response)
+
+    return response
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_executable(name: str) -> str:
+    """
+    Resolve a command to its absolute path on PATH, once per process.
+
+    Saves the PATH search on every call, and lets subprocess use its
+    posix_spawn fast path (it needs the executable as a path). Falls back
+    to the bare name, which lets subprocess raise FileNotFoundError.
+    """
+    return shutil.which(name) or name
+
+
+def _terminate(proc: subprocess.Popen):
+    """Stop openclaw: SIGTERM, then SIGKILL if it outlives KILL_GRACE."""
+    proc.terminate()
+    try:
+        proc.wait(timeout=KILL_GRACE)
     except subprocess.TimeoutExpired:
-        raise LLMError("LLM call timed out")
+        proc.kill()
+
+
+def _call_openclaw(message: str, agent_name: str, timeout: int, stop_marker: Optional[str]) -> str:
+    """Uncached body of call_llm: one request via the daemon or an openclaw process."""
+    client = _connect_daemon()
+    if client is not None:
+        return _call_daemon(client, message, agent_name, timeout)
+
+    cmd = [_resolve_executable("openclaw"), "agent", "--agent", agent_name, "--local"]
+    stdin_data = None
+    # UTF-8 needs at most 4 bytes per character: only long messages are
+    # encoded to measure their size
+    if STDIN_ALWAYS or (
+        len(message) * 4 > MAX_ARGV_MESSAGE
+        and len(message.encode("utf-8")) > MAX_ARGV_MESSAGE
+    ):
+        cmd.append("--stdin")
+        stdin_data = message
+    else:
+        cmd.extend(["--message", message])
+
+    try:
+        # close_fds=False keeps posix_spawn usable (our fds are non-inheritable, PEP 446)
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE if stdin_data is not None else None,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            close_fds=False,
+        )
     except FileNotFoundError:
         raise LLMError("openclaw command not found. Please install OpenClaw first.")
 
+    # Service stdin and stderr off-thread so neither pipe can stall openclaw
+    stderr_chunks = []
+    helpers = [
+        threading.Thread(target=lambda: stderr_chunks.append(proc.stderr.read()), daemon=True)
+    ]
+    if stdin_data is not None:
+        def feed():
+            try:
+                proc.stdin.write(stdin_data)
+                proc.stdin.close()
+            except OSError:
+                pass
+        helpers.append(threading.Thread(target=feed, daemon=True))
+    for helper in helpers:
+        helper.start()
+
+    timed_out = threading.Event()
+
+    def expire():
+        timed_out.set()
+        _terminate(proc)
+
+    watchdog = threading.Timer(timeout, expire)
+    watchdog.start()
+
+    lines = []
+    stopped_early = False
+    try:
+        for line in proc.stdout:
+            lines.append(line)
+            if stop_marker and stop_marker in line:
+                stopped_early = True
+                break
+        if stopped_early:
+            _terminate(proc)
+        proc.wait()
+    finally:
+        watchdog.cancel()
+        proc.stdout.close()
+        for helper in helpers:
+            helper.join()
+        proc.stderr.close()
+
+    if timed_out.is_set():
+        raise LLMError("LLM call timed out", partial_output="".join(lines))
+
+    if proc.returncode != 0 and not stopped_early:
+        raise LLMError(f"LLM call failed: {''.join(stderr_chunks)}")
+
+    return "".join(lines).strip()
+
 
 def extract_output(response: str) -> str:
     """
@@ -65,6 +324,43 @@ def extract_output(response: str) -> str:
     Returns:
         Extracted output or full response
     """
-    if "---OUTPUT---" in response and "---END OUTPUT---" in response:
-        return response.split("---OUTPUT---")[1].split("---END OUTPUT---")[0].strip()
-    return response
+    # Slice between the first marker pair: no intermediate split() lists
+    start = response.find("---OUTPUT---")
+    if start == -1:
+        return response
+    start += len("---OUTPUT---")
+    end = response.find("---END OUTPUT---", start)
+    if end == -1:
+        return response
+    return response[start:end].strip()
+
+
+def extract_lesson(response: str) -> Optional[str]:
+    """
+    Extract the lesson between ---LESSON--- and ---END LESSON--- markers.
+
+    Args:
+        response: LLM response text
+
+    Returns:
+        Lesson (max 100 chars), or None if the markers are missing or empty
+    """
+    start = response.find("---LESSON---")
+    if start == -1:
+        return None
+    end = response.find("---END LESSON---", start)
+    if end == -1:
+        return None
+    lesson = response[start + len("---LESSON---"):end].strip()
+    return lesson[:100] or None
+
+
+def strip_lesson(response: str) -> str:
+    """Remove the ---LESSON--- block (if any) from an LLM response."""
+    start = response.find("---LESSON---")
+    if start == -1:
+        return response
+    end = response.find("---END LESSON---", start)
+    if end == -1:
+        return response
+    return (response[:start] + response[end + len("---END LESSON---"):]).strip()
@@ -1,16 +1,22 @@
 """Agent memory management."""
 
-from datetime import datetime, timedelta
+import json
+import os
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
+# SOUL.md path -> (st_mtime_ns, contents)
+_soul_cache: dict = {}
+
 
 def load_soul(workspace: Path) -> str:
     """
     Load SOUL.md from workspace.
 
     SOUL.md defines the agent's personality, responsibilities, and output format.
-    Creates a default SOUL if not exists.
+    Creates a default SOUL if not exists. Contents are cached per process,
+    keyed by the file's mtime.
 
     Args:
         workspace: Workspace path
@@ -19,46 +25,164 @@ def load_soul(workspace: Path) -> str:
         Content of SOUL.md
     """
     soul_path = workspace / "SOUL.md"
-    if soul_path.exists():
-        return soul_path.read_text(encoding="utf-8")
-
-    # Create default SOUL if not exists
-    default_soul = f"# {workspace.name}\n\nYou are a helpful specialist agent."
-    soul_path.write_text(default_soul, encoding="utf-8")
-    return default_soul
-
-
-def load_memory(workspace: Path, days: int = 7) -> str:
+    try:
+        mtime_ns = soul_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        # Create default SOUL if not exists
+        default_soul = f"# {workspace.name}\n\nYou are a helpful specialist agent."
+        soul_path.write_text(default_soul, encoding="utf-8")
+        return default_soul
+
+    # Only re-read the file when its mtime has changed
+    cached = _soul_cache.get(soul_path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    soul = soul_path.read_bytes().decode("utf-8")  # no newline translation pass
+    _soul_cache[soul_path] = (mtime_ns, soul)
+    return soul
+
+
+def load_memory(workspace: Path, days: int = 7, now: Optional[datetime] = None) -> str:
     """
-    Load recent memories from memory/YYYY-MM-DD.md files.
+    Load recent memories from memory/YYYY-MM-DD.jsonl files.
 
     Memories contain lessons learned from past tasks, helping agents improve over time.
+    Day files written before the JSONL format (YYYY-MM-DD.md) are still read.
 
     Args:
         workspace: Workspace path
         days: Number of days to look back
+        now: Time the window ends at (defaults to datetime.now())
 
     Returns:
         Combined memory content as markdown string
     """
     memory_dir = workspace / "memory"
-    if not memory_dir.exists():
+
+    # One directory read instead of an exists() probe per day in the window
+    today = (now or datetime.now()).date()
+    cutoff = today - timedelta(days=days - 1)
+    try:
+        with os.scandir(memory_dir) as it:
+            candidates = [entry for entry in it if entry.name.endswith((".jsonl", ".md"))]
+    except FileNotFoundError:
         return ""
 
-    memories = []
-    today = datetime.now().date()
+    by_day = {}  # date -> {".md": path, ".jsonl": path}
+    for entry in candidates:
+        date_str, dot, ext = entry.name.partition(".")
+        if len(date_str) != 10:  # only YYYY-MM-DD names
+            continue
+        try:
+            day = date.fromisoformat(date_str)
+        except ValueError:
+            continue
+        if cutoff <= day <= today:
+            by_day.setdefault(day, {})[dot + ext] = entry.path
+
+    day_files = sorted(by_day.items(), reverse=True)
+
+    def read(paths: dict) -> str:
+        text = ""
+        if ".md" in paths:
+            with open(paths[".md"], "rb") as f:
+                text = f.read().decode("utf-8")
+        if ".jsonl" in paths:
+            text += render_memory_as_markdown(read_memory_records(paths[".jsonl"]))
+        return text.strip()
+
+    if len(day_files) > 1:
+        # Overlap the reads (they serialize on cold caches and network mounts)
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(8, len(day_files))) as pool:
+            contents = list(pool.map(read, [paths for _, paths in day_files]))
+    else:
+        contents = [read(paths) for _, paths in day_files]
 
-    for i in range(days):
-        date = today - timedelta(days=i)
-        date_str = date.strftime("%Y-%m-%d")
-        memory_file = memory_dir / f"{date_str}.md"
+    memories = [
+        f"## {day.isoformat()}\n{content}"
+        for (day, _), content in zip(day_files, contents)
+        if content
+    ]
+    return "\n\n".join(memories) if memories else ""
 
-        if memory_file.exists():
-            content = memory_file.read_text(encoding="utf-8").strip()
-            if content:
-                memories.append(f"## {date_str}\n{content}")
 
-    return "\n\n".join(memories) if memories else ""
+def read_memory_records(path: str) -> list:
+    """
+    Parse a JSONL memory file.
+
+    Blank and malformed lines are skipped. orjson is used when installed.
+
+    Args:
+        path: Path to a memory/YYYY-MM-DD.jsonl file
+
+    Returns:
+        List of memory records (dicts)
+    """
+    try:
+        from orjson import loads
+    except ImportError:
+        loads = json.loads
+
+    records = []
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                records.append(loads(line))
+            except ValueError:
+                continue
+    return records
+
+
+def render_memory_as_markdown(records: list) -> str:
+    """
+    Render memory records as the markdown that is sent to agents.
+
+    Uses the same layout as the legacy .md day files, so prompts look the
+    same whichever format a day was stored in.
+
+    Args:
+        records: Memory records, as returned by read_memory_records
+
+    Returns:
+        Markdown text
+    """
+    return "".join(
+        f"""
+### {record.get('ts', '')} - {record.get('task_id', '')}
+
+**Task:** {record.get('task', '')}
+
+**Output:** {record.get('output') or 'stdout'}
+
+**Lesson:** {record.get('lesson', '')}
+
+---
+"""
+        for record in records
+    )
+
+
+def new_task_id(now: Optional[datetime] = None) -> str:
+    """
+    Generate a task ID: `YYYYmmdd-HHMMSS-<8 hex chars>`.
+
+    The suffix is 4 random bytes straight from os.urandom, rather than a
+    uuid4 built and then cut down to the same 8 hex digits.
+
+    Args:
+        now: Timestamp to use (defaults to the current time), so a command
+            can share one clock reading between its task ID and memory entry
+
+    Returns:
+        Task ID
+    """
+    if now is None:
+        now = datetime.now()
+    return f"{now:%Y%m%d-%H%M%S}-{os.urandom(4).hex()}"
 
 
 def save_memory(
@@ -67,15 +191,13 @@ def save_memory(
     task: str,
     output_file: Optional[str],
     lesson: str,
+    now: Optional[datetime] = None,
 ):
     """
     Append a memory entry to today's memory file.
 
-    Memory format:
-        ### HH:MM:SS - task_id
-        **Task:** ...
-        **Output:** ...
-        **Lesson:** ...
+    Memory format (memory/YYYY-MM-DD.jsonl, one JSON object per line):
+        {"ts": "HH:MM:SS", "task_id": ..., "task": ..., "output": ..., "lesson": ...}
 
     Args:
         workspace: Workspace path
@@ -83,28 +205,38 @@ def save_memory(
         task: Task description
         output_file: Output file path (or None)
         lesson: Lesson learned from this task
+        now: Timestamp for the entry (defaults to the current time)
     """
+    if now is None:
+        now = datetime.now()
     memory_dir = workspace / "memory"
     memory_dir.mkdir(exist_ok=True)
 
-    today = datetime.now().strftime("%Y-%m-%d")
-    memory_file = memory_dir / f"{today}.md"
-    timestamp = datetime.now().strftime("%H:%M:%S")
-
-    entry = f"""
-### {timestamp} - {task_id}
-
-**Task:** {task[:200]}
-
-**Output:** {output_file or 'stdout'}
-
-**Lesson:** {lesson}
-
----
-"""
+    today = now.date().isoformat()  # same as %Y-%m-%d, without strftime
+    memory_file = memory_dir / f"{today}.jsonl"
+
+    record = {
+        "ts": now.time().isoformat(timespec="seconds"),
+        "task_id": task_id,
+        "task": task[:200],
+        "output": output_file,
+        "lesson": lesson,
+    }
+    # orjson (when installed) encodes straight to UTF-8 bytes
+    try:
+        from orjson import dumps
+    except ImportError:
+        entry = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+    else:
+        entry = dumps(record) + b"\n"
 
-    with open(memory_file, "a", encoding="utf-8") as f:
-        f.write(entry)
+    # Single O_APPEND write: no buffered text-file layers, and each entry
+    # lands contiguously even when several agents append at once
+    fd = os.open(memory_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, entry)
+    finally:
+        os.close(fd)
 
 
 def clear_memory(workspace: Path, all_days: bool = False) -> bool:
@@ -118,7 +250,7 @@ def clear_memory(workspace: Path, all_days: bool = False) -> bool:
     Returns:
         True if any memories were cleared
     """
-    import shutil
+    from clawcrew.utils.github import remove_tree_in_background
 
     memory_dir = workspace / "memory"
 
@@ -126,13 +258,16 @@ def clear_memory(workspace: Path, all_days: bool = False) -> bool:
         return False
 
     if all_days:
-        shutil.rmtree(memory_dir)
+        # Renamed away at once; the files are unlinked in the background
+        remove_tree_in_background(memory_dir)
         return True
     else:
-        today = datetime.now().strftime("%Y-%m-%d")
-        today_file = memory_dir / f"{today}.md"
-        if today_file.exists():
-            today_file.unlink()
-            return True
-
-    return False
+        today = date.today().isoformat()
+        cleared = False
+        for suffix in (".jsonl", ".md"):  # .md: day files from before JSONL
+            try:
+                (memory_dir / f"{today}{suffix}").unlink()
+                cleared = True
+            except FileNotFoundError:
+                pass
+        return cleared
@@ -0,0 +1,257 @@
+"""
+GitHub REST API client for the `clawcrew github` issue and PR commands.
+
+Issues and pull requests are read over HTTPS with httpx instead of spawning
+`gh` for every request. One keep-alive client is shared by all calls in a
+process (so e.g. a PR, its comments and its diff reuse one TLS connection),
+and list results are paginated through the Link header.
+
+The token comes from GITHUB_PAT / GH_TOKEN, or from `gh auth token` (run
+once per process) when neither is set; without any token, public
+repositories are read anonymously.
+
+Pull request data and diffs are cached on disk with their ETag: fresh
+entries are used as-is, older ones are revalidated with If-None-Match and
+a 304 reply reuses the stored body (no download, no rate-limit cost when
+authenticated).
+"""
+
+import functools
+import hashlib
+import json
+import subprocess
+import time
+from pathlib import Path
+from typing import Optional
+
+from clawcrew.utils.errors import GitHubError
+from clawcrew.utils.github import atomic_write, get_github_token
+
+API_URL = "https://api.github.com"
+API_TIMEOUT = 30  # seconds per request
+MAX_PER_PAGE = 100  # GitHub's page size limit
+
+# ETag cache for PR responses: <dir>/<sha256(url, accept, token)>.json holding
+# {"etag", "body", "ts"}; entries younger than PR_CACHE_TTL skip the request
+API_CACHE_DIR = Path.home() / ".openclaw" / "cache" / "github-api"
+PR_CACHE_TTL = 30 * 60
+
+
+@functools.lru_cache(maxsize=None)
+def get_api_token() -> Optional[str]:
+    """
+    Get a token for the GitHub API.
+
+    Returns:
+        Token from the environment or the gh CLI's login, or None
+    """
+    token = get_github_token()
+    if token:
+        return token
+
+    try:
+        result = subprocess.run(["gh", "auth", "token"], capture_output=True, text=True, timeout=10)
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return None
+    token = result.stdout.strip()
+    return token if result.returncode == 0 and token else None
+
+
+@functools.lru_cache(maxsize=None)
+def get_client():
+    """
+    Get the process-wide httpx client (created on first use).
+
+    Returns:
+        httpx.Client with the API base URL and auth headers set, following
+        redirects
+    """
+    import httpx
+
+    headers = {
+        "Accept": "application/vnd.github+json",
+        "X-GitHub-Api-Version": "2022-11-28",
+    }
+    token = get_api_token()
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    # Renamed or transferred repos answer with a 301 to the new location
+    return httpx.Client(
+        base_url=API_URL, headers=headers, timeout=API_TIMEOUT, follow_redirects=True
+    )
+
+
+def _get(url: str, params: Optional[dict] = None, headers: Optional[dict] = None):
+    """
+    GET an API URL, raising GitHubError on transport or HTTP errors.
+
+    Args:
+        url: Path relative to API_URL, or an absolute `next` page URL
+        params: Query parameters
+        headers: Extra request headers (e.g. a different Accept)
+
+    Returns:
+        httpx.Response with a 2xx (or 304 Not Modified) status
+    """
+    import httpx
+
+    try:
+        response = get_client().get(url, params=params, headers=headers)
+    except httpx.HTTPError as e:
+        raise GitHubError(f"GitHub API request failed: {e}")
+
+    if response.status_code >= 400:
+        try:
+            detail = response.json().get("message", "")
+        except ValueError:
+            detail = response.text
+        raise GitHubError(
+            f"GitHub API error {response.status_code}: {detail}",
+            suggestion="Set GITHUB_PAT or run `gh auth login` for private repos",
+        )
+    return response
+
+
+def _get_cached(url: str, max_age: int, accept: Optional[str] = None) -> str:
+    """
+    GET an API URL through the on-disk ETag cache.
+
+    Args:
+        url: Path relative to API_URL
+        max_age: Seconds a cached body is used without asking GitHub
+            (0 always revalidates)
+        accept: Accept header, if not the client default
+
+    Returns:
+        Response body text
+    """
+    # The token is part of the key: a body fetched with access to a private
+    # repo must not be served to a run with another (or no) token. Only the
+    # hash is stored, never the token itself.
+    key_input = f"{url}\0{accept or ''}\0{get_api_token() or ''}"
+    key = hashlib.sha256(key_input.encode("utf-8")).hexdigest()
+    cache_file = API_CACHE_DIR / f"{key}.json"
+    try:
+        entry = json.loads(cache_file.read_bytes())
+    except (OSError, ValueError):
+        entry = None
+
+    if entry is not None and time.time() - entry["ts"] < max_age:
+        return entry["body"]
+
+    headers = {"Accept": accept} if accept else {}
+    if entry is not None and entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    response = _get(url, headers=headers)
+
+    if response.status_code == 304:
+        body, etag = entry["body"], entry["etag"]
+    else:
+        body, etag = response.text, response.headers.get("ETag")
+
+    try:
+        API_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        atomic_write(cache_file, json.dumps({"etag": etag, "body": body, "ts": time.time()}))
+    except OSError:
+        pass
+    return body
+
+
+def _pages(url: str, params: Optional[dict] = None):
+    """Yield each page of a list endpoint, following the Link header."""
+    while url:
+        response = _get(url, params)
+        yield response.json()
+        url = response.links.get("next", {}).get("url")
+        params = None  # the next-page URL carries them
+
+
+def list_issues(
+    repo: str, state: str = "open", label: Optional[str] = None, limit: int = 10
+) -> list:
+    """
+    List issues in a repository (pull requests are left out).
+
+    Args:
+        repo: Repository in owner/repo form
+        state: open, closed, or all
+        label: Only issues with this label
+        limit: Maximum number of issues
+
+    Returns:
+        Issue objects as returned by the REST API, newest first
+    """
+    params = {"state": state, "per_page": min(max(limit, 1), MAX_PER_PAGE)}
+    if label:
+        params["labels"] = label
+
+    issues = []
+    for page in _pages(f"/repos/{repo}/issues", params):
+        # The issues endpoint also returns pull requests
+        issues.extend(item for item in page if "pull_request" not in item)
+        if len(issues) >= limit:
+            break
+    return issues[:limit]
+
+
+def get_issue(repo: str, number: int) -> dict:
+    """
+    Get a single issue.
+
+    Args:
+        repo: Repository in owner/repo form
+        number: Issue number
+
+    Returns:
+        Issue object as returned by the REST API
+    """
+    return _get(f"/repos/{repo}/issues/{number}").json()
+
+
+def list_issue_comments(repo: str, number: int) -> list:
+    """
+    List all comments on an issue or pull request (conversation comments).
+
+    Args:
+        repo: Repository in owner/repo form
+        number: Issue or PR number
+
+    Returns:
+        Comment objects, oldest first
+    """
+    comments = []
+    for page in _pages(f"/repos/{repo}/issues/{number}/comments", {"per_page": MAX_PER_PAGE}):
+        comments.extend(page)
+    return comments
+
+
+def get_pull(repo: str, number: int, max_age: int = PR_CACHE_TTL) -> dict:
+    """
+    Get a single pull request (ETag-cached).
+
+    Args:
+        repo: Repository in owner/repo form
+        number: PR number
+        max_age: Seconds a cached copy is used without revalidating
+
+    Returns:
+        Pull request object as returned by the REST API
+    """
+    return json.loads(_get_cached(f"/repos/{repo}/pulls/{number}", max_age))
+
+
+def get_pull_diff(repo: str, number: int, max_age: int = PR_CACHE_TTL) -> str:
+    """
+    Get a pull request's unified diff (ETag-cached).
+
+    Args:
+        repo: Repository in owner/repo form
+        number: PR number
+        max_age: Seconds a cached copy is used without revalidating
+
+    Returns:
+        Diff text
+    """
+    return _get_cached(
+        f"/repos/{repo}/pulls/{number}", max_age, accept="application/vnd.github.diff"
+    )
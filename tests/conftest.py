@@ -0,0 +1,20 @@
+"""Shared fixtures."""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+BIN_DIR = Path(__file__).resolve().parent.parent / "bin"
+
+
+@pytest.fixture(scope="session")
+def agent_cli():
+    """bin/agent-cli.py loaded as the `agent_cli` module (its name is not importable)."""
+    spec = importlib.util.spec_from_file_location("agent_cli", BIN_DIR / "agent-cli.py")
+    module = importlib.util.module_from_spec(spec)
+    # Registered first: the script aliases itself as agent_cli for bin/commands/
+    sys.modules["agent_cli"] = module
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,343 @@
+"""Tests for bin/agent-cli.py, its lazy commands and the matching clawcrew.core helpers."""
+
+import contextlib
+import json
+from datetime import datetime, timedelta
+
+import pytest
+import typer
+
+from clawcrew.core import llm, memory
+
+# =============================================================================
+# `run` argv shortcut
+# =============================================================================
+
+
+def typer_run_params(agent_cli, args):
+    """Parameters Typer itself would pass to run() for these arguments."""
+    group = typer.main.get_command(agent_cli.app)
+    command = group.get_command(None, "run")
+    return command.make_context("run", list(args)).params
+
+
+@pytest.mark.parametrize("args", [
+    ["-a", "code", "-t", "Implement auth"],
+    ["--agent", "code", "--task", "Implement auth"],
+    ["-t", "Implement auth", "-a", "code"],
+    ["-a", "code", "-t", "Implement", "-c", "design.md", "-o", "auth.py"],
+    ["-a", "code", "-t", "x", "--context", "design.md", "--output", "auth.py"],
+    ["-a", "code", "-t", "first", "-t", "second"],
+    ["-a", "code", "-t", "-v"],
+    ["-a", "code", "-t", ""],
+])
+def test_run_fast_matches_typer(agent_cli, args):
+    assert agent_cli._parse_run_fast(args) == typer_run_params(agent_cli, args)
+
+
+@pytest.mark.parametrize("args", [
+    [],
+    ["-a", "code"],
+    ["-t", "Implement auth"],
+    ["-a", "code", "-t", "x", "-v"],
+    ["-a", "code", "-t", "x", "--no-memory", "--verbose"],
+    ["-a", "code", "-t", "x", "-m", "other/model"],
+    ["-a", "code", "-t", "x", "--task-id", "t-1"],
+    ["--agent=code", "-t", "x"],
+    ["code", "-t", "x", "-a"],
+])
+def test_run_fast_falls_back_to_typer(agent_cli, args):
+    assert agent_cli._parse_run_fast(args) is None
+
+
+# =============================================================================
+# Top-level --help fast path
+# =============================================================================
+
+
+def test_usage_lists_every_command(agent_cli):
+    commands = agent_cli._USAGE.split("\nCommands:\n", 1)[1].split("\n\n", 1)[0]
+    listed = [line.split()[0] for line in commands.splitlines() if not line.startswith("   ")]
+    registered = [
+        command.name or typer.main.get_command_name(command.callback.__name__)
+        for command in agent_cli.app.registered_commands
+    ]
+    assert listed == registered + list(agent_cli.LAZY_COMMANDS)
+
+
+# =============================================================================
+# Pipeline plans
+# =============================================================================
+
+
+def write_plan(tmp_path, plan):
+    path = tmp_path / "plan.json"
+    path.write_text(json.dumps(plan), encoding="utf-8")
+    return path
+
+
+def step(name, deps=None, **extra):
+    data = {"name": name, "agent": "code", "task": f"do {name}", **extra}
+    if deps is not None:
+        data["deps"] = deps
+    return data
+
+
+def test_load_plan_orders_steps_after_their_deps(agent_cli, tmp_path):
+    plan = {"steps": [
+        step("tests", ["api", "impl"]),
+        step("impl", ["api"]),
+        step("api"),
+    ]}
+    ordered = agent_cli._load_plan(write_plan(tmp_path, plan))
+    assert [s["name"] for s in ordered] == ["api", "impl", "tests"]
+    assert ordered[0]["deps"] == []
+
+
+def test_load_plan_accepts_a_bare_list(agent_cli, tmp_path):
+    ordered = agent_cli._load_plan(write_plan(tmp_path, [step("a"), step("b", ["a"])]))
+    assert [s["name"] for s in ordered] == ["a", "b"]
+
+
+@pytest.mark.parametrize("plan, message", [
+    ({"steps": [step("a", ["b"]), step("b", ["a"])]}, "cycle"),
+    ({"steps": [step("a", ["a"])]}, "cycle"),
+    ({"steps": [step("a", ["missing"])]}, "unknown step 'missing'"),
+    ({"steps": [step("a"), step("a")]}, "duplicate step name"),
+    ({"steps": [{"name": "a", "agent": "code"}]}, "needs 'name', 'agent' and 'task'"),
+    ({"steps": ["a"]}, "needs 'name', 'agent' and 'task'"),
+    ({"steps": []}, "non-empty list of steps"),
+    ({"stages": [step("a")]}, "non-empty list of steps"),
+    ({"steps": [step("a", None), step("b", "a")]}, "'deps' must be a list"),
+    ({"steps": [step("a", [1])]}, "'deps' must be a list"),
+    ({"steps": [{**step("a"), "deps": None}]}, "'deps' must be a list"),
+])
+def test_load_plan_rejects_bad_plans(agent_cli, tmp_path, plan, message):
+    with pytest.raises(ValueError, match=message):
+        agent_cli._load_plan(write_plan(tmp_path, plan))
+
+
+# =============================================================================
+# LESSON markers (same helpers in agent-cli and the package)
+# =============================================================================
+
+
+@pytest.fixture(params=["agent_cli", "core.llm"])
+def lesson_helpers(request, agent_cli):
+    module = agent_cli if request.param == "agent_cli" else llm
+    return module.extract_lesson, module.strip_lesson
+
+
+RESPONSE = """Intro
+---OUTPUT---
+the deliverable
+---END OUTPUT---
+---LESSON---
+Keep handlers small.
+---END LESSON---"""
+
+
+def test_lesson_is_extracted_and_stripped(lesson_helpers):
+    extract_lesson, strip_lesson = lesson_helpers
+    assert extract_lesson(RESPONSE) == "Keep handlers small."
+    stripped = strip_lesson(RESPONSE)
+    assert "LESSON" not in stripped
+    assert llm.extract_output(stripped) == "the deliverable"
+
+
+def test_lesson_is_capped_at_100_chars(lesson_helpers):
+    extract_lesson, _ = lesson_helpers
+    assert extract_lesson(f"---LESSON---\n{'x' * 150}\n---END LESSON---") == "x" * 100
+
+
+@pytest.mark.parametrize("response", [
+    "no markers at all",
+    "---LESSON---\nnever closed",
+    "---END LESSON--- before ---LESSON---",
+    "---LESSON---\n   \n---END LESSON---",
+])
+def test_missing_or_empty_lesson_is_none(lesson_helpers, response):
+    extract_lesson, _ = lesson_helpers
+    assert extract_lesson(response) is None
+
+
+@pytest.mark.parametrize("response", [
+    "no markers at all",
+    "---LESSON---\nnever closed",
+    "---END LESSON--- before ---LESSON---",
+])
+def test_strip_leaves_responses_without_a_block_alone(lesson_helpers, response):
+    _, strip_lesson = lesson_helpers
+    assert strip_lesson(response) == response
+
+
+# =============================================================================
+# Memory files (same format in agent-cli and the package)
+# =============================================================================
+
+NOW = datetime(2026, 3, 14, 9, 30, 5)
+
+
+@pytest.fixture(params=["agent_cli", "core.memory"])
+def memory_api(request, agent_cli):
+    """(save_memory, load_memory, read_memory_records, render_memory_as_markdown)."""
+    if request.param == "agent_cli":
+        return (agent_cli.save_memory, agent_cli.load_memory,
+                agent_cli._read_memory_records, agent_cli.render_memory_as_markdown)
+    return (memory.save_memory, memory.load_memory,
+            memory.read_memory_records, memory.render_memory_as_markdown)
+
+
+def write_day(tmp_path, day, suffix, text):
+    memory_dir = tmp_path / "memory"
+    memory_dir.mkdir(exist_ok=True)
+    (memory_dir / f"{day.isoformat()}{suffix}").write_text(text, encoding="utf-8")
+
+
+def test_saved_memories_are_read_back(memory_api, tmp_path):
+    save, load, read_records, render = memory_api
+    save(tmp_path, "t-1", "Implement auth", "auth.py", "Keep handlers small.", now=NOW)
+    save(tmp_path, "t-2", "Write tests ✓", None, "Use fixtures.", now=NOW)
+
+    records = read_records(str(tmp_path / "memory" / "2026-03-14.jsonl"))
+    assert records == [
+        {"ts": "09:30:05", "task_id": "t-1", "task": "Implement auth",
+         "output": "auth.py", "lesson": "Keep handlers small."},
+        {"ts": "09:30:05", "task_id": "t-2", "task": "Write tests ✓",
+         "output": None, "lesson": "Use fixtures."},
+    ]
+    assert load(tmp_path, now=NOW) == f"## 2026-03-14\n{render(records).strip()}"
+
+
+def test_long_tasks_are_truncated(memory_api, tmp_path):
+    save, _, read_records, _ = memory_api
+    save(tmp_path, "t-1", "x" * 300, None, "lesson", now=NOW)
+    (record,) = read_records(str(tmp_path / "memory" / "2026-03-14.jsonl"))
+    assert record["task"] == "x" * 200
+
+
+def test_malformed_records_are_skipped(memory_api, tmp_path):
+    _, _, read_records, _ = memory_api
+    write_day(tmp_path, NOW.date(), ".jsonl", '{"task_id": "t-1"}\n\nnot json\n{"task_id": "t-2"}')
+    records = read_records(str(tmp_path / "memory" / "2026-03-14.jsonl"))
+    assert records == [{"task_id": "t-1"}, {"task_id": "t-2"}]
+
+
+def test_render_uses_the_legacy_markdown_layout(memory_api):
+    *_, render = memory_api
+    rendered = render([{"ts": "09:30:05", "task_id": "t-1", "task": "Implement auth",
+                        "output": None, "lesson": "Keep handlers small."}])
+    assert rendered == (
+        "\n### 09:30:05 - t-1\n\n**Task:** Implement auth\n\n**Output:** stdout\n\n"
+        "**Lesson:** Keep handlers small.\n\n---\n"
+    )
+
+
+def test_mixed_md_and_jsonl_days(memory_api, tmp_path):
+    save, load, _, render = memory_api
+    yesterday = NOW.date() - timedelta(days=1)
+    write_day(tmp_path, yesterday, ".md", "### legacy entry\n")
+    write_day(tmp_path, NOW.date(), ".md", "### written before the switch\n")
+    save(tmp_path, "t-1", "Implement auth", None, "Keep handlers small.", now=NOW)
+
+    rendered = render([{"ts": "09:30:05", "task_id": "t-1", "task": "Implement auth",
+                        "output": None, "lesson": "Keep handlers small."}])
+    assert load(tmp_path, now=NOW) == (
+        f"## 2026-03-14\n### written before the switch\n{rendered}".strip()
+        + "\n\n## 2026-03-13\n### legacy entry"
+    )
+
+
+def test_only_days_in_the_window_are_loaded(memory_api, tmp_path):
+    _, load, _, _ = memory_api
+    for offset in (-1, 0, 2, 3):
+        day = NOW.date() - timedelta(days=offset)
+        write_day(tmp_path, day, ".md", f"entry from {day.isoformat()}")
+    write_day(tmp_path, NOW.date(), ".txt", "not a memory file")
+    (tmp_path / "memory" / "notes.md").write_text("not a day file", encoding="utf-8")
+
+    loaded = load(tmp_path, days=3, now=NOW)
+    assert loaded == (
+        "## 2026-03-14\nentry from 2026-03-14\n\n## 2026-03-12\nentry from 2026-03-12"
+    )
+
+
+def test_missing_memory_dir_loads_nothing(memory_api, tmp_path):
+    _, load, _, _ = memory_api
+    assert load(tmp_path, now=NOW) == ""
+
+
+# =============================================================================
+# summarize-repo clone cleanup
+# =============================================================================
+
+
+@pytest.fixture
+def summarize(agent_cli, tmp_path, monkeypatch):
+    """summarize_repo() against a fake clone, recording removed directories."""
+    from commands import summarize_repo as module
+
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    removed = []
+
+    def fake_clone(clone_url, dest, branch, token, full_history=False):
+        dest.mkdir(parents=True)
+        (dest / "README.md").write_text("# repo\n", encoding="utf-8")
+        return True
+
+    @contextlib.contextmanager
+    def fake_cached_clone(owner, repo, clone_url, branch, token):
+        fake_clone(clone_url, tmp_path / "cache" / owner / repo, branch, token)
+        yield tmp_path / "cache" / owner / repo
+
+    monkeypatch.setattr(module, "make_clone_temp_dir", lambda: tmp_path / "clone")
+    monkeypatch.setattr(module, "clone_repository", fake_clone)
+    monkeypatch.setattr(module, "get_cached_clone", fake_cached_clone)
+    monkeypatch.setattr(module, "get_head_sha", lambda repo_path: "c0ffee")
+    monkeypatch.setattr(module, "remove_tree_in_background", removed.append)
+    monkeypatch.setattr(
+        module, "call_llm", lambda *args, **kwargs: "---OUTPUT---\nsummary\n---END OUTPUT---"
+    )
+
+    def run(**options):
+        params = dict(
+            url="https://github.com/user/repo", path=None, branch=None, pat=None,
+            output=str(tmp_path / "summary.md"), task_id=None, keep_clone=False,
+            no_cache=True, full_clone=False, force=False, verbose=False,
+        )
+        module.summarize_repo(**{**params, **options})
+        return removed
+
+    return run
+
+
+def test_throwaway_clone_is_removed(summarize, tmp_path):
+    assert summarize() == [tmp_path / "clone"]
+
+
+@pytest.mark.parametrize("options", [{"keep_clone": True}, {"task_id": "t-1"}])
+def test_clone_is_kept_when_asked(summarize, tmp_path, options):
+    assert summarize(**options) == []
+    task_dir = artifact_dir(tmp_path)
+    assert task_dir.name == options.get("task_id", task_dir.name)
+    assert (task_dir / "repo" / "README.md").exists()
+
+
+def artifact_dir(tmp_path):
+    (task_dir,) = (tmp_path / "home" / ".openclaw" / "artifacts").iterdir()
+    return task_dir
+
+
+def test_cached_clone_is_recorded_not_copied(summarize, tmp_path):
+    assert summarize(no_cache=False) == []
+    task_dir = artifact_dir(tmp_path)
+    assert not (task_dir / "repo").exists()
+    record = (task_dir / "repo.txt").read_text(encoding="utf-8")
+    assert record == f"cache: {tmp_path / 'cache' / 'user' / 'repo'}\nhead: c0ffee\n"
+
+
+def test_cached_clone_is_copied_when_asked(summarize, tmp_path):
+    summarize(no_cache=False, keep_clone=True)
+    task_dir = artifact_dir(tmp_path)
+    assert (task_dir / "repo" / "README.md").exists()
+    assert not (task_dir / "repo.txt").exists()
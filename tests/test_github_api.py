@@ -0,0 +1,87 @@
+"""Tests for the ETag cache in clawcrew.utils.github_api."""
+
+import json
+
+import httpx
+import pytest
+
+from clawcrew.utils import github_api
+
+URL = "/repos/user/repo/pulls/1"
+
+
+@pytest.fixture
+def api(tmp_path, monkeypatch):
+    """Route API calls to queued fake responses, recording each request."""
+    requests, responses = [], []
+
+    def handler(request):
+        requests.append(request)
+        return responses.pop(0)
+
+    client = httpx.Client(base_url=github_api.API_URL, transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(github_api, "get_client", lambda: client)
+    monkeypatch.setattr(github_api, "get_api_token", lambda: "token-a")
+    monkeypatch.setattr(github_api, "API_CACHE_DIR", tmp_path)
+    yield requests, responses
+    client.close()
+
+
+def ok(body, etag):
+    return httpx.Response(200, text=body, headers={"ETag": etag})
+
+
+def cache_files(tmp_path):
+    return sorted(tmp_path.glob("*.json"))
+
+
+def test_fresh_entry_skips_the_request(api):
+    requests, responses = api
+    responses.append(ok('{"n": 1}', '"v1"'))
+    assert github_api._get_cached(URL, max_age=60) == '{"n": 1}'
+    assert github_api._get_cached(URL, max_age=60) == '{"n": 1}'
+    assert len(requests) == 1
+
+
+def test_not_modified_reuses_the_stored_body(api):
+    requests, responses = api
+    responses.extend([ok('{"n": 1}', '"v1"'), httpx.Response(304)])
+    github_api._get_cached(URL, max_age=0)
+    assert github_api._get_cached(URL, max_age=0) == '{"n": 1}'
+    assert "If-None-Match" not in requests[0].headers
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+
+
+def test_changed_response_replaces_the_entry(api, tmp_path):
+    requests, responses = api
+    responses.extend([ok('{"n": 1}', '"v1"'), ok('{"n": 2}', '"v2"'), httpx.Response(304)])
+    github_api._get_cached(URL, max_age=0)
+    assert github_api._get_cached(URL, max_age=0) == '{"n": 2}'
+    assert github_api._get_cached(URL, max_age=0) == '{"n": 2}'
+    assert requests[2].headers["If-None-Match"] == '"v2"'
+    (cache_file,) = cache_files(tmp_path)
+    assert json.loads(cache_file.read_bytes())["etag"] == '"v2"'
+
+
+def test_corrupt_entry_is_refetched(api, tmp_path):
+    requests, responses = api
+    responses.extend([ok('{"n": 1}', '"v1"'), ok('{"n": 1}', '"v1"')])
+    github_api._get_cached(URL, max_age=60)
+    (cache_file,) = cache_files(tmp_path)
+    cache_file.write_bytes(b'{"etag": "\\"v1\\"", "bo')
+
+    assert github_api._get_cached(URL, max_age=60) == '{"n": 1}'
+    assert "If-None-Match" not in requests[1].headers
+    assert json.loads(cache_file.read_bytes())["body"] == '{"n": 1}'
+
+
+def test_entries_are_not_shared_between_tokens(api, tmp_path, monkeypatch):
+    requests, responses = api
+    responses.extend([ok('{"private": true}', '"v1"'), ok('{"message": "Not Found"}', '"v2"')])
+    github_api._get_cached(URL, max_age=60)
+    monkeypatch.setattr(github_api, "get_api_token", lambda: None)
+
+    assert github_api._get_cached(URL, max_age=60) == '{"message": "Not Found"}'
+    assert len(requests) == 2
+    assert len(cache_files(tmp_path)) == 2
+    assert not any(b"token-a" in path.read_bytes() for path in cache_files(tmp_path))
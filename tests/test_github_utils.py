@@ -0,0 +1,52 @@
+"""Tests for the persistent repo cache in bin/github_utils.py."""
+
+import os
+
+import github_utils
+import pytest
+
+
+@pytest.fixture
+def repo_cache(tmp_path, monkeypatch):
+    """An empty repo cache that is always over its size limit."""
+    monkeypatch.setattr(github_utils, "REPO_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(github_utils, "REPO_CACHE_MAX_BYTES", 0)
+
+    def add(name, mtime, size=None):
+        clone = tmp_path / "owner" / name
+        clone.mkdir(parents=True)
+        (clone / "README.md").write_text("# repo\n", encoding="utf-8")
+        os.utime(clone, (mtime, mtime))
+        if size is not None:
+            github_utils._clone_size_path(clone).write_text(str(size), encoding="utf-8")
+        return clone
+
+    return add
+
+
+@pytest.mark.skipif(github_utils.fcntl is None, reason="needs flock")
+def test_eviction_skips_locked_entries(repo_cache):
+    old, locked, current = repo_cache("old", 1), repo_cache("locked", 2), repo_cache("current", 3)
+    with github_utils._cache_entry_lock(locked) as held:
+        assert held
+        github_utils._evict_repo_cache(keep=current)
+    assert not old.exists()
+    assert locked.exists()
+    assert current.exists()
+
+
+def test_eviction_sums_recorded_sizes(repo_cache, monkeypatch):
+    monkeypatch.setattr(github_utils, "REPO_CACHE_MAX_BYTES", 1000)
+    old, newer = repo_cache("old", 1, size=600), repo_cache("newer", 2, size=500)
+    current = repo_cache("current", 3, size=400)
+    github_utils._evict_repo_cache(keep=current)
+    assert not old.exists()
+    assert not github_utils._clone_size_path(old).exists()
+    assert newer.exists()
+
+
+def test_missing_size_is_measured_and_recorded(repo_cache, monkeypatch):
+    monkeypatch.setattr(github_utils, "REPO_CACHE_MAX_BYTES", 1000)
+    current = repo_cache("current", 1)
+    github_utils._evict_repo_cache(keep=current)
+    assert github_utils._clone_size_path(current).read_text(encoding="utf-8") == "7"